@@ -1,11 +1,16 @@
+import asyncio
 import os
+import threading
 import uuid
-from typing import Any, Dict, List, Optional, Tuple
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from langchain.agents.agent import RunnableAgent
 from langchain.agents.tools import tool as LangChainTool
 from langchain.tools.render import render_text_description
 from langchain_core.agents import AgentAction
+from langchain_core.caches import BaseCache
 from langchain_core.callbacks import BaseCallbackHandler
 from langchain_openai import ChatOpenAI
 from pydantic import (
@@ -20,11 +25,31 @@ from pydantic import (
 )
 from pydantic_core import PydanticCustomError
 
-from crewai.agents import CacheHandler, CrewAgentExecutor, CrewAgentParser, ToolsHandler
+from crewai.agents import (
+    CacheHandler,
+    CrewAgentExecutor,
+    CrewAgentParser,
+    CrewAgentToolCallParser,
+    Scratchpad,
+    ToolsHandler,
+)
 from crewai.memory.contextual.contextual_memory import ContextualMemory
-from crewai.utilities import I18N, Logger, Prompts, RPMController
+from crewai.utilities import (
+    I18N,
+    CrewEventHandler,
+    LLMCallPolicy,
+    Logger,
+    Prompts,
+    RPMController,
+)
+from crewai.utilities.llm_cache import LLMSQLiteCache
+from crewai.utilities.rpm_controller import RPMControllerHandler
+from crewai.utilities.token_budget import count_tokens, keep_last_tokens
 from crewai.utilities.token_counter_callback import TokenCalcHandler, TokenProcess
 
+# Number of agent executors each agent keeps, for the different tool sets it uses.
+MAX_CACHED_AGENT_EXECUTORS = 8
+
 
 class Agent(BaseModel):
     """Represents an agent in a system.
@@ -43,18 +68,31 @@ class Agent(BaseModel):
             max_iter: Maximum number of iterations for an agent to execute a task.
             memory: Whether the agent should have memory or not.
             max_rpm: Maximum number of requests per minute for the agent execution to be respected.
+            max_tpm: Maximum number of tokens per minute for the agent execution to be respected.
             verbose: Whether the agent execution should be in verbose mode.
             allow_delegation: Whether the agent is allowed to delegate tasks to other agents.
             tools: Tools at agents disposal
             step_callback: Callback to be executed after each step of the agent execution.
             callbacks: A list of callback functions from the langchain library that are triggered during the agent's execution process
+            stream_steps: Whether the agent streams the LLM output of each step, stopping it as soon as it holds a complete action. Ignored when llm_cache is set.
+            llm_cache: Whether the responses of the agent's LLMs should be cached on disk, or the cache to use for them.
+            max_prompt_tokens: Maximum number of tokens of the prompts sent to the LLM, the context and the scratchpad are compacted to fit in it.
+            llm_call_policy: Deadline, retries and hedging for the calls to the agent's LLMs.
+            native_tool_calling: Whether the agent calls its tools through the native tool calling API of its LLM, rather than writing them out.
+            parallel_tool_calls: Whether the agent is told it can take several independent actions at once, which run concurrently.
+            tool_timeout: Seconds a tool can run before it is stopped and the agent moves on.
+            tool_timeouts: Seconds each tool can run before it is stopped, by tool name, overriding tool_timeout.
     """
 
     __hash__ = object.__hash__  # type: ignore
     _logger: Logger = PrivateAttr()
     _rpm_controller: RPMController = PrivateAttr(default=None)
     _request_within_rpm_limit: Any = PrivateAttr(default=None)
-    _token_process: TokenProcess = TokenProcess()
+    _agent_executors: "OrderedDict[Tuple, CrewAgentExecutor]" = PrivateAttr(
+        default_factory=OrderedDict
+    )
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _token_process: TokenProcess = PrivateAttr(default_factory=TokenProcess)
 
     formatting_errors: int = 0
     model_config = ConfigDict(arbitrary_types_allowed=True)
@@ -78,6 +116,10 @@ class Agent(BaseModel):
         default=None,
         description="Maximum number of requests per minute for the agent execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens per minute for the agent execution to be respected.",
+    )
     verbose: bool = Field(
         default=False, description="Verbose mode for the Agent Execution"
     )
@@ -130,6 +172,38 @@ class Agent(BaseModel):
     response_template: Optional[str] = Field(
         default=None, description="Response format for the agent."
     )
+    stream_steps: bool = Field(
+        default=False,
+        description="Whether the agent streams the LLM output of each step, stopping it as soon as it holds a complete action. Ignored when llm_cache is set.",
+    )
+    llm_cache: Union[bool, InstanceOf[BaseCache]] = Field(
+        default=False,
+        description="Whether the responses of the agent's LLMs should be cached on disk, or the cache to use for them.",
+    )
+    max_prompt_tokens: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens of the prompts sent to the LLM, the context and the scratchpad are compacted to fit in it.",
+    )
+    llm_call_policy: Optional[InstanceOf[LLMCallPolicy]] = Field(
+        default=None,
+        description="Deadline, retries and hedging for the calls to the agent's LLMs.",
+    )
+    native_tool_calling: bool = Field(
+        default=False,
+        description="Whether the agent calls its tools through the native tool calling API of its LLM, rather than writing them out.",
+    )
+    parallel_tool_calls: bool = Field(
+        default=False,
+        description="Whether the agent is told it can take several independent actions at once, which run concurrently.",
+    )
+    tool_timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds a tool can run before it is stopped and the agent moves on.",
+    )
+    tool_timeouts: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Seconds each tool can run before it is stopped, by tool name, overriding tool_timeout.",
+    )
 
     _original_role: str | None = None
     _original_goal: str | None = None
@@ -147,6 +221,11 @@ class Agent(BaseModel):
                 "may_not_set_field", "This field is not to be set by the user.", {}
             )
 
+    @field_validator("llm_cache")
+    @classmethod
+    def _create_llm_cache(cls, v: Union[bool, BaseCache]) -> Union[bool, BaseCache]:
+        return LLMSQLiteCache() if v is True else v
+
     @model_validator(mode="after")
     def set_attributes_based_on_config(self) -> "Agent":
         """Set attributes based on the agent configuration."""
@@ -159,9 +238,9 @@ class Agent(BaseModel):
     def set_private_attrs(self):
         """Set private attributes."""
         self._logger = Logger(self.verbose)
-        if self.max_rpm and not self._rpm_controller:
+        if (self.max_rpm or self.max_tpm) and not self._rpm_controller:
             self._rpm_controller = RPMController(
-                max_rpm=self.max_rpm, logger=self._logger
+                max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
             )
         return self
 
@@ -203,16 +282,76 @@ class Agent(BaseModel):
         Returns:
             Output of the agent
         """
-        if self.tools_handler:
-            self.tools_handler.last_used_tool = {}
+        result = self._cached_task_result(task, context)
+        if result is None:
+            agent_executor = self._prepare_agent_executor(task, tools)
+            task_prompt = self._task_prompt(task, context, agent_executor)
+
+            result = agent_executor.invoke(
+                {
+                    "input": task_prompt,
+                    "tool_names": agent_executor.tools_names,
+                    "tools": agent_executor.tools_description,
+                },
+                config={"callbacks": self._execution_callbacks(task)},
+            )["output"]
+            if self.tools_handler:
+                self.tools_handler.last_used_tool = (
+                    agent_executor.tools_handler.last_used_tool
+                )
+            self._cache_task_result(task, context, result)
 
-        task_prompt = task.prompt()
+        return result
 
-        if context:
-            task_prompt = self.i18n.slice("task_with_context").format(
-                task=task_prompt, context=context
+    async def execute_task_async(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        """Execute a task with the agent without blocking the event loop.
+
+        Args:
+            task: Task to execute.
+            context: Context to execute the task in.
+            tools: Tools to use for the task.
+
+        Returns:
+            Output of the agent
+        """
+        result = await asyncio.to_thread(self._cached_task_result, task, context)
+        if result is None:
+            agent_executor = self._prepare_agent_executor(task, tools)
+            task_prompt = await asyncio.to_thread(
+                self._task_prompt, task, context, agent_executor
             )
 
+            result = (
+                await agent_executor.ainvoke(
+                    {
+                        "input": task_prompt,
+                        "tool_names": agent_executor.tools_names,
+                        "tools": agent_executor.tools_description,
+                    },
+                    config={"callbacks": self._execution_callbacks(task)},
+                )
+            )["output"]
+            if self.tools_handler:
+                self.tools_handler.last_used_tool = (
+                    agent_executor.tools_handler.last_used_tool
+                )
+            await asyncio.to_thread(self._cache_task_result, task, context, result)
+
+        return result
+
+    def _task_prompt(
+        self,
+        task: Any,
+        context: Optional[str] = None,
+        agent_executor: Optional[CrewAgentExecutor] = None,
+    ) -> str:
+        """Build the prompt for the task, including its context and memory."""
+        memory_prompt = ""
         if self.crew and self.crew.memory:
             contextual_memory = ContextualMemory(
                 self.crew._short_term_memory,
@@ -221,30 +360,106 @@ class Agent(BaseModel):
             )
             memory = contextual_memory.build_context_for_task(task, context)
             if memory.strip() != "":
-                task_prompt += self.i18n.slice("memory").format(memory=memory)
+                memory_prompt = self.i18n.slice("memory").format(memory=memory)
 
-        tools = tools or self.tools
-        parsed_tools = self._parse_tools(tools)
+        if context and agent_executor and self.max_prompt_tokens:
+            context = self._trim_context(task, context, memory_prompt, agent_executor)
 
-        self.create_agent_executor(tools=tools)
-        self.agent_executor.tools = parsed_tools
-        self.agent_executor.task = task
+        return self._task_with_context(task, context) + memory_prompt
 
-        self.agent_executor.tools_description = render_text_description(parsed_tools)
-        self.agent_executor.tools_names = self.__tools_names(parsed_tools)
+    def _trim_context(
+        self,
+        task: Any,
+        context: str,
+        memory_prompt: str,
+        agent_executor: CrewAgentExecutor,
+    ) -> str:
+        """Keep the end of the context, so the prompt of the task takes at most half
+        of the prompt budget and leaves the rest to the scratchpad."""
+        excess = agent_executor.prompt_tokens(
+            self._task_with_context(task, context) + memory_prompt
+        ) - (self.max_prompt_tokens // 2)
+        if excess <= 0:
+            return context
+
+        marker = self.i18n.slice("trimmed_context")
+        return marker + keep_last_tokens(
+            context, count_tokens(context) - excess - count_tokens(marker)
+        )
 
-        result = self.agent_executor.invoke(
-            {
-                "input": task_prompt,
-                "tool_names": self.agent_executor.tools_names,
-                "tools": self.agent_executor.tools_description,
-            }
-        )["output"]
+    def _execution_callbacks(self, task: Any) -> Optional[List[BaseCallbackHandler]]:
+        """Returns the callbacks for the LLM calls of the execution.
+
+        They stream the tokens to the crew when its events are consumed, and charge
+        them to the tokens per minute budget when there is one.
+        """
+        callbacks: List[BaseCallbackHandler] = []
+        if self.crew and self.crew._event_sink:
+            callbacks.append(CrewEventHandler(crew=self.crew, agent=self, task=task))
+        if self._rpm_controller and self._rpm_controller.max_tpm:
+            callbacks.append(
+                RPMControllerHandler(self._rpm_controller, model=self._model_name())
+            )
+        return callbacks or None
 
-        if self.max_rpm:
-            self._rpm_controller.stop_rpm_counter()
+    def _task_with_context(self, task: Any, context: Optional[str] = None) -> str:
+        """Build the prompt for the task, including its context."""
+        task_prompt = task.prompt()
 
-        return result
+        if context:
+            task_prompt = self.i18n.slice("task_with_context").format(
+                task=task_prompt, context=context
+            )
+        return task_prompt
+
+    def _cached_task_result(
+        self, task: Any, context: Optional[str] = None
+    ) -> Optional[str]:
+        """Returns the result of a similar task from the crew's semantic cache."""
+        if not (self.crew and self.crew._semantic_cache):
+            return None
+
+        return self.crew._semantic_cache.lookup(
+            self._task_with_context(task, context), self.role, self._model_name()
+        )
+
+    def _cache_task_result(
+        self, task: Any, context: Optional[str], result: str
+    ) -> None:
+        """Save the result of the task in the crew's semantic cache."""
+        if self.crew and self.crew._semantic_cache:
+            self.crew._semantic_cache.save(
+                self._task_with_context(task, context),
+                self.role,
+                self._model_name(),
+                result,
+            )
+
+    def _model_name(self) -> str:
+        return getattr(self.llm, "model_name", None) or type(self.llm).__name__
+
+    def _prepare_agent_executor(
+        self, task: Any, tools: Optional[List[Any]] = None
+    ) -> CrewAgentExecutor:
+        """Returns an agent executor for a single execution of the task.
+
+        Each execution gets its own copy of the cached executor, with its own tools
+        handler, so the agent can execute several tasks at the same time. The copy is
+        not assigned to `agent_executor`, which concurrent executions would overwrite.
+        """
+        cached_agent_executor = self._cached_agent_executor(tools or self.tools)
+        return CrewAgentExecutor.construct(
+            **{
+                **cached_agent_executor.__dict__,
+                "task": task,
+                "tools_handler": ToolsHandler(
+                    cache=self.tools_handler.cache if self.tools_handler else None
+                ),
+                "iterations": 0,
+                "have_forced_answer": False,
+                "should_ask_for_human_input": False,
+            }
+        )
 
     def set_cache_handler(self, cache_handler: CacheHandler) -> None:
         """Set the cache handler for the agent.
@@ -252,7 +467,8 @@ class Agent(BaseModel):
         Args:
             cache_handler: An instance of the CacheHandler class.
         """
-        self.tools_handler = ToolsHandler()
+        if not self.tools_handler:
+            self.tools_handler = ToolsHandler()
         if self.cache:
             self.cache_handler = cache_handler
             self.tools_handler.cache = cache_handler
@@ -271,18 +487,85 @@ class Agent(BaseModel):
     def create_agent_executor(self, tools=None) -> None:
         """Create an agent executor for the agent.
 
+        Executors are cached, so one is only built again when the tools, the LLMs or any
+        other setting it is built from changes. It is only called while setting the agent
+        up, each execution then works on its own copy of the cached executor.
+
         Returns:
             An instance of the CrewAgentExecutor class.
         """
-        tools = tools or self.tools
+        self.agent_executor = self._cached_agent_executor(tools or self.tools)
+
+    def _cached_agent_executor(self, tools: List[Any]) -> CrewAgentExecutor:
+        """Returns the cached agent executor for the tools, building it if needed."""
+        key = self._agent_executor_key(tools)
+        with self._lock:
+            agent_executor = self._agent_executors.get(key)
+            if agent_executor is None:
+                agent_executor = self._build_agent_executor(tools)
+                self._agent_executors[key] = agent_executor
+                if len(self._agent_executors) > MAX_CACHED_AGENT_EXECUTORS:
+                    self._agent_executors.popitem(last=False)
+            else:
+                self._agent_executors.move_to_end(key)
+        return agent_executor
+
+    def _set_llm_cache(self) -> None:
+        """Set the response cache on the agent's LLMs, if the agent caches them."""
+        if not self.llm_cache:
+            return
+
+        if self.llm_cache is True:
+            self.llm_cache = LLMSQLiteCache()
+
+        for llm in [self.llm, self.function_calling_llm]:
+            if hasattr(llm, "cache"):
+                llm.cache = self.llm_cache
+
+    def _agent_executor_key(self, tools: List[Any]) -> Tuple:
+        """Returns what the agent executor is built from.
+
+        Objects are compared by identity, the executor keeps them alive while cached.
+        """
+        return (
+            tuple(id(tool) for tool in tools),
+            id(self.llm),
+            id(self.function_calling_llm),
+            id(self.llm_cache),
+            id(self.llm_call_policy),
+            id(self.i18n),
+            id(self.crew),
+            id(self.tools_handler),
+            id(self._rpm_controller),
+            id(self.step_callback),
+            tuple(id(callback) for callback in self.callbacks or []),
+            self.role,
+            self.goal,
+            self.backstory,
+            self.verbose,
+            self.stream_steps,
+            self.native_tool_calling,
+            self.parallel_tool_calls,
+            self.tool_timeout,
+            tuple(sorted((self.tool_timeouts or {}).items())),
+            self.max_prompt_tokens,
+            self.max_iter,
+            self.max_execution_time,
+            self.system_template,
+            self.prompt_template,
+            self.response_template,
+        )
+
+    def _build_agent_executor(self, tools: List[Any]) -> CrewAgentExecutor:
+        """Build a new agent executor with the given tools."""
+        self._set_llm_cache()
+        parsed_tools = self._parse_tools(tools)
 
         agent_args = {
             "input": lambda x: x["input"],
             "tools": lambda x: x["tools"],
             "tool_names": lambda x: x["tool_names"],
-            "agent_scratchpad": lambda x: self.format_log_to_str(
-                x["intermediate_steps"]
-            ),
+            "agent_scratchpad": lambda x: x["agent_scratchpad"],
         }
 
         executor_args = {
@@ -290,7 +573,9 @@ class Agent(BaseModel):
             "i18n": self.i18n,
             "crew": self.crew,
             "crew_agent": self,
-            "tools": self._parse_tools(tools),
+            "tools": parsed_tools,
+            "tools_description": render_text_description(parsed_tools),
+            "tools_names": self.__tools_names(parsed_tools),
             "verbose": self.verbose,
             "original_tools": tools,
             "handle_parsing_errors": True,
@@ -300,19 +585,30 @@ class Agent(BaseModel):
             "tools_handler": self.tools_handler,
             "function_calling_llm": self.function_calling_llm,
             "callbacks": self.callbacks,
+            "max_prompt_tokens": self.max_prompt_tokens,
+            "llm_call_policy": self.llm_call_policy,
+            "parallel_tool_calls": self.parallel_tool_calls,
+            "tool_timeout": self.tool_timeout,
+            "tool_timeouts": self.tool_timeouts,
         }
 
         if self._rpm_controller:
-            executor_args[
-                "request_within_rpm_limit"
-            ] = self._rpm_controller.check_or_wait
+            executor_args["request_within_rpm_limit"] = partial(
+                self._rpm_controller.acquire, self._model_name()
+            )
+            executor_args["arequest_within_rpm_limit"] = partial(
+                self._rpm_controller.aacquire, self._model_name()
+            )
 
+        native_tools = self.native_tool_calling and bool(parsed_tools)
         prompt = Prompts(
             i18n=self.i18n,
             tools=tools,
             system_template=self.system_template,
             prompt_template=self.prompt_template,
             response_template=self.response_template,
+            native_tools=native_tools,
+            parallel_tools=self.parallel_tool_calls,
         ).task_execution()
 
         execution_prompt = prompt.partial(
@@ -327,10 +623,90 @@ class Agent(BaseModel):
                 self.response_template.split("{{ .Response }}")[1].strip()
             )
 
+        if native_tools:
+            # The tool calls come as structured data, in a single LLM call per step.
+            bind = self.llm.bind_tools(parsed_tools)
+            inner_agent = (
+                agent_args
+                | execution_prompt
+                | bind
+                | CrewAgentToolCallParser(agent=self)
+            )
+            return CrewAgentExecutor(
+                agent=RunnableAgent(runnable=inner_agent, stream_runnable=False),
+                prompt=execution_prompt,
+                **executor_args,
+            )
+
         bind = self.llm.bind(stop=stop_words)
-        inner_agent = agent_args | execution_prompt | bind | CrewAgentParser(agent=self)
-        self.agent_executor = CrewAgentExecutor(
-            agent=RunnableAgent(runnable=inner_agent), **executor_args
+        inner_agent = (
+            agent_args
+            | execution_prompt
+            | bind
+            | CrewAgentParser(agent=self, parallel_tool_calls=self.parallel_tool_calls)
+        )
+        # Streamed LLM calls skip the LLM cache, so a cached agent invokes its LLM.
+        if self.stream_steps and not self.llm_cache:
+            executor_args["llm_stream"] = agent_args | execution_prompt | bind
+        return CrewAgentExecutor(
+            agent=RunnableAgent(
+                runnable=inner_agent, stream_runnable=not self.llm_cache
+            ),
+            prompt=execution_prompt,
+            **executor_args,
+        )
+
+    def copy(self) -> "Agent":
+        """Create a copy of the agent that shares its LLMs, cache handler and RPM controller.
+
+        The copy skips validation, so it is cheap enough to be made for every execution.
+        Its agent executor is created when it first executes a task. It counts its own
+        tokens, through a shallow copy of the LLM that still shares its client.
+
+        Returns:
+            A new Agent instance with its own execution state.
+        """
+        token_process = TokenProcess()
+        copied_agent = self.model_copy(
+            update={
+                "llm": self._llm_counting_tokens(token_process),
+                "id": uuid.uuid4(),
+                "role": self._original_role or self.role,
+                "goal": self._original_goal or self.goal,
+                "backstory": self._original_backstory or self.backstory,
+                "tools": list(self.tools),
+                "tools_handler": ToolsHandler(
+                    cache=self.cache_handler if self.cache else None
+                ),
+                "agent_executor": None,
+                "crew": None,
+                "formatting_errors": 0,
+            }
+        )
+        copied_agent._agent_executors = OrderedDict()
+        copied_agent._token_process = token_process
+        return copied_agent
+
+    def _llm_counting_tokens(self, token_process: TokenProcess) -> Any:
+        """Returns the LLM, with its token counting callback charging the token process."""
+        if not any(
+            isinstance(handler, TokenCalcHandler)
+            for handler in getattr(self.llm, "callbacks", None) or []
+        ):
+            return self.llm
+
+        return type(self.llm).construct(
+            **{
+                **self.llm.__dict__,
+                "callbacks": [
+                    (
+                        TokenCalcHandler(self.llm.model_name, token_process)
+                        if isinstance(handler, TokenCalcHandler)
+                        else handler
+                    )
+                    for handler in self.llm.callbacks
+                ],
+            }
         )
 
     def interpolate_inputs(self, inputs: Dict[str, Any]) -> None:
@@ -349,7 +725,8 @@ class Agent(BaseModel):
 
     def increment_formatting_errors(self) -> None:
         """Count the formatting errors of the agent."""
-        self.formatting_errors += 1
+        with self._lock:
+            self.formatting_errors += 1
 
     def format_log_to_str(
         self,
@@ -358,11 +735,7 @@ class Agent(BaseModel):
         llm_prefix: str = "",
     ) -> str:
         """Construct the scratchpad that lets the agent continue its thought process."""
-        thoughts = ""
-        for action, observation in intermediate_steps:
-            thoughts += action.log
-            thoughts += f"\n{observation_prefix}{observation}\n{llm_prefix}"
-        return thoughts
+        return Scratchpad(observation_prefix, llm_prefix).update(intermediate_steps)
 
     def _parse_tools(self, tools: List[Any]) -> List[LangChainTool]:
         """Parse tools to be used for the task."""
@@ -1,4 +1,5 @@
 from .cache.cache_handler import CacheHandler
 from .executor import CrewAgentExecutor
-from .parser import CrewAgentParser
+from .parser import CrewAgentParser, CrewAgentToolCallParser
+from .scratchpad import Scratchpad
 from .tools_handler import ToolsHandler
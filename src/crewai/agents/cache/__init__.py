@@ -1 +1,2 @@
 from .cache_handler import CacheHandler
+from .sqlite_cache_handler import SQLiteCacheHandler
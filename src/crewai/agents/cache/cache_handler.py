@@ -1,16 +1,122 @@
-from typing import Optional
+import ast
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
 
 
 class CacheHandler:
-    """Callback handler for tool usage."""
+    """Callback handler for tool usage.
 
-    _cache: dict = {}
+    Results are keyed by the tool and the canonical JSON of its input, so inputs
+    only differing in their key order or spacing share them. The cache is
+    unbounded by default, the least recently used results are evicted once there
+    are more than `max_entries` of them or they take more than `max_bytes`, and
+    results expire after the TTL of their tool. Errors are only cached when
+    `error_ttl` is set.
+    """
 
-    def __init__(self):
-        self._cache = {}
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        tool_ttls: Optional[Dict[str, float]] = None,
+        error_ttl: Optional[float] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.tool_ttls = tool_ttls or {}
+        self.error_ttl = error_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache: "OrderedDict[str, Any]" = OrderedDict()
+        self._expires_at: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._bytes = 0
+        self._lock = threading.Lock()
 
     def add(self, tool, input, output):
-        self._cache[f"{tool}-{input}"] = output
+        self._add(tool, input, output, self.tool_ttls.get(tool, self.ttl))
+
+    def add_error(self, tool, input, error):
+        """Caches the error of the tool for `error_ttl` seconds, if it's set."""
+        if self.error_ttl is not None:
+            self._add(tool, input, error, self.error_ttl)
 
     def read(self, tool, input) -> Optional[str]:
-        return self._cache.get(f"{tool}-{input}")
+        key = self.key(tool, input)
+        with self._lock:
+            if key in self._cache and self._expired(key):
+                self._remove(key)
+            if key not in self._cache:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+    def get_summary(self) -> Dict[str, int]:
+        """Returns the cache's hit, miss and eviction counters."""
+        with self._lock:
+            return {
+                "cache_hits": self.hits,
+                "cache_misses": self.misses,
+                "cache_evictions": self.evictions,
+            }
+
+    @staticmethod
+    def key(tool, input) -> str:
+        """Returns the key of the tool's input, using its canonical JSON."""
+        if isinstance(input, str):
+            text = input.strip()
+            for parse in (json.loads, ast.literal_eval):
+                try:
+                    input = parse(text)
+                    break
+                except (ValueError, SyntaxError, TypeError, MemoryError):
+                    continue
+            else:
+                input = text
+        canonical = json.dumps(
+            input,
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+            default=str,
+        )
+        return f"{tool}-{canonical}"
+
+    def _add(self, tool, input, output, ttl: Optional[float]) -> None:
+        key = self.key(tool, input)
+        size = len(key.encode()) + len(str(output).encode())
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+            self._cache[key] = output
+            self._sizes[key] = size
+            self._bytes += size
+            if ttl is not None:
+                self._expires_at[key] = time.time() + ttl
+            self._evict()
+
+    def _evict(self) -> None:
+        """Evicts the least recently used results until the cache fits its limits."""
+        while self._cache and (
+            (self.max_entries is not None and len(self._cache) > self.max_entries)
+            or (self.max_bytes is not None and self._bytes > self.max_bytes)
+        ):
+            self._remove(next(iter(self._cache)))
+            self.evictions += 1
+
+    def _expired(self, key: str) -> bool:
+        expires_at = self._expires_at.get(key)
+        return expires_at is not None and time.time() >= expires_at
+
+    def _remove(self, key: str) -> None:
+        del self._cache[key]
+        self._bytes -= self._sizes.pop(key)
+        self._expires_at.pop(key, None)
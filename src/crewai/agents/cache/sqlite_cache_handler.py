@@ -0,0 +1,149 @@
+import json
+import sqlite3
+import time
+from typing import Optional
+
+from crewai.agents.cache.cache_handler import CacheHandler
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.printer import Printer
+
+
+class SQLiteCacheHandler(CacheHandler):
+    """CacheHandler storing the results of the tools in a SQLite database, so they
+    are reused by later executions and by every process using the same database.
+
+    The database runs in WAL mode, so readers don't wait for writers.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, **kwargs):
+        super().__init__(**kwargs)
+        self.db_path = db_path or f"{db_storage_path()}/tool_cache.db"
+        self._printer: Printer = Printer()
+        self._initialize_db()
+
+    def _initialize_db(self):
+        """
+        Initializes the SQLite database and creates the tool_results table
+        """
+        try:
+            with sqlite3.connect(self.db_path, timeout=30) as conn:
+                cursor = conn.cursor()
+                cursor.execute("PRAGMA journal_mode=WAL")
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tool_results (
+                        key TEXT PRIMARY KEY,
+                        output TEXT,
+                        size INTEGER,
+                        expires_at REAL,
+                        accessed_at REAL
+                    )
+                """
+                )
+
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+
+    def read(self, tool, input) -> Optional[str]:
+        key = self.key(tool, input)
+        output = None
+        found = False
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path, timeout=30) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT output, expires_at FROM tool_results WHERE key = ?",
+                    (key,),
+                )
+                row = cursor.fetchone()
+                if row and (row[1] is None or now < row[1]):
+                    output = json.loads(row[0])
+                    found = True
+                    cursor.execute(
+                        "UPDATE tool_results SET accessed_at = ? WHERE key = ?",
+                        (now, key),
+                    )
+                    conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred while reading a result: {e}",
+                color="red",
+            )
+
+        with self._lock:
+            if found:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return output
+
+    def _add(self, tool, input, output, ttl: Optional[float]) -> None:
+        key = self.key(tool, input)
+        data = json.dumps(output, default=str)
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path, timeout=30) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                INSERT OR REPLACE INTO tool_results (key, output, size, expires_at, accessed_at)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                    (
+                        key,
+                        data,
+                        len(key.encode()) + len(data.encode()),
+                        now + ttl if ttl is not None else None,
+                        now,
+                    ),
+                )
+                evictions = self._evict_rows(cursor, now)
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"TOOL CACHE ERROR: An error occurred while caching a result: {e}",
+                color="red",
+            )
+            return
+
+        with self._lock:
+            self.evictions += evictions
+
+    def _evict_rows(self, cursor: sqlite3.Cursor, now: float) -> int:
+        """Deletes the expired results, then the least recently used ones until the
+        cache fits its limits. Returns how many results were evicted."""
+        cursor.execute("DELETE FROM tool_results WHERE expires_at <= ?", (now,))
+        evictions = 0
+        if self.max_entries is not None:
+            cursor.execute(
+                """
+                DELETE FROM tool_results WHERE key NOT IN (
+                    SELECT key FROM tool_results
+                    ORDER BY accessed_at DESC, rowid DESC
+                    LIMIT ?
+                )
+            """,
+                (self.max_entries,),
+            )
+            evictions += cursor.rowcount
+        if self.max_bytes is not None:
+            cursor.execute(
+                """
+                DELETE FROM tool_results WHERE key IN (
+                    SELECT key FROM (
+                        SELECT key, SUM(size) OVER (
+                            ORDER BY accessed_at DESC, rowid DESC
+                        ) AS total_size
+                        FROM tool_results
+                    ) WHERE total_size > ?
+                )
+            """,
+                (self.max_bytes,),
+            )
+            evictions += cursor.rowcount
+        return evictions
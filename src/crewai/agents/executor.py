@@ -1,25 +1,36 @@
+import asyncio
+import contextvars
 import threading
 import time
-from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing, closing
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from langchain.agents import AgentExecutor
 from langchain.agents.agent import ExceptionTool
-from langchain.callbacks.manager import CallbackManagerForChainRun
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForChainRun,
+    CallbackManagerForChainRun,
+)
 from langchain_core.agents import AgentAction, AgentFinish, AgentStep
+from langchain_core.callbacks import Callbacks
 from langchain_core.exceptions import OutputParserException
 from langchain_core.pydantic_v1 import root_validator
 from langchain_core.tools import BaseTool
 from langchain_core.utils.input import get_color_mapping
 from pydantic import InstanceOf
 
+from crewai.agents.parser import CrewAgentParser, CrewAgentStreamParser
+from crewai.agents.scratchpad import Scratchpad
 from crewai.agents.tools_handler import ToolsHandler
 from crewai.memory.entity.entity_memory_item import EntityMemoryItem
 from crewai.memory.long_term.long_term_memory_item import LongTermMemoryItem
 from crewai.memory.short_term.short_term_memory_item import ShortTermMemoryItem
 from crewai.tools.tool_usage import ToolUsage, ToolUsageErrorException
-from crewai.utilities import I18N
+from crewai.utilities import I18N, CrewEventType
 from crewai.utilities.converter import ConverterError
 from crewai.utilities.evaluators.task_evaluator import TaskEvaluator
+from crewai.utilities.token_budget import count_tokens
 
 
 class CrewAgentExecutor(AgentExecutor):
@@ -35,6 +46,17 @@ class CrewAgentExecutor(AgentExecutor):
     crew: Any = None
     function_calling_llm: Any = None
     request_within_rpm_limit: Any = None
+    arequest_within_rpm_limit: Any = None
+    llm_stream: Any = None
+    llm_call_policy: Any = None
+    parallel_tool_calls: bool = False
+    max_parallel_tools: int = 8
+    tool_timeout: Optional[float] = None
+    tool_timeouts: Optional[Dict[str, float]] = None
+    scratchpad: Any = None
+    prompt: Any = None
+    max_prompt_tokens: Optional[int] = None
+    scratchpad_budget: Optional[int] = None
     tools_handler: InstanceOf[ToolsHandler] = None
     max_iterations: Optional[int] = 15
     have_forced_answer: bool = False
@@ -113,6 +135,7 @@ class CrewAgentExecutor(AgentExecutor):
             excluded_colors=["green", "red"],
         )
         intermediate_steps: List[Tuple[AgentAction, str]] = []
+        self._start_scratchpad(inputs)
         # Allowing human input given task setting
         if self.task.human_input:
             self.should_ask_for_human_input = True
@@ -166,6 +189,70 @@ class CrewAgentExecutor(AgentExecutor):
 
         return self._return(output, intermediate_steps, run_manager=run_manager)
 
+    async def _acall(
+        self,
+        inputs: Dict[str, str],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> Dict[str, Any]:
+        """Run text through and get agent response without blocking the event loop."""
+        name_to_tool_map = {tool.name: tool for tool in self.tools}
+        color_mapping = get_color_mapping(
+            [tool.name.casefold() for tool in self.tools],
+            excluded_colors=["green", "red"],
+        )
+        intermediate_steps: List[Tuple[AgentAction, str]] = []
+        self._start_scratchpad(inputs)
+        if self.task.human_input:
+            self.should_ask_for_human_input = True
+
+        self.iterations = 0
+        time_elapsed = 0.0
+        start_time = time.time()
+
+        while self._should_continue(self.iterations, time_elapsed):
+            if (
+                not self.arequest_within_rpm_limit
+                or await self.arequest_within_rpm_limit()
+            ):
+                next_step_output = await self._atake_next_step(
+                    name_to_tool_map,
+                    color_mapping,
+                    inputs,
+                    intermediate_steps,
+                    run_manager=run_manager,
+                )
+
+                if self.step_callback:
+                    self.step_callback(next_step_output)
+
+                if isinstance(next_step_output, AgentFinish):
+                    create_long_term_memory = threading.Thread(
+                        target=self._create_long_term_memory, args=(next_step_output,)
+                    )
+                    create_long_term_memory.start()
+
+                    return await self._areturn(
+                        next_step_output, intermediate_steps, run_manager=run_manager
+                    )
+
+                intermediate_steps.extend(next_step_output)
+
+                if len(next_step_output) == 1:
+                    next_step_action = next_step_output[0]
+                    tool_return = self._get_tool_return(next_step_action)
+                    if tool_return is not None:
+                        return await self._areturn(
+                            tool_return, intermediate_steps, run_manager=run_manager
+                        )
+
+                self.iterations += 1
+                time_elapsed = time.time() - start_time
+        output = self.agent.return_stopped_response(
+            self.early_stopping_method, intermediate_steps, **inputs
+        )
+
+        return await self._areturn(output, intermediate_steps, run_manager=run_manager)
+
     def _iter_next_step(
         self,
         name_to_tool_map: Dict[str, BaseTool],
@@ -189,38 +276,14 @@ class CrewAgentExecutor(AgentExecutor):
             intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
 
             # Call the LLM to see what to do.
-            output = self.agent.plan(
+            output = self._plan(
                 intermediate_steps,
                 callbacks=run_manager.get_child() if run_manager else None,
                 **inputs,
             )
 
         except OutputParserException as e:
-            if isinstance(self.handle_parsing_errors, bool):
-                raise_error = not self.handle_parsing_errors
-            else:
-                raise_error = False
-            if raise_error:
-                raise ValueError(
-                    "An output parsing error occurred. "
-                    "In order to pass this error back to the agent and have it try "
-                    "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
-                    f"This is the error: {str(e)}"
-                )
-            str(e)
-            if isinstance(self.handle_parsing_errors, bool):
-                if e.send_to_llm:
-                    observation = f"\n{str(e.observation)}"
-                    str(e.llm_output)
-                else:
-                    observation = ""
-            elif isinstance(self.handle_parsing_errors, str):
-                observation = f"\n{self.handle_parsing_errors}"
-            elif callable(self.handle_parsing_errors):
-                observation = f"\n{self.handle_parsing_errors(e)}"
-            else:
-                raise ValueError("Got unexpected type of `handle_parsing_errors`")
-            output = AgentAction("_Exception", observation, "")
+            output = AgentAction("_Exception", self._parsing_error_observation(e), "")
 
             if run_manager:
                 run_manager.on_agent_action(output, color="green")
@@ -245,6 +308,12 @@ class CrewAgentExecutor(AgentExecutor):
 
         # If the tool chosen is the finishing tool, then we end and return.
         if isinstance(output, AgentFinish):
+            invalid_output = self._invalid_output_observation(output)
+            if invalid_output:
+                action = AgentAction("_Exception", invalid_output, output.log)
+                yield AgentStep(action=action, observation=invalid_output)
+                return
+
             if self.should_ask_for_human_input:
                 # Making sure we only ask for it once, so disabling for the next thought loop
                 self.should_ask_for_human_input = False
@@ -273,33 +342,436 @@ class CrewAgentExecutor(AgentExecutor):
         for agent_action in actions:
             if run_manager:
                 run_manager.on_agent_action(agent_action, color="green")
+            self._emit_event(CrewEventType.agent_action, agent_action)
 
-            tool_usage = ToolUsage(
-                tools_handler=self.tools_handler,
-                tools=self.tools,
-                original_tools=self.original_tools,
-                tools_description=self.tools_description,
-                tools_names=self.tools_names,
-                function_calling_llm=self.function_calling_llm,
-                task=self.task,
-                action=agent_action,
+        observations = self._use_tools(actions, name_to_tool_map)
+        for agent_action, observation in zip(actions, observations):
+            self._emit_event(CrewEventType.tool_observation, observation)
+            yield AgentStep(action=agent_action, observation=observation)
+
+    async def _aiter_next_step(
+        self,
+        name_to_tool_map: Dict[str, BaseTool],
+        color_mapping: Dict[str, str],
+        inputs: Dict[str, str],
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        run_manager: Optional[AsyncCallbackManagerForChainRun] = None,
+    ) -> AsyncIterator[Union[AgentFinish, AgentAction, AgentStep]]:
+        """Async version of `_iter_next_step`, calling the LLM without blocking the event loop."""
+        try:
+            if self._should_force_answer():
+                error = self._i18n.errors("force_final_answer")
+                output = AgentAction("_Exception", error, error)
+                self.have_forced_answer = True
+                yield AgentStep(action=output, observation=error)
+                return
+
+            intermediate_steps = self._prepare_intermediate_steps(intermediate_steps)
+
+            output = await self._aplan(
+                intermediate_steps,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **inputs,
             )
-            tool_calling = tool_usage.parse(agent_action.log)
 
-            if isinstance(tool_calling, ToolUsageErrorException):
-                observation = tool_calling.message
+        except OutputParserException as e:
+            output = AgentAction("_Exception", self._parsing_error_observation(e), "")
+
+            if run_manager:
+                await run_manager.on_agent_action(output, color="green")
+
+            tool_run_kwargs = self.agent.tool_run_logging_kwargs()
+            observation = await ExceptionTool().arun(
+                output.tool_input,
+                verbose=False,
+                color=None,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **tool_run_kwargs,
+            )
+
+            if self._should_force_answer():
+                error = self._i18n.errors("force_final_answer")
+                output = AgentAction("_Exception", error, error)
+                yield AgentStep(action=output, observation=error)
+                return
+
+            yield AgentStep(action=output, observation=observation)
+            return
+
+        if isinstance(output, AgentFinish):
+            invalid_output = self._invalid_output_observation(output)
+            if invalid_output:
+                action = AgentAction("_Exception", invalid_output, output.log)
+                yield AgentStep(action=action, observation=invalid_output)
+                return
+
+            if self.should_ask_for_human_input:
+                self.should_ask_for_human_input = False
+                human_feedback = await asyncio.to_thread(
+                    self._ask_human_input, output.return_values["output"]
+                )
+                action = AgentAction(
+                    tool="Human Input", tool_input=human_feedback, log=output.log
+                )
+                yield AgentStep(
+                    action=action,
+                    observation=self._i18n.slice("human_feedback").format(
+                        human_feedback=human_feedback
+                    ),
+                )
+                return
+
             else:
-                if tool_calling.tool_name.casefold().strip() in [
-                    name.casefold().strip() for name in name_to_tool_map
-                ]:
-                    observation = tool_usage.use(tool_calling, agent_action.log)
-                else:
-                    observation = self._i18n.errors("wrong_tool_name").format(
-                        tool=tool_calling.tool_name,
-                        tools=", ".join([tool.name.casefold() for tool in self.tools]),
-                    )
+                yield output
+                return
+
+        await asyncio.to_thread(self._create_short_term_memory, output)
+
+        actions: List[AgentAction]
+        actions = [output] if isinstance(output, AgentAction) else output
+        for agent_action in actions:
+            yield agent_action
+
+        for agent_action in actions:
+            if run_manager:
+                await run_manager.on_agent_action(agent_action, color="green")
+            self._emit_event(CrewEventType.agent_action, agent_action)
+
+        observations = await self._ause_tools(actions, name_to_tool_map)
+        for agent_action, observation in zip(actions, observations):
+            self._emit_event(CrewEventType.tool_observation, observation)
             yield AgentStep(action=agent_action, observation=observation)
 
+    def _plan(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        callbacks: Callbacks = None,
+        **inputs: Any,
+    ) -> Union[AgentAction, AgentFinish]:
+        """Call the LLM to see what to do, with the agent's LLM call policy if any."""
+        inputs["agent_scratchpad"] = self._update_scratchpad(intermediate_steps)
+        if not self.llm_call_policy:
+            return self._predict(intermediate_steps, callbacks, inputs)
+        return self.llm_call_policy.call(
+            self._predict,
+            intermediate_steps,
+            callbacks,
+            inputs,
+            acquire=self.request_within_rpm_limit,
+        )
+
+    def _predict(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        callbacks: Callbacks,
+        inputs: Dict[str, Any],
+    ) -> Union[AgentAction, AgentFinish]:
+        """Call the LLM once, streaming its output when the agent does."""
+        if not self.llm_stream:
+            return self.agent.plan(intermediate_steps, callbacks=callbacks, **inputs)
+
+        stream_parser = self._stream_parser()
+        with closing(
+            self.llm_stream.stream(
+                {**inputs, "intermediate_steps": intermediate_steps},
+                config={"callbacks": callbacks},
+            )
+        ) as chunks:
+            for chunk in chunks:
+                if stream_parser.feed(getattr(chunk, "content", chunk)):
+                    break
+        return CrewAgentParser(
+            agent=self.crew_agent, parallel_tool_calls=self.parallel_tool_calls
+        ).parse(stream_parser.text)
+
+    async def _aplan(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        callbacks: Callbacks = None,
+        **inputs: Any,
+    ) -> Union[AgentAction, AgentFinish]:
+        """Async version of `_plan`."""
+        inputs["agent_scratchpad"] = self._update_scratchpad(intermediate_steps)
+        if not self.llm_call_policy:
+            return await self._apredict(intermediate_steps, callbacks, inputs)
+        return await self.llm_call_policy.acall(
+            self._apredict,
+            intermediate_steps,
+            callbacks,
+            inputs,
+            acquire=self.arequest_within_rpm_limit,
+        )
+
+    async def _apredict(
+        self,
+        intermediate_steps: List[Tuple[AgentAction, str]],
+        callbacks: Callbacks,
+        inputs: Dict[str, Any],
+    ) -> Union[AgentAction, AgentFinish]:
+        """Async version of `_predict`."""
+        if not self.llm_stream:
+            return await self.agent.aplan(
+                intermediate_steps, callbacks=callbacks, **inputs
+            )
+
+        stream_parser = self._stream_parser()
+        async with aclosing(
+            self.llm_stream.astream(
+                {**inputs, "intermediate_steps": intermediate_steps},
+                config={"callbacks": callbacks},
+            )
+        ) as chunks:
+            async for chunk in chunks:
+                if stream_parser.feed(getattr(chunk, "content", chunk)):
+                    break
+        return CrewAgentParser(
+            agent=self.crew_agent, parallel_tool_calls=self.parallel_tool_calls
+        ).parse(stream_parser.text)
+
+    def _update_scratchpad(
+        self, intermediate_steps: List[Tuple[AgentAction, str]]
+    ) -> str:
+        """Add the new intermediate steps to the scratchpad and return its text."""
+        if self.scratchpad is None:
+            self.scratchpad = Scratchpad()
+        scratchpad = self.scratchpad.update(intermediate_steps)
+        if self.scratchpad_budget is not None:
+            scratchpad = self.scratchpad.compact(
+                self.scratchpad_budget,
+                self.crew_agent.i18n.slice("compacted_observation"),
+            )
+        return scratchpad
+
+    def _start_scratchpad(self, inputs: Dict[str, str]) -> None:
+        """Start a new scratchpad, its budget is what the prompt budget leaves."""
+        self.scratchpad = Scratchpad()
+        self.scratchpad_budget = None
+        if self.max_prompt_tokens:
+            self.scratchpad_budget = max(
+                0, self.max_prompt_tokens - self.prompt_tokens(inputs["input"])
+            )
+
+    def prompt_tokens(self, task_prompt: str) -> int:
+        """Returns the number of tokens of the task's prompt, without scratchpad."""
+        return count_tokens(
+            self.prompt.format(
+                input=task_prompt,
+                tools=self.tools_description,
+                tool_names=self.tools_names,
+                agent_scratchpad="",
+            )
+        )
+
+    def _invalid_output_observation(self, output: AgentFinish) -> Optional[str]:
+        """Validate the final answer against the task's output model, so a malformed
+        one is fixed by the agent rather than converted with another LLM call.
+
+        Returns the observation sent back to the agent when it's not valid.
+        """
+        task = self.task
+        if self.have_forced_answer or not (
+            task and (task.output_pydantic or task.output_json)
+        ):
+            return None
+
+        try:
+            task.parse_output(output.return_values["output"])
+        except ValueError as e:
+            return self._i18n.errors("invalid_output").format(error=e)
+        return None
+
+    def _stream_parser(self) -> CrewAgentStreamParser:
+        return CrewAgentStreamParser(
+            stop=self.crew_agent.i18n.slice("observation"),
+            multiple_actions=self.parallel_tool_calls,
+        )
+
+    def _parsing_error_observation(self, e: OutputParserException) -> str:
+        """Build the observation sent back to the agent after a parsing error."""
+        if isinstance(self.handle_parsing_errors, bool):
+            raise_error = not self.handle_parsing_errors
+        else:
+            raise_error = False
+        if raise_error:
+            raise ValueError(
+                "An output parsing error occurred. "
+                "In order to pass this error back to the agent and have it try "
+                "again, pass `handle_parsing_errors=True` to the AgentExecutor. "
+                f"This is the error: {str(e)}"
+            )
+        if isinstance(self.handle_parsing_errors, bool):
+            if e.send_to_llm:
+                observation = f"\n{str(e.observation)}"
+            else:
+                observation = ""
+        elif isinstance(self.handle_parsing_errors, str):
+            observation = f"\n{self.handle_parsing_errors}"
+        elif callable(self.handle_parsing_errors):
+            observation = f"\n{self.handle_parsing_errors(e)}"
+        else:
+            raise ValueError("Got unexpected type of `handle_parsing_errors`")
+        return observation
+
+    def _use_tools(
+        self, actions: List[AgentAction], name_to_tool_map: Dict[str, BaseTool]
+    ) -> List[str]:
+        """Run the tools of the actions concurrently and return their observations.
+
+        The observations are in the order of the actions, whichever tool finishes first.
+        """
+        if len(actions) == 1:
+            return [self._use_tool(actions[0], name_to_tool_map)]
+
+        tools_handlers = self._actions_tools_handlers(actions)
+        workers = max(1, min(len(actions), self.max_parallel_tools))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="crewai-tool"
+        ) as pool:
+            # Each tool gets a copy of the context, so callbacks relying on it work.
+            futures = [
+                pool.submit(
+                    contextvars.copy_context().run,
+                    self._use_tool,
+                    agent_action,
+                    name_to_tool_map,
+                    tools_handler,
+                )
+                for agent_action, tools_handler in zip(actions, tools_handlers)
+            ]
+            observations = [future.result() for future in futures]
+        self._record_tools_usage(tools_handlers)
+        return observations
+
+    async def _ause_tools(
+        self, actions: List[AgentAction], name_to_tool_map: Dict[str, BaseTool]
+    ) -> List[str]:
+        """Async version of `_use_tools`, awaiting async tools on the event loop."""
+        if len(actions) == 1:
+            return [await self._ause_tool(actions[0], name_to_tool_map)]
+
+        tools_handlers = self._actions_tools_handlers(actions)
+        semaphore = asyncio.Semaphore(max(1, self.max_parallel_tools))
+
+        async def use_tool(
+            agent_action: AgentAction, tools_handler: Optional[ToolsHandler]
+        ) -> str:
+            async with semaphore:
+                return await self._ause_tool(
+                    agent_action, name_to_tool_map, tools_handler
+                )
+
+        observations = await asyncio.gather(*map(use_tool, actions, tools_handlers))
+        self._record_tools_usage(tools_handlers)
+        return list(observations)
+
+    def _actions_tools_handlers(
+        self, actions: List[AgentAction]
+    ) -> List[Optional[ToolsHandler]]:
+        """Returns a tools handler for each of the actions run at the same time.
+
+        They share the cache, and every action is checked for repeated usage against
+        the tool used before them, not against whichever of them finishes first.
+        """
+        if not self.tools_handler:
+            return [None] * len(actions)
+
+        tools_handlers = []
+        for _ in actions:
+            tools_handler = ToolsHandler(cache=self.tools_handler.cache)
+            tools_handler.last_used_tool = self.tools_handler.last_used_tool
+            tools_handlers.append(tools_handler)
+        return tools_handlers
+
+    def _record_tools_usage(self, tools_handlers: List[Optional[ToolsHandler]]) -> None:
+        """Records the tool used by the last action that used one, in action order."""
+        if not self.tools_handler:
+            return
+
+        used_tools = [
+            tools_handler.last_used_tool
+            for tools_handler in tools_handlers
+            if tools_handler.last_used_tool is not self.tools_handler.last_used_tool
+        ]
+        if used_tools:
+            self.tools_handler.last_used_tool = used_tools[-1]
+
+    def _use_tool(
+        self,
+        agent_action: AgentAction,
+        name_to_tool_map: Dict[str, BaseTool],
+        tools_handler: Optional[ToolsHandler] = None,
+    ) -> str:
+        """Run the tool picked by the agent and return its observation."""
+        tool_usage = self._tool_usage(agent_action, tools_handler)
+        tool_calling = tool_usage.parse(agent_action.log)
+
+        if isinstance(tool_calling, ToolUsageErrorException):
+            observation = tool_calling.message
+        else:
+            observation = self._wrong_tool_name(tool_calling, name_to_tool_map)
+            if observation is None:
+                observation = tool_usage.use(tool_calling, agent_action.log)
+        return observation
+
+    async def _ause_tool(
+        self,
+        agent_action: AgentAction,
+        name_to_tool_map: Dict[str, BaseTool],
+        tools_handler: Optional[ToolsHandler] = None,
+    ) -> str:
+        """Async version of `_use_tool`, awaiting the tool when it is async."""
+        tool_usage = self._tool_usage(agent_action, tools_handler)
+        if self.function_calling_llm:
+            # Parsing calls the function calling LLM, which only runs synchronously.
+            tool_calling = await asyncio.to_thread(tool_usage.parse, agent_action.log)
+        else:
+            tool_calling = tool_usage.parse(agent_action.log)
+
+        if isinstance(tool_calling, ToolUsageErrorException):
+            observation = tool_calling.message
+        else:
+            observation = self._wrong_tool_name(tool_calling, name_to_tool_map)
+            if observation is None:
+                observation = await tool_usage.ause(tool_calling, agent_action.log)
+        return observation
+
+    def _tool_usage(
+        self, agent_action: AgentAction, tools_handler: Optional[ToolsHandler] = None
+    ) -> ToolUsage:
+        return ToolUsage(
+            tools_handler=tools_handler or self.tools_handler,
+            tools=self.tools,
+            original_tools=self.original_tools,
+            tools_description=self.tools_description,
+            tools_names=self.tools_names,
+            function_calling_llm=self.function_calling_llm,
+            task=self.task,
+            action=agent_action,
+            llm_call_policy=self.llm_call_policy,
+            tool_timeout=self.tool_timeout,
+            tool_timeouts=self.tool_timeouts,
+        )
+
+    def _wrong_tool_name(
+        self, tool_calling: Any, name_to_tool_map: Dict[str, BaseTool]
+    ) -> Optional[str]:
+        """Returns the error for a tool the agent doesn't have, if it picked one."""
+        if tool_calling.tool_name.casefold().strip() in [
+            name.casefold().strip() for name in name_to_tool_map
+        ]:
+            return None
+        return self._i18n.errors("wrong_tool_name").format(
+            tool=tool_calling.tool_name,
+            tools=", ".join([tool.name.casefold() for tool in self.tools]),
+        )
+
+    def _emit_event(self, type: CrewEventType, data: Any) -> None:
+        """Emits an event of the agent execution to the crew, if there is one."""
+        if self.crew:
+            self.crew._emit_event(
+                type, agent=self.crew_agent, task=self.task, data=data
+            )
+
     def _ask_human_input(self, final_answer: dict) -> str:
         """Get human input."""
         return input(
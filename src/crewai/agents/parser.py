@@ -1,9 +1,13 @@
+import json
 import re
-from typing import Any, Union
+from typing import Any, List, Optional, Union
 
+from langchain.agents.agent import MultiActionAgentOutputParser
 from langchain.agents.output_parsers import ReActSingleInputOutputParser
 from langchain_core.agents import AgentAction, AgentFinish
 from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation
 
 from crewai.utilities import I18N
 
@@ -11,6 +15,8 @@ FINAL_ANSWER_ACTION = "Final Answer:"
 MISSING_ACTION_AFTER_THOUGHT_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action:' after 'Thought:'. I will do right next, and don't use a tool I have already used.\n"
 MISSING_ACTION_INPUT_AFTER_ACTION_ERROR_MESSAGE = "I did it wrong. Invalid Format: I missed the 'Action Input:' after 'Action:'. I will do right next, and don't use a tool I have already used.\n"
 FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE = "I did it wrong. Tried to both perform Action and give a Final Answer at the same time, I must do one or the other"
+ACTION_REGEX = r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
+NUMBERED_ACTION_START_REGEX = re.compile(r"Action\s*\d+\s*:")
 
 
 class CrewAgentParser(ReActSingleInputOutputParser):
@@ -26,6 +32,15 @@ class CrewAgentParser(ReActSingleInputOutputParser):
     Action: search
     Action Input: what is the temperature in SF?
 
+    When the agent makes parallel tool calls, several actions can be taken at once
+    by numbering them, which results in a list of AgentActions.
+
+    Thought: agent thought here
+    Action 1: search
+    Action Input 1: what is the temperature in SF?
+    Action 2: search
+    Action Input 2: what is the temperature in NYC?
+
     If the output signals that a final answer should be given,
     should be in the below format. This will result in an AgentFinish
     being returned.
@@ -36,23 +51,20 @@ class CrewAgentParser(ReActSingleInputOutputParser):
 
     _i18n: I18N = I18N()
     agent: Any = None
+    parallel_tool_calls: bool = False
 
-    def parse(self, text: str) -> Union[AgentAction, AgentFinish]:
+    def parse(self, text: str) -> Union[AgentAction, List[AgentAction], AgentFinish]:
         includes_answer = FINAL_ANSWER_ACTION in text
-        regex = (
-            r"Action\s*\d*\s*:[\s]*(.*?)[\s]*Action\s*\d*\s*Input\s*\d*\s*:[\s]*(.*)"
-        )
-        action_match = re.search(regex, text, re.DOTALL)
+        action_match = re.search(ACTION_REGEX, text, re.DOTALL)
         if action_match:
             if includes_answer:
                 raise OutputParserException(
                     f"{FINAL_ANSWER_AND_PARSABLE_ACTION_ERROR_MESSAGE}: {text}"
                 )
-            action = action_match.group(1).strip()
-            action_input = action_match.group(2)
-            tool_input = action_input.strip(" ")
-            tool_input = tool_input.strip('"')
-            return AgentAction(action, tool_input, text)
+            actions = self._parse_actions(text) if self.parallel_tool_calls else None
+            if actions:
+                return actions
+            return self._action(action_match, text)
 
         elif includes_answer:
             return AgentFinish(
@@ -87,3 +99,154 @@ class CrewAgentParser(ReActSingleInputOutputParser):
                 llm_output=text,
                 send_to_llm=True,
             )
+
+    def _parse_actions(self, text: str) -> Optional[List[AgentAction]]:
+        """Parse every action of an output taking several of them at once.
+
+        Only numbered actions are split, so an output where the LLM went on with the
+        observation and a new action on its own is still a single action. The log of
+        the first action holds the thought before it, the log of the others only
+        their own lines. Returns None for a single action.
+        """
+        starts = [match.start() for match in NUMBERED_ACTION_START_REGEX.finditer(text)]
+        if len(starts) < 2:
+            return None
+
+        actions = []
+        for index, start in enumerate(starts):
+            end = starts[index + 1] if index + 1 < len(starts) else len(text)
+            action_match = re.search(ACTION_REGEX, text[start:end].rstrip(), re.DOTALL)
+            if not action_match:
+                return None
+            log = text[0 if index == 0 else start : end].rstrip()
+            actions.append(self._action(action_match, log))
+        return actions
+
+    @staticmethod
+    def _action(action_match: re.Match, log: str) -> AgentAction:
+        action = action_match.group(1).strip()
+        action_input = action_match.group(2)
+        tool_input = action_input.strip(" ")
+        tool_input = tool_input.strip('"')
+        return AgentAction(action, tool_input, log)
+
+
+class CrewAgentToolCallParser(MultiActionAgentOutputParser):
+    """Parses the native tool calls of chat models.
+
+    Every tool call of the message becomes an AgentAction with its arguments
+    already parsed, and a message without tool calls is the final answer.
+    """
+
+    _i18n: I18N = I18N()
+    agent: Any = None
+
+    def parse_result(
+        self, result: List[Generation], *, partial: bool = False
+    ) -> Union[List[AgentAction], AgentFinish]:
+        if not isinstance(result[0], ChatGeneration) or not isinstance(
+            result[0].message, AIMessage
+        ):
+            raise ValueError("This output parser only works on chat model messages.")
+        message = result[0].message
+        content = message.content if isinstance(message.content, str) else ""
+
+        if message.invalid_tool_calls:
+            if self.agent:
+                self.agent.increment_formatting_errors()
+            error = self._i18n.errors("tool_arguments_error")
+            raise OutputParserException(
+                error, observation=error, llm_output=content, send_to_llm=True
+            )
+
+        if not message.tool_calls:
+            return AgentFinish(
+                {"output": content.split(FINAL_ANSWER_ACTION)[-1].strip()}, content
+            )
+
+        actions = []
+        thought = f"Thought: {content.strip()}\n" if content.strip() else ""
+        for tool_call in message.tool_calls:
+            name, args = tool_call["name"], tool_call["args"]
+            log = f"{thought}Invoking: `{name}` with `{json.dumps(args)}`"
+            actions.append(AgentAction(name, args, log))
+            thought = ""
+        return actions
+
+    def parse(self, text: str) -> Union[List[AgentAction], AgentFinish]:
+        raise ValueError("Can only parse messages.")
+
+
+class CrewAgentStreamParser:
+    """Incrementally parses the output of the LLM as it's streamed, to tell when
+    the rest of it can be skipped.
+
+    The output is complete once the JSON object of the `Action Input:` closes, or
+    once the LLM starts writing the observation of its action on its own. When the
+    agent can take several actions at once, only the observation completes it.
+    """
+
+    ACTION_INPUT_REGEX = re.compile(r"Action\s*\d*\s*Input\s*\d*\s*:")
+
+    def __init__(self, stop: str = "\nObservation", multiple_actions: bool = False):
+        self.stop = stop
+        self.text = ""
+        self.complete = False
+        # Position up to which the action input was scanned, once it's found.
+        self._scanned: Union[int, None] = None
+        self._json_input = not multiple_actions
+        self._depth = 0
+        # Quote of the string being scanned, LLMs quote strings either way.
+        self._quote: Union[str, None] = None
+        self._escaped = False
+
+    def feed(self, token: str) -> bool:
+        """Adds a token to the output and returns whether the output is complete."""
+        start = max(0, len(self.text) - len(self.stop))
+        self.text += token
+
+        stop_index = self.text.find(self.stop, start)
+        if stop_index != -1:
+            self.text = self.text[:stop_index]
+            self.complete = True
+            return True
+
+        if self._scanned is None:
+            # Only the end of the output can hold a new match.
+            match = self.ACTION_INPUT_REGEX.search(self.text, max(0, start - 40))
+            if match:
+                self._scanned = match.end()
+        if self._scanned is not None and self._json_input:
+            self._scan_action_input()
+        return self.complete
+
+    def _scan_action_input(self) -> None:
+        """Scans the new characters of the action input, until its JSON object closes."""
+        for index in range(self._scanned, len(self.text)):
+            char = self.text[index]
+            if self._depth == 0:
+                if char.isspace():
+                    continue
+                if char != "{":
+                    # Not a JSON object, only the observation ends it.
+                    self._json_input = False
+                    return
+                self._depth = 1
+            elif self._quote:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == self._quote:
+                    self._quote = None
+            elif char in "\"'":
+                self._quote = char
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.text = self.text[: index + 1]
+                    self.complete = True
+                    return
+        self._scanned = len(self.text)
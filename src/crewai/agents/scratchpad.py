@@ -0,0 +1,99 @@
+from typing import List, Tuple
+
+from langchain_core.agents import AgentAction
+
+from crewai.utilities.token_budget import count_tokens, keep_first_tokens
+
+
+class Scratchpad:
+    """Append-only scratchpad that lets the agent continue its thought process.
+
+    Only the steps added since the last update are formatted, and the token count
+    of every step is computed once. When the scratchpad grows past its token
+    budget, it can be compacted by dropping its oldest observations.
+    """
+
+    def __init__(self, observation_prefix: str = "Observation: ", llm_prefix: str = ""):
+        self.observation_prefix = observation_prefix
+        self.llm_prefix = llm_prefix
+        self._reset()
+
+    def _reset(self) -> None:
+        self.text = ""
+        self.delta = ""
+        self._steps: List[Tuple[AgentAction, str]] = []
+        self._step_texts: List[str] = []
+        self._step_tokens: List[int] = []
+        self._compacted = 0
+
+    def update(self, intermediate_steps: List[Tuple[AgentAction, str]]) -> str:
+        """Add the new intermediate steps to the scratchpad and return its text."""
+        known = len(self._steps)
+        if len(intermediate_steps) < known or (
+            known and intermediate_steps[known - 1] is not self._steps[-1]
+        ):
+            # The steps were changed rather than added to, start over.
+            self._reset()
+            known = 0
+
+        new_texts = [
+            self._format(action, observation)
+            for action, observation in intermediate_steps[known:]
+        ]
+        self._steps.extend(intermediate_steps[known:])
+        self._step_texts.extend(new_texts)
+        self.delta = "".join(new_texts)
+        self.text += self.delta
+        return self.text
+
+    def step_tokens(self) -> List[int]:
+        """Returns the number of tokens of every step, counting only the new ones."""
+        for text in self._step_texts[len(self._step_tokens) :]:
+            self._step_tokens.append(count_tokens(text))
+        return self._step_tokens
+
+    def tokens(self) -> int:
+        """Returns the number of tokens of the scratchpad."""
+        return sum(self.step_tokens())
+
+    def compact(self, max_tokens: int, placeholder: str) -> str:
+        """Fit the scratchpad in max_tokens and return its text.
+
+        The observations of the oldest steps are replaced by the placeholder until
+        it fits, and if it still doesn't the observation of the latest step is
+        truncated. Compacted steps stay compacted, so each one is only compacted once.
+        """
+        step_tokens = self.step_tokens()
+        total = sum(step_tokens)
+        if total <= max_tokens:
+            return self.text
+
+        last = len(self._steps) - 1
+        while total > max_tokens and self._compacted < last:
+            action, _ = self._steps[self._compacted]
+            total += self._replace_step(self._compacted, action, placeholder)
+            self._compacted += 1
+
+        if total > max_tokens:
+            action, observation = self._steps[last]
+            room = max_tokens - (total - step_tokens[last])
+            room -= count_tokens(self._format(action, placeholder))
+            total += self._replace_step(
+                last, action, f"{keep_first_tokens(observation, room)}\n{placeholder}"
+            )
+
+        self.text = "".join(self._step_texts)
+        return self.text
+
+    def _replace_step(self, index: int, action: AgentAction, observation: str) -> int:
+        """Replace the observation of a step and returns how its token count changed."""
+        text = self._format(action, observation)
+        tokens = count_tokens(text)
+        change = tokens - self._step_tokens[index]
+        self._step_texts[index] = text
+        self._step_tokens[index] = tokens
+        return change
+
+    def _format(self, action: AgentAction, observation: str) -> str:
+        prefix = self.observation_prefix
+        return f"{action.log}\n{prefix}{observation}\n{self.llm_prefix}"
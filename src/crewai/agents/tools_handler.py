@@ -30,3 +30,12 @@ class ToolsHandler:
                 input=calling.arguments,
                 output=output,
             )
+
+    def on_tool_error(
+        self, calling: Union[ToolCalling, InstructorToolCalling], error: str
+    ) -> Any:
+        """Run when the tool keeps failing."""
+        if self.cache and calling.tool_name != CacheTools().name:
+            self.cache.add_error(
+                tool=calling.tool_name, input=calling.arguments, error=error
+            )
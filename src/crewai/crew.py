@@ -1,6 +1,32 @@
+import asyncio
+import hashlib
 import json
+import os
+import queue
+import threading
 import uuid
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import asynccontextmanager, contextmanager
+from functools import partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 from langchain_core.callbacks import BaseCallbackHandler
 from pydantic import (
@@ -17,15 +43,26 @@ from pydantic import (
 from pydantic_core import PydanticCustomError
 
 from crewai.agent import Agent
-from crewai.agents.cache import CacheHandler
+from crewai.agents.cache import CacheHandler, SQLiteCacheHandler
 from crewai.memory.entity.entity_memory import EntityMemory
 from crewai.memory.long_term.long_term_memory import LongTermMemory
 from crewai.memory.short_term.short_term_memory import ShortTermMemory
 from crewai.process import Process
 from crewai.task import Task
+from crewai.tasks.task_output import TaskOutput
 from crewai.telemetry import Telemetry
 from crewai.tools.agent_tools import AgentTools
-from crewai.utilities import I18N, FileHandler, Logger, RPMController
+from crewai.utilities import (
+    I18N,
+    CrewEvent,
+    CrewEventType,
+    FileHandler,
+    Logger,
+    RPMController,
+)
+from crewai.utilities.checkpoint_storage import CheckpointSQLiteStorage
+from crewai.utilities.rpm_controller import SQLiteRPMController
+from crewai.utilities.semantic_cache import SemanticCache
 
 
 class Crew(BaseModel):
@@ -41,16 +78,25 @@ class Crew(BaseModel):
         manager_callbacks: The callback handlers to be executed by the manager agent when hierarchical process is used
         cache: Whether the crew should use a cache to store the results of the tools execution.
         function_calling_llm: The language model that will run the tool calling for all the agents.
-        process: The process flow that the crew will follow (e.g., sequential, hierarchical).
+        process: The process flow that the crew will follow (e.g., sequential, hierarchical, graph).
         verbose: Indicates the verbosity level for logging during execution.
         config: Configuration settings for the crew.
         max_rpm: Maximum number of requests per minute for the crew execution to be respected.
+        max_tpm: Maximum number of tokens per minute for the crew execution to be respected.
+        share_rate_limits: Whether max_rpm and max_tpm are shared with the crews of the other processes using the same storage.
         prompt_file: Path to the prompt json file to be used for the crew.
         id: A unique identifier for the crew instance.
         full_output: Whether the crew should return the full output with all tasks outputs or just the final output.
         task_callback: Callback to be executed after each task for every agents execution.
         step_callback: Callback to be executed after each step for every agents execution.
         share_crew: Whether you want to share the complete crew infromation and execution with crewAI to make the library better, and allow us to train models.
+        max_concurrency: Maximum number of tasks running at the same time, either asynchronous tasks or the tasks of the graph process, and of co-workers the manager delegates to at the same time in the hierarchical process.
+        concurrent_delegation: Whether the manager can delegate work to several co-workers at the same time in the hierarchical process.
+        checkpoint: Whether the crew should save the output of every completed task so a failed execution can be resumed.
+        semantic_cache: Whether the agents should reuse the results of tasks whose prompts are similar to ones they already executed.
+        semantic_cache_threshold: Minimum similarity between two task prompts for them to share a result.
+        cache_handler: Cache for the results of the tools, a default one is used when it's not set.
+        persistent_cache: Whether the default cache stores the results of the tools on disk, sharing them with later executions and other processes.
     """
 
     __hash__ = object.__hash__  # type: ignore
@@ -58,12 +104,29 @@ class Crew(BaseModel):
     _rpm_controller: RPMController = PrivateAttr()
     _logger: Logger = PrivateAttr()
     _file_handler: FileHandler = PrivateAttr()
-    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default=CacheHandler())
+    _cache_handler: InstanceOf[CacheHandler] = PrivateAttr(default_factory=CacheHandler)
     _short_term_memory: Optional[InstanceOf[ShortTermMemory]] = PrivateAttr()
     _long_term_memory: Optional[InstanceOf[LongTermMemory]] = PrivateAttr()
     _entity_memory: Optional[InstanceOf[EntityMemory]] = PrivateAttr()
+    _semantic_cache: Optional[SemanticCache] = PrivateAttr(default=None)
+    _checkpoint_storage: Optional[CheckpointSQLiteStorage] = PrivateAttr(default=None)
+    _checkpoint_key: Optional[Tuple[str, str]] = PrivateAttr(default=None)
+    _resumed_tasks: Set[Task] = PrivateAttr(default_factory=set)
+    _event_sink: Optional[Callable[[CrewEvent], None]] = PrivateAttr(default=None)
+    _i18n: Optional[I18N] = PrivateAttr(default=None)
+    _delegation_tools: Dict[Tuple[Agent, ...], List[Any]] = PrivateAttr(
+        default_factory=dict
+    )
 
     cache: bool = Field(default=True)
+    cache_handler: Optional[InstanceOf[CacheHandler]] = Field(
+        default=None,
+        description="Cache for the results of the tools, a default one is used when it's not set.",
+    )
+    persistent_cache: bool = Field(
+        default=False,
+        description="Whether the default cache stores the results of the tools on disk, sharing them with later executions and other processes.",
+    )
     model_config = ConfigDict(arbitrary_types_allowed=True)
     tasks: List[Task] = Field(default_factory=list)
     agents: List[Agent] = Field(default_factory=list)
@@ -113,6 +176,14 @@ class Crew(BaseModel):
         default=None,
         description="Maximum number of requests per minute for the crew execution to be respected.",
     )
+    max_tpm: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tokens per minute for the crew execution to be respected.",
+    )
+    share_rate_limits: bool = Field(
+        default=False,
+        description="Whether max_rpm and max_tpm are shared with the crews of the other processes using the same storage.",
+    )
     prompt_file: str = Field(
         default=None,
         description="Path to the prompt json file to be used for the crew.",
@@ -121,6 +192,26 @@ class Crew(BaseModel):
         default=False,
         description="output_log_file",
     )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        description="Maximum number of tasks running at the same time, either asynchronous tasks or the tasks of the graph process, and of co-workers the manager delegates to at the same time in the hierarchical process.",
+    )
+    concurrent_delegation: bool = Field(
+        default=False,
+        description="Whether the manager can delegate work to several co-workers at the same time in the hierarchical process.",
+    )
+    checkpoint: bool = Field(
+        default=False,
+        description="Whether the crew should save the output of every completed task so a failed execution can be resumed.",
+    )
+    semantic_cache: bool = Field(
+        default=False,
+        description="Whether the agents should reuse the results of tasks whose prompts are similar to ones they already executed.",
+    )
+    semantic_cache_threshold: float = Field(
+        default=0.95,
+        description="Minimum similarity between two task prompts for them to share a result.",
+    )
 
     @field_validator("id", mode="before")
     @classmethod
@@ -149,11 +240,19 @@ class Crew(BaseModel):
     @model_validator(mode="after")
     def set_private_attrs(self) -> "Crew":
         """Set private attributes."""
-        self._cache_handler = CacheHandler()
+        cache_handler_class = (
+            SQLiteCacheHandler if self.persistent_cache else CacheHandler
+        )
+        self._cache_handler = self.cache_handler or cache_handler_class()
         self._logger = Logger(self.verbose)
         if self.output_log_file:
             self._file_handler = FileHandler(self.output_log_file)
-        self._rpm_controller = RPMController(max_rpm=self.max_rpm, logger=self._logger)
+        rpm_controller_class = (
+            SQLiteRPMController if self.share_rate_limits else RPMController
+        )
+        self._rpm_controller = rpm_controller_class(
+            max_rpm=self.max_rpm, max_tpm=self.max_tpm, logger=self._logger
+        )
         self._telemetry = Telemetry()
         self._telemetry.set_tracer()
         self._telemetry.crew_creation(self)
@@ -166,6 +265,11 @@ class Crew(BaseModel):
             self._long_term_memory = LongTermMemory()
             self._short_term_memory = ShortTermMemory(embedder_config=self.embedder)
             self._entity_memory = EntityMemory(embedder_config=self.embedder)
+        if self.semantic_cache:
+            self._semantic_cache = SemanticCache(
+                embedder_config=self.embedder,
+                threshold=self.semantic_cache_threshold,
+            )
         return self
 
     @model_validator(mode="after")
@@ -207,10 +311,31 @@ class Crew(BaseModel):
             for agent in self.agents:
                 if self.cache:
                     agent.set_cache_handler(self._cache_handler)
-                if self.max_rpm:
+                if self.max_rpm or self.max_tpm:
                     agent.set_rpm_controller(self._rpm_controller)
         return self
 
+    @model_validator(mode="after")
+    def check_tasks_graph(self):
+        """Validates that the tasks context doesn't have cycles when using graph process."""
+        if self.process == Process.graph:
+            dependencies = self._tasks_dependencies()
+            resolved: Set[Task] = set()
+            while len(resolved) < len(self.tasks):
+                ready = [
+                    task
+                    for task in self.tasks
+                    if task not in resolved and dependencies[task] <= resolved
+                ]
+                if not ready:
+                    raise PydanticCustomError(
+                        "cyclic_task_context",
+                        "Tasks context can't have cycles when using graph process.",
+                        {},
+                    )
+                resolved.update(ready)
+        return self
+
     def _setup_from_config(self):
         assert self.config is not None, "Config should not be None."
 
@@ -239,125 +364,719 @@ class Crew(BaseModel):
         del task_config["agent"]
         return Task(**task_config, agent=task_agent)
 
-    def kickoff(self, inputs: Optional[Dict[str, Any]] = {}) -> str:
-        """Starts the crew to work on its assigned tasks."""
-        self._execution_span = self._telemetry.crew_execution_span(self)
-        self._interpolate_inputs(inputs)
-        self._set_tasks_callbacks()
+    def kickoff(
+        self, inputs: Optional[Dict[str, Any]] = {}, resume: bool = False
+    ) -> str:
+        """Starts the crew to work on its assigned tasks.
 
-        i18n = I18N(prompt_file=self.prompt_file)
+        Args:
+            inputs: Inputs to interpolate into the tasks and agents.
+            resume: Whether to skip the tasks completed by a previous execution with
+                the same inputs, using their saved outputs instead.
+        """
+        self._prepare_kickoff(inputs, resume)
 
-        for agent in self.agents:
-            agent.i18n = i18n
-            agent.crew = self
+        metrics = []
 
-            if not agent.function_calling_llm:
-                agent.function_calling_llm = self.function_calling_llm
-            if not agent.step_callback:
-                agent.step_callback = self.step_callback
+        if self.process == Process.sequential:
+            result = self._run_sequential_process()
+        elif self.process == Process.hierarchical:
+            result, manager_metrics = self._run_hierarchical_process()
+            metrics.append(manager_metrics)
+        elif self.process == Process.graph:
+            result = self._run_graph_process()
 
-            agent.create_agent_executor()
+        else:
+            raise NotImplementedError(
+                f"The process '{self.process}' is not implemented yet."
+            )
+
+        self._set_usage_metrics(metrics)
+        self._emit_event(CrewEventType.crew_finished, data=result)
+
+        return result
+
+    async def kickoff_async(
+        self, inputs: Optional[Dict[str, Any]] = {}, resume: bool = False
+    ) -> str:
+        """Starts the crew to work on its assigned tasks without blocking the event loop."""
+        self._prepare_kickoff(inputs, resume)
 
         metrics = []
 
         if self.process == Process.sequential:
-            result = self._run_sequential_process()
+            result = await self._arun_sequential_process()
         elif self.process == Process.hierarchical:
-            result, manager_metrics = self._run_hierarchical_process()
+            result, manager_metrics = await self._arun_hierarchical_process()
             metrics.append(manager_metrics)
+        elif self.process == Process.graph:
+            result = await self._arun_graph_process()
 
         else:
             raise NotImplementedError(
                 f"The process '{self.process}' is not implemented yet."
             )
 
+        self._set_usage_metrics(metrics)
+        self._emit_event(CrewEventType.crew_finished, data=result)
+
+        return result
+
+    def kickoff_stream(
+        self, inputs: Optional[Dict[str, Any]] = {}, resume: bool = False
+    ) -> Iterator[CrewEvent]:
+        """Starts the crew and yields the events of its execution as they happen.
+
+        The crew runs in a separate thread, the last event yielded is the crew_finished
+        one, holding the same result `kickoff` returns. Tokens are only streamed by
+        LLMs created with streaming enabled.
+
+        Args:
+            inputs: Inputs to interpolate into the tasks and agents.
+            resume: Whether to skip the tasks completed by a previous execution.
+
+        Returns:
+            An iterator over the events of the execution.
+        """
+        events: queue.Queue = queue.Queue()
+
+        def run() -> None:
+            try:
+                self.kickoff(inputs, resume)
+            except Exception as e:
+                events.put(e)
+
+        self._event_sink = events.put
+        thread = threading.Thread(target=run)
+        thread.start()
+        try:
+            while True:
+                event = events.get()
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+                if event.type == CrewEventType.crew_finished:
+                    break
+        finally:
+            self._event_sink = None
+        thread.join()
+
+    async def kickoff_stream_async(
+        self, inputs: Optional[Dict[str, Any]] = {}, resume: bool = False
+    ) -> AsyncIterator[CrewEvent]:
+        """Async version of `kickoff_stream`, running the crew with `kickoff_async`."""
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+
+        async def run() -> None:
+            try:
+                await self.kickoff_async(inputs, resume)
+            except Exception as e:
+                events.put_nowait(e)
+
+        self._event_sink = lambda event: loop.call_soon_threadsafe(
+            events.put_nowait, event
+        )
+        execution = asyncio.create_task(run())
+        try:
+            while True:
+                event = await events.get()
+                if isinstance(event, Exception):
+                    raise event
+                yield event
+                if event.type == CrewEventType.crew_finished:
+                    break
+        finally:
+            self._event_sink = None
+        await execution
+
+    def _emit_event(
+        self,
+        type: CrewEventType,
+        agent: Optional[Agent] = None,
+        task: Optional[Task] = None,
+        data: Any = None,
+    ) -> None:
+        """Sends an event to the stream consuming the execution, if there is one."""
+        if self._event_sink:
+            self._event_sink(
+                CrewEvent(
+                    type=type,
+                    agent=agent.role if agent else None,
+                    task=task.description if task else None,
+                    data=data,
+                )
+            )
+
+    def kickoff_for_each(
+        self,
+        inputs: Iterable[Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        """Runs a copy of the crew for each of the inputs, several of them at the same time.
+
+        Every run works on its own copy of the agents and tasks, while the cache handler,
+        the RPM controller, the memories and the LLMs of the crew are shared among them.
+        Each copy reports the usage metrics of its own run, and the crew the total of
+        every run.
+
+        Args:
+            inputs: Inputs to interpolate into the tasks and agents of each run.
+            max_concurrency: Maximum number of runs at the same time.
+            ordered: Whether to yield the results in the order of the inputs or as soon as
+                each run completes, in which case (index, result) tuples are yielded.
+
+        Returns:
+            An iterator over the result of each run.
+        """
+        max_concurrency = max_concurrency or min(32, (os.cpu_count() or 1) + 4)
+        # Index of the input and copy of the crew of every run, in the inputs order.
+        running: Dict[Future, Tuple[int, "Crew"]] = {}
+        metrics: List[Dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=max_concurrency) as pool:
+            for index, input_data in enumerate(inputs):
+                if len(running) >= max_concurrency:
+                    yield self._next_completed_run(running, metrics, ordered)
+                crew = self.copy()
+                running[pool.submit(crew.kickoff, inputs=input_data)] = (index, crew)
+
+            while running:
+                yield self._next_completed_run(running, metrics, ordered)
+
+        self._set_usage_metrics(metrics)
+
+    def _next_completed_run(
+        self,
+        running: Dict[Future, Tuple[int, "Crew"]],
+        metrics: List[Dict[str, Any]],
+        ordered: bool,
+    ) -> Any:
+        """Waits for the next run of kickoff_for_each and returns its result, adding
+        the LLM usage of the agents of its crew to the metrics."""
+        if ordered:
+            future = next(iter(running))
+            wait([future])
+        else:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            future = next(iter(done))
+
+        index, crew = running.pop(future)
+        metrics.extend(agent._token_process.get_summary() for agent in crew.agents)
+        if ordered:
+            return future.result()
+        return index, future.result()
+
+    def copy(self) -> "Crew":
+        """Creates a copy of the crew that can run independently from it.
+
+        Agents and tasks are copied so each copy has its own execution state, while
+        the cache handler, the RPM controller, the memories, the telemetry and the
+        LLMs are shared. The copy skips validation, so a crew can be built once and
+        copied for every execution.
+
+        Returns:
+            A new Crew instance.
+        """
+        agents = {agent: agent.copy() for agent in self.agents}
+        tasks = {
+            task: task.copy(agent=agents.get(task.agent, task.agent))
+            for task in self.tasks
+        }
+        for task, copied_task in tasks.items():
+            if task.context:
+                copied_task.context = [
+                    tasks.get(context_task, context_task)
+                    for context_task in task.context
+                ]
+
+        copied_crew = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "agents": list(agents.values()),
+                "tasks": list(tasks.values()),
+                "manager_agent": (
+                    self.manager_agent.copy() if self.manager_agent else None
+                ),
+                "usage_metrics": None,
+            }
+        )
+        copied_crew._delegation_tools = {}
+        return copied_crew
+
+    def _prepare_kickoff(
+        self, inputs: Optional[Dict[str, Any]], resume: bool = False
+    ) -> None:
+        """Interpolates the inputs and sets the agents up for the execution."""
+        self._execution_span = self._telemetry.crew_execution_span(self)
+        self._interpolate_inputs(inputs)
+        self._set_tasks_callbacks()
+        self._set_tasks_checkpoints(inputs, resume)
+
+        if self._i18n is None or self._i18n.prompt_file != self.prompt_file:
+            self._i18n = I18N(prompt_file=self.prompt_file)
+
+        for agent in self.agents:
+            agent.i18n = self._i18n
+            agent.crew = self
+
+            if not agent.function_calling_llm:
+                agent.function_calling_llm = self.function_calling_llm
+            if not agent.step_callback:
+                agent.step_callback = self.step_callback
+
+            agent.create_agent_executor()
+
+    def _set_usage_metrics(self, metrics: List[Dict[str, Any]]) -> None:
+        """Sums up the LLM usage of the manager and every agent of the crew, along with
+        the usage of the tools cache and the tool calls that timed out."""
         metrics = metrics + [
             agent._token_process.get_summary() for agent in self.agents
         ]
         self.usage_metrics = {
             key: sum([m[key] for m in metrics if m is not None]) for key in metrics[0]
         }
+        self.usage_metrics.update(self._cache_handler.get_summary())
+        self.usage_metrics["tool_timeouts"] = sum(
+            task.tools_timeouts for task in self.tasks
+        )
 
-        return result
+    def _set_tasks_checkpoints(
+        self, inputs: Optional[Dict[str, Any]], resume: bool
+    ) -> None:
+        """Restores the tasks completed by a previous execution and makes the tasks save their outputs."""
+        self._resumed_tasks = set()
+        self._checkpoint_key = None
+        if self.checkpoint or resume:
+            if self._checkpoint_storage is None:
+                self._checkpoint_storage = CheckpointSQLiteStorage()
+            self._checkpoint_key = self._execution_key(inputs)
+
+        if resume:
+            checkpoints = self._checkpoint_storage.load(*self._checkpoint_key)
+            for index, data in checkpoints.items():
+                if index < len(self.tasks):
+                    self._restore_task_output(self.tasks[index], data)
+
+        for index, task in enumerate(self.tasks):
+            task._output_callback = partial(self._task_completed, index)
+
+    def _execution_key(self, inputs: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        """Returns the hashes identifying the crew definition and the inputs of an execution.
+
+        The crew id is random for every instance, so the crew is identified by its
+        agents and tasks instead, allowing a new process to resume the execution.
+        """
+        crew_definition = {
+            "process": self.process,
+            "agents": [
+                [
+                    agent._original_role or agent.role,
+                    agent._original_goal or agent.goal,
+                    agent._original_backstory or agent.backstory,
+                ]
+                for agent in self.agents
+            ],
+            "tasks": [
+                [
+                    task._original_description or task.description,
+                    task._original_expected_output or task.expected_output,
+                ]
+                for task in self.tasks
+            ],
+        }
+        crew_key = hashlib.sha256(
+            json.dumps(crew_definition, sort_keys=True).encode()
+        ).hexdigest()
+        inputs_hash = hashlib.sha256(
+            json.dumps(inputs or {}, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return crew_key, inputs_hash
+
+    def _task_completed(self, task_index: int, task: Task) -> None:
+        """Saves the checkpoint of a completed task and emits its output."""
+        if self._checkpoint_key:
+            self._save_checkpoint(task_index, task)
+        self._emit_event(
+            CrewEventType.task_finished, agent=task.agent, task=task, data=task.output
+        )
+
+    def _save_checkpoint(self, task_index: int, task: Task) -> None:
+        """Saves the output of a completed task and the context it was executed with."""
+        exported_output = task.output.exported_output
+        if isinstance(exported_output, BaseModel):
+            exported_output = exported_output.model_dump(mode="json")
+
+        self._checkpoint_storage.save(
+            *self._checkpoint_key,
+            task_index,
+            {
+                "description": task.output.description,
+                "raw_output": task.output.raw_output,
+                "exported_output": exported_output,
+                "context": task.prompt_context,
+            },
+        )
+
+    def _restore_task_output(self, task: Task, data: Dict[str, Any]) -> None:
+        """Sets the output saved by a previous execution on the task."""
+        exported_output = data["exported_output"]
+        if task.output_pydantic and isinstance(exported_output, dict):
+            exported_output = task.output_pydantic.model_validate(exported_output)
+
+        task.output = TaskOutput(
+            description=data["description"],
+            raw_output=data["raw_output"],
+            exported_output=exported_output,
+        )
+        task.prompt_context = data["context"]
+        self._resumed_tasks.add(task)
 
     def _run_sequential_process(self) -> str:
         """Executes tasks sequentially and returns the final output."""
         task_output = ""
-        for task in self.tasks:
-            if task.agent.allow_delegation:
-                agents_for_delegation = [
-                    agent for agent in self.agents if agent != task.agent
-                ]
-                if len(self.agents) > 1 and len(agents_for_delegation) > 0:
-                    task.tools += AgentTools(agents=agents_for_delegation).tools()
+        with self._async_tasks() as executor:
+            for task in self.tasks:
+                if task in self._resumed_tasks:
+                    if not task.async_execution:
+                        task_output = task.output.exported_output
+                    self._log_task_resumed(task)
+                    continue
 
-            role = task.agent.role if task.agent is not None else "None"
-            self._logger.log("debug", f"== Working Agent: {role}", color="bold_purple")
-            self._logger.log(
-                "info", f"== Starting Task: {task.description}", color="bold_purple"
-            )
+                self._log_task_start(task)
 
-            if self.output_log_file:
-                self._file_handler.log(
-                    agent=role, task=task.description, status="started"
+                output = task.execute(
+                    context=task_output,
+                    tools=self._task_tools(task),
+                    executor=executor,
                 )
+                if not task.async_execution:
+                    task_output = output
 
-            output = task.execute(context=task_output)
-            if not task.async_execution:
-                task_output = output
+                self._log_task_output(task, task_output)
 
-            role = task.agent.role if task.agent is not None else "None"
-            self._logger.log("debug", f"== [{role}] Task output: {task_output}\n\n")
+        self._finish_execution(task_output)
+        return self._format_output(task_output)
+
+    async def _arun_sequential_process(self) -> str:
+        """Executes tasks sequentially without blocking the event loop."""
+        task_output = ""
+        async with self._aasync_tasks():
+            for task in self.tasks:
+                if task in self._resumed_tasks:
+                    if not task.async_execution:
+                        task_output = task.output.exported_output
+                    self._log_task_resumed(task)
+                    continue
+
+                self._log_task_start(task)
+
+                output = await task.execute_async(
+                    context=task_output, tools=self._task_tools(task)
+                )
+                if not task.async_execution:
+                    task_output = output
+
+                self._log_task_output(task, task_output)
+
+        self._finish_execution(task_output)
+        return self._format_output(task_output)
+
+    def _run_graph_process(self) -> str:
+        """Executes every task as soon as the tasks in its context are completed."""
+        dependencies = self._tasks_dependencies()
+        pending = [task for task in self.tasks if task not in self._resumed_tasks]
+        completed: Set[Task] = set(self._resumed_tasks)
+        running = {}
+
+        with self._async_tasks() as executor, ThreadPoolExecutor(
+            max_workers=self.max_concurrency
+        ) as pool:
+            while pending or running:
+                ready = [task for task in pending if dependencies[task] <= completed]
+                pending = [
+                    task for task in pending if not dependencies[task] <= completed
+                ]
+                for task in ready:
+                    future = pool.submit(self._execute_graph_task, task, executor)
+                    running[future] = task
 
-            if self.output_log_file:
-                self._file_handler.log(agent=role, task=task_output, status="completed")
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    if future.exception():
+                        for pending_future in running:
+                            pending_future.cancel()
+                        raise future.exception()
+                    completed.add(task)
 
+        task_output = self._graph_output()
         self._finish_execution(task_output)
         return self._format_output(task_output)
 
+    async def _arun_graph_process(self) -> str:
+        """Executes the graph process as coroutines, bounded by max_concurrency."""
+        dependencies = self._tasks_dependencies()
+        semaphore = asyncio.Semaphore(self.max_concurrency or len(self.tasks) or 1)
+        pending = [task for task in self.tasks if task not in self._resumed_tasks]
+        completed: Set[Task] = set(self._resumed_tasks)
+        running = {}
+
+        async def execute_graph_task(task: Task) -> str:
+            async with semaphore:
+                return await self._aexecute_graph_task(task)
+
+        while pending or running:
+            ready = [task for task in pending if dependencies[task] <= completed]
+            pending = [task for task in pending if not dependencies[task] <= completed]
+            for task in ready:
+                running[asyncio.create_task(execute_graph_task(task))] = task
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                task = running.pop(future)
+                if future.exception():
+                    for pending_future in running:
+                        pending_future.cancel()
+                    raise future.exception()
+                completed.add(task)
+
+        task_output = self._graph_output()
+        self._finish_execution(task_output)
+        return self._format_output(task_output)
+
+    def _graph_output(self) -> Any:
+        """Returns the output of the tasks that no other task uses as context.
+
+        A single one gives its exported output, several of them give their raw
+        outputs joined in the order of the tasks.
+        """
+        context_tasks = set().union(*self._tasks_dependencies().values())
+        sinks = [task for task in self.tasks if task not in context_tasks]
+        if len(sinks) == 1:
+            return sinks[0].output.exported_output
+        return "\n".join(task.output.raw_output for task in sinks)
+
+    def _execute_graph_task(self, task: Task, executor: Executor) -> str:
+        """Executes a single task of the graph process, using only its context as input."""
+        self._log_task_start(task)
+
+        task.execute(tools=self._task_tools(task), executor=executor)
+        if task.async_execution:
+            task.future.result()
+        task_output = task.output.exported_output
+
+        self._log_task_output(task, task_output)
+        return task_output
+
+    async def _aexecute_graph_task(self, task: Task) -> str:
+        """Async version of `_execute_graph_task`."""
+        self._log_task_start(task)
+
+        await task.execute_async(tools=self._task_tools(task))
+        if task.async_execution:
+            await task._async_task
+        task_output = task.output.exported_output
+
+        self._log_task_output(task, task_output)
+        return task_output
+
+    @contextmanager
+    def _async_tasks(self) -> Iterator[Executor]:
+        """Yields the pool running the asynchronous tasks of this execution, then waits
+        for them once every task was started, raising their errors.
+
+        If any task fails, the asynchronous tasks still waiting for a worker are cancelled.
+        The pool is shut down when the execution ends, so it doesn't outlive the kickoff.
+        """
+        with ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="crewai-task"
+        ) as executor:
+            try:
+                yield executor
+                for task in self.tasks:
+                    if task.async_execution and task.future:
+                        task.future.result()
+            except Exception:
+                for task in self.tasks:
+                    if task.future:
+                        task.future.cancel()
+                raise
+
+    @asynccontextmanager
+    async def _aasync_tasks(self) -> AsyncIterator[None]:
+        """Async version of `_async_tasks`, also cancelling the tasks when it is cancelled."""
+        try:
+            yield
+            await asyncio.gather(
+                *(
+                    task._async_task
+                    for task in self.tasks
+                    if task.async_execution and task._async_task
+                )
+            )
+        except BaseException:
+            for task in self.tasks:
+                if task._async_task:
+                    task._async_task.cancel()
+            raise
+
+    def _tasks_dependencies(self) -> Dict[Task, Set[Task]]:
+        """Maps every task to the crew tasks it uses as context."""
+        crew_tasks = set(self.tasks)
+        return {
+            task: {
+                context_task
+                for context_task in (task.context or [])
+                if context_task in crew_tasks
+            }
+            for task in self.tasks
+        }
+
+    def _task_tools(self, task: Task) -> List[Any]:
+        """Returns the task tools plus the ones to delegate work to the other agents in the crew."""
+        tools = list(task.tools)
+        if task.agent.allow_delegation:
+            agents_for_delegation = tuple(
+                agent for agent in self.agents if agent != task.agent
+            )
+            if len(self.agents) > 1 and len(agents_for_delegation) > 0:
+                # Reusing the same tools lets the agents reuse their executors.
+                if agents_for_delegation not in self._delegation_tools:
+                    self._delegation_tools[agents_for_delegation] = AgentTools(
+                        agents=list(agents_for_delegation)
+                    ).tools()
+                tools += self._delegation_tools[agents_for_delegation]
+        return tools
+
+    def _log_task_start(self, task: Task) -> None:
+        self._emit_event(CrewEventType.task_started, agent=task.agent, task=task)
+        role = task.agent.role if task.agent is not None else "None"
+        self._logger.log("debug", f"== Working Agent: {role}", color="bold_purple")
+        self._logger.log(
+            "info", f"== Starting Task: {task.description}", color="bold_purple"
+        )
+
+        if self.output_log_file:
+            self._file_handler.log(agent=role, task=task.description, status="started")
+
+    def _log_task_resumed(self, task: Task) -> None:
+        self._logger.log(
+            "info",
+            f"== Resuming Task from checkpoint: {task.description}",
+            color="bold_purple",
+        )
+        self._emit_event(
+            CrewEventType.task_finished, agent=task.agent, task=task, data=task.output
+        )
+
+    def _log_task_output(self, task: Task, task_output: str) -> None:
+        role = task.agent.role if task.agent is not None else "None"
+        self._logger.log("debug", f"== [{role}] Task output: {task_output}\n\n")
+
+        if self.output_log_file:
+            self._file_handler.log(agent=role, task=task_output, status="completed")
+
     def _run_hierarchical_process(self) -> str:
         """Creates and assigns a manager agent to make sure the crew completes the tasks."""
+        manager = self._create_manager_agent()
+
+        task_output = ""
+        with self._async_tasks() as executor:
+            for task in self.tasks:
+                if task in self._resumed_tasks:
+                    if not task.async_execution:
+                        task_output = task.output.exported_output
+                    self._log_task_resumed(task)
+                    continue
+
+                self._log_manager_task_start(manager, task)
 
+                output = task.execute(
+                    agent=manager,
+                    context=task_output,
+                    tools=manager.tools,
+                    executor=executor,
+                )
+                if not task.async_execution:
+                    task_output = output
+
+                self._log_manager_task_output(manager, task_output)
+
+        self._finish_execution(task_output)
+        return self._format_output(task_output), manager._token_process.get_summary()
+
+    async def _arun_hierarchical_process(self) -> str:
+        """Runs the hierarchical process without blocking the event loop."""
+        manager = self._create_manager_agent()
+
+        task_output = ""
+        async with self._aasync_tasks():
+            for task in self.tasks:
+                if task in self._resumed_tasks:
+                    if not task.async_execution:
+                        task_output = task.output.exported_output
+                    self._log_task_resumed(task)
+                    continue
+
+                self._log_manager_task_start(manager, task)
+
+                output = await task.execute_async(
+                    agent=manager, context=task_output, tools=manager.tools
+                )
+                if not task.async_execution:
+                    task_output = output
+
+                self._log_manager_task_output(manager, task_output)
+
+        self._finish_execution(task_output)
+        return self._format_output(task_output), manager._token_process.get_summary()
+
+    def _create_manager_agent(self) -> Agent:
+        """Returns the agent that will manage the crew in the hierarchical process."""
         i18n = I18N(prompt_file=self.prompt_file)
         if self.manager_agent is not None:
             self.manager_agent.allow_delegation = True
             manager = self.manager_agent
             if len(manager.tools) > 0:
                 raise Exception("Manager agent should not have tools")
-            manager.tools = AgentTools(agents=self.agents).tools()
+            manager.tools = self._manager_tools()
         else:
             manager = Agent(
                 role=i18n.retrieve("hierarchical_manager_agent", "role"),
                 goal=i18n.retrieve("hierarchical_manager_agent", "goal"),
                 backstory=i18n.retrieve("hierarchical_manager_agent", "backstory"),
-                tools=AgentTools(agents=self.agents).tools(),
+                tools=self._manager_tools(),
                 llm=self.manager_llm,
                 verbose=True,
             )
+        return manager
 
-        task_output = ""
-        for task in self.tasks:
-            self._logger.log("debug", f"Working Agent: {manager.role}")
-            self._logger.log("info", f"Starting Task: {task.description}")
+    def _manager_tools(self) -> List[Any]:
+        """Returns the tools the manager uses to delegate work, to several co-workers at the same time if concurrent_delegation is set."""
+        return AgentTools(
+            agents=self.agents,
+            concurrent_delegation=self.concurrent_delegation,
+            max_concurrency=self.max_concurrency,
+        ).tools()
 
-            if self.output_log_file:
-                self._file_handler.log(
-                    agent=manager.role, task=task.description, status="started"
-                )
+    def _log_manager_task_start(self, manager: Agent, task: Task) -> None:
+        self._emit_event(CrewEventType.task_started, agent=manager, task=task)
+        self._logger.log("debug", f"Working Agent: {manager.role}")
+        self._logger.log("info", f"Starting Task: {task.description}")
 
-            task_output = task.execute(
-                agent=manager, context=task_output, tools=manager.tools
+        if self.output_log_file:
+            self._file_handler.log(
+                agent=manager.role, task=task.description, status="started"
             )
 
-            self._logger.log("debug", f"[{manager.role}] Task output: {task_output}")
+    def _log_manager_task_output(self, manager: Agent, task_output: str) -> None:
+        self._logger.log("debug", f"[{manager.role}] Task output: {task_output}")
 
-            if self.output_log_file:
-                self._file_handler.log(
-                    agent=manager.role, task=task_output, status="completed"
-                )
-
-        self._finish_execution(task_output)
-        return self._format_output(task_output), manager._token_process.get_summary()
+        if self.output_log_file:
+            self._file_handler.log(
+                agent=manager.role, task=task_output, status="completed"
+            )
 
     def _set_tasks_callbacks(self) -> str:
         """Sets callback for every task suing task_callback"""
@@ -381,8 +1100,8 @@ class Crew(BaseModel):
             return output
 
     def _finish_execution(self, output) -> None:
-        if self.max_rpm:
-            self._rpm_controller.stop_rpm_counter()
+        if self._checkpoint_key:
+            self._checkpoint_storage.reset(*self._checkpoint_key)
         self._telemetry.end_crew(self, output)
 
     def __repr__(self):
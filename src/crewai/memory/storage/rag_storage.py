@@ -2,7 +2,7 @@ import contextlib
 import io
 import logging
 import os
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from embedchain import App
 from embedchain.llm.base import BaseLlm
@@ -72,8 +72,17 @@ class RAGStorage(Storage):
         if allow_reset:
             self.app.reset()
 
-    def save(self, value: Any, metadata: Dict[str, Any]) -> None:
-        self._generate_embedding(value, metadata)
+    def save(
+        self, value: Any, metadata: Dict[str, Any], key: Optional[str] = None
+    ) -> None:
+        """Saves the value, replacing the one saved with the same key if any.
+
+        Values saved with a key are stored as a single document, without chunking.
+        """
+        if key is None:
+            self._generate_embedding(value, metadata)
+        else:
+            self._upsert(key, value, metadata)
 
     def search(
         self,
@@ -97,3 +106,12 @@ class RAGStorage(Storage):
     def _generate_embedding(self, text: str, metadata: Dict[str, Any]) -> Any:
         with suppress_logging():
             self.app.add(text, data_type="text", metadata=metadata)
+
+    def _upsert(self, key: str, text: str, metadata: Dict[str, Any]) -> None:
+        # embedchain's App.add chunks the text and skips chunks it already has,
+        # so it can't replace a value. This is the only place writing to the
+        # chroma collection directly.
+        with suppress_logging():
+            self.app.db.collection.upsert(
+                documents=[text], metadatas=[metadata], ids=[key]
+            )
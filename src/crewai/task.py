@@ -1,11 +1,21 @@
+import asyncio
+import json
 import re
 import threading
 import uuid
-from typing import Any, Dict, List, Optional, Type
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Type, Union
 import os
 
 from langchain_openai import ChatOpenAI
-from pydantic import UUID4, BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    UUID4,
+    BaseModel,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
 from pydantic_core import PydanticCustomError
 
 from crewai.agent import Agent
@@ -22,6 +32,7 @@ class Task(BaseModel):
     Attributes:
         agent: Agent responsible for task execution. Represents entity performing task.
         async_execution: Boolean flag indicating asynchronous task execution.
+        future: Future of the output of the task, while it is executed asynchronously.
         callback: Function/object executed post task completion for additional actions.
         config: Dictionary containing task-specific configuration parameters.
         context: List of Task instances providing task context or input data.
@@ -39,9 +50,10 @@ class Task(BaseModel):
     __hash__ = object.__hash__  # type: ignore
     used_tools: int = 0
     tools_errors: int = 0
+    tools_timeouts: int = 0
     delegations: int = 0
     i18n: I18N = I18N()
-    thread: threading.Thread = None
+    future: Optional[Future] = None
     prompt_context: Optional[str] = None
     description: str = Field(description="Description of the actual task.")
     expected_output: str = Field(
@@ -96,6 +108,9 @@ class Task(BaseModel):
 
     _original_description: str | None = None
     _original_expected_output: str | None = None
+    _async_task: Optional[asyncio.Task] = None
+    _output_callback: Optional[Any] = None
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
 
     def __init__(__pydantic_self__, **data):
         config = data.pop("config", {})
@@ -141,38 +156,81 @@ class Task(BaseModel):
         agent: Agent | None = None,
         context: Optional[str] = None,
         tools: Optional[List[Any]] = None,
-    ) -> str:
+        executor: Optional[Executor] = None,
+    ) -> Union[str, Future]:
         """Execute the task.
 
+        Asynchronous tasks are submitted to the executor and wait there for a free
+        worker. Without one, as when the task is executed outside of a crew, they get
+        a worker of their own that exits once the task is done.
+
         Returns:
-            Output of the task.
+            Output of the task, or a Future of it for asynchronous tasks.
         """
 
-        agent = agent or self.agent
-        if not agent:
-            raise Exception(
-                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+        agent = self._execution_agent(agent)
+
+        if self.context:
+            for task in self.context:
+                if task.async_execution and task.future:
+                    task.future.result()
+            context = self._context_output()
+
+        self.prompt_context = context
+        tools = tools or self.tools
+
+        if self.async_execution:
+            if executor:
+                self.future = executor.submit(
+                    self._execute, agent, self, context, tools
+                )
+            else:
+                task_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="crewai-task"
+                )
+                self.future = task_executor.submit(
+                    self._execute, agent, self, context, tools
+                )
+                task_executor.shutdown(wait=False)
+            return self.future
+        else:
+            result = self._execute(
+                task=self,
+                agent=agent,
+                context=context,
+                tools=tools,
             )
+            return result
+
+    async def execute_async(
+        self,
+        agent: Agent | None = None,
+        context: Optional[str] = None,
+        tools: Optional[List[Any]] = None,
+    ) -> str:
+        """Execute the task without blocking the event loop.
+
+        Returns:
+            Output of the task.
+        """
+
+        agent = self._execution_agent(agent)
 
         if self.context:
-            context = []
             for task in self.context:
-                if task.async_execution:
-                    task.thread.join()
-                if task and task.output:
-                    context.append(task.output.raw_output)
-            context = "\n".join(context)
+                if task.async_execution and task._async_task:
+                    await task._async_task
+            context = self._context_output()
 
         self.prompt_context = context
         tools = tools or self.tools
 
         if self.async_execution:
-            self.thread = threading.Thread(
-                target=self._execute, args=(agent, self, context, tools)
+            self._async_task = asyncio.create_task(
+                self._aexecute(agent=agent, task=self, context=context, tools=tools)
             )
-            self.thread.start()
         else:
-            result = self._execute(
+            result = await self._aexecute(
                 task=self,
                 agent=agent,
                 context=context,
@@ -180,13 +238,40 @@ class Task(BaseModel):
             )
             return result
 
+    def _execution_agent(self, agent: Agent | None) -> Agent:
+        """Return the agent that should execute the task."""
+        agent = agent or self.agent
+        if not agent:
+            raise Exception(
+                f"The task '{self.description}' has no agent assigned, therefore it can't be executed directly and should be executed in a Crew using a specific process that support that, like hierarchical."
+            )
+        return agent
+
+    def _context_output(self) -> str:
+        """Join the raw output of the context tasks."""
+        context = []
+        for task in self.context:
+            if task and task.output:
+                context.append(task.output.raw_output)
+        return "\n".join(context)
+
     def _execute(self, agent, task, context, tools):
         result = agent.execute_task(
             task=task,
             context=context,
             tools=tools,
         )
+        return self._process_result(result)
 
+    async def _aexecute(self, agent, task, context, tools):
+        result = await agent.execute_task_async(
+            task=task,
+            context=context,
+            tools=tools,
+        )
+        return await asyncio.to_thread(self._process_result, result)
+
+    def _process_result(self, result: str) -> Any:
         exported_output = self._export_output(result)
 
         self.output = TaskOutput(
@@ -195,6 +280,9 @@ class Task(BaseModel):
             raw_output=result,
         )
 
+        if self._output_callback:
+            self._output_callback(self)
+
         if self.callback:
             self.callback(self.output)
 
@@ -212,8 +300,77 @@ class Task(BaseModel):
             expected_output=self.expected_output
         )
         tasks_slices = [self.description, output]
+
+        model = self.output_pydantic or self.output_json
+        if model:
+            tasks_slices.append(
+                self.i18n.slice("output_schema").format(
+                    output_schema=PydanticSchemaParser(model=model).get_schema()
+                )
+            )
         return "\n".join(tasks_slices)
 
+    def parse_output(self, result: str) -> Any:
+        """Parse the result into the task's output model, without calling any LLM.
+
+        Args:
+            result: Result of the task, holding a JSON object.
+
+        Returns:
+            The output model, or its dict for `output_json`.
+
+        Raises:
+            ValueError: If the result doesn't hold a valid JSON object for the model.
+        """
+        model = self.output_pydantic or self.output_json
+
+        # try to convert task_output directly to pydantic/json
+        try:
+            exported_result = model.model_validate_json(result)
+        except ValueError as e:
+            # sometimes the response contains valid JSON in the middle of text
+            match = re.search(r"({.*})", result, re.DOTALL)
+            if not match:
+                raise e
+            exported_result = model.model_validate_json(match.group(0))
+
+        if self.output_json:
+            return exported_result.model_dump()
+        return exported_result
+
+    def copy(self, agent: Agent | None = None) -> "Task":
+        """Create a copy of the task without its execution state.
+
+        The copy skips validation, so it is cheap enough to be made for every execution.
+
+        Args:
+            agent: Agent that will execute the copied task, defaults to the task agent.
+
+        Returns:
+            A new Task instance.
+        """
+        copied_task = self.model_copy(
+            update={
+                "id": uuid.uuid4(),
+                "description": self._original_description or self.description,
+                "expected_output": self._original_expected_output
+                or self.expected_output,
+                "agent": agent or self.agent,
+                "tools": list(self.tools),
+                "output": None,
+                "future": None,
+                "prompt_context": None,
+                "used_tools": 0,
+                "tools_errors": 0,
+                "tools_timeouts": 0,
+                "delegations": 0,
+            }
+        )
+        copied_task._async_task = None
+        copied_task._output_callback = None
+        copied_task._lock = threading.Lock()
+        return copied_task
+
     def interpolate_inputs(self, inputs: Dict[str, Any]) -> None:
         """Interpolate inputs into the task description and expected output."""
         if self._original_description is None:
@@ -225,69 +382,80 @@ class Task(BaseModel):
             self.description = self._original_description.format(**inputs)
             self.expected_output = self._original_expected_output.format(**inputs)
 
+    def increment_used_tools(self) -> int:
+        """Increment the used tools counter and return it."""
+        with self._lock:
+            self.used_tools += 1
+            return self.used_tools
+
     def increment_tools_errors(self) -> None:
         """Increment the tools errors counter."""
-        self.tools_errors += 1
+        with self._lock:
+            self.tools_errors += 1
+
+    def increment_tools_timeouts(self) -> None:
+        """Increment the tools timeouts counter."""
+        with self._lock:
+            self.tools_timeouts += 1
 
     def increment_delegations(self) -> None:
         """Increment the delegations counter."""
-        self.delegations += 1
+        with self._lock:
+            self.delegations += 1
 
     def _export_output(self, result: str) -> Any:
         exported_result = result
-        instructions = "I'm gonna convert this raw text into valid JSON."
 
         if self.output_pydantic or self.output_json:
-            model = self.output_pydantic or self.output_json
-
-            # try to convert task_output directly to pydantic/json
+            # The agent validates its final answer against the model, so this
+            # usually succeeds without a second LLM call.
             try:
-                exported_result = model.model_validate_json(result)
-                if self.output_json:
-                    return exported_result.model_dump()
-                return exported_result
+                exported_result = self.parse_output(result)
             except Exception:
-              # sometimes the response contains valid JSON in the middle of text
-              match = re.search(r"({.*})", result, re.DOTALL)
-              if match:
-                  try:
-                      exported_result = model.model_validate_json(match.group(0))
-                      if self.output_json:
-                          return exported_result.model_dump()
-                      return exported_result
-                  except Exception:
-                      pass
-
-            llm = self.agent.function_calling_llm or self.agent.llm
-
-            if not self._is_gpt(llm):
-                model_schema = PydanticSchemaParser(model=model).get_schema()
-                instructions = f"{instructions}\n\nThe json should have the following structure, with the following keys:\n{model_schema}"
-
-            converter = Converter(
-                llm=llm, text=result, model=model, instructions=instructions
-            )
-
-            if self.output_pydantic:
-                exported_result = converter.to_pydantic()
-            elif self.output_json:
-                exported_result = converter.to_json()
-
-            if isinstance(exported_result, ConverterError):
-                Printer().print(
-                    content=f"{exported_result.message} Using raw output instead.",
-                    color="red",
-                )
-                exported_result = result
+                exported_result = self._convert_output(result)
 
         if self.output_file:
             content = (
                 exported_result if not self.output_pydantic else exported_result.json()
             )
+            if isinstance(content, dict):
+                # Parsed JSON outputs are saved like the converted ones.
+                content = json.dumps(content, indent=2)
             self._save_file(content)
 
         return exported_result
 
+    def _convert_output(self, result: str) -> Any:
+        """Convert the result into the task's output model with an LLM call."""
+        model = self.output_pydantic or self.output_json
+        instructions = "I'm gonna convert this raw text into valid JSON."
+        llm = self.agent.function_calling_llm or self.agent.llm
+
+        if not self._is_gpt(llm):
+            model_schema = PydanticSchemaParser(model=model).get_schema()
+            instructions = f"{instructions}\n\nThe json should have the following structure, with the following keys:\n{model_schema}"
+
+        converter = Converter(
+            llm=llm,
+            text=result,
+            model=model,
+            instructions=instructions,
+            llm_call_policy=self.agent.llm_call_policy,
+        )
+
+        if self.output_pydantic:
+            exported_result = converter.to_pydantic()
+        else:
+            exported_result = converter.to_json()
+
+        if isinstance(exported_result, ConverterError):
+            Printer().print(
+                content=f"{exported_result.message} Using raw output instead.",
+                color="red",
+            )
+            exported_result = result
+        return exported_result
+
     def _is_gpt(self, llm) -> bool:
         return isinstance(llm, ChatOpenAI) and llm.openai_api_base == None
 
@@ -2,6 +2,7 @@ import asyncio
 import json
 import os
 import platform
+import threading
 from typing import Any
 
 import pkg_resources
@@ -38,24 +39,15 @@ class Telemetry:
     attribute in the Crew class.
     """
 
+    _provider: TracerProvider | None = None
+    _provider_lock = threading.Lock()
+
     def __init__(self):
         self.ready = False
         self.trace_set = False
         try:
-            telemetry_endpoint = "https://telemetry.crewai.com:4319"
-            self.resource = Resource(
-                attributes={SERVICE_NAME: "crewAI-telemetry"},
-            )
-            self.provider = TracerProvider(resource=self.resource)
-
-            processor = BatchSpanProcessor(
-                OTLPSpanExporter(
-                    endpoint=f"{telemetry_endpoint}/v1/traces",
-                    timeout=30,
-                )
-            )
-
-            self.provider.add_span_processor(processor)
+            self.provider = self._shared_provider()
+            self.resource = self.provider.resource
             self.ready = True
         except BaseException as e:
             if isinstance(
@@ -65,10 +57,38 @@ class Telemetry:
                 raise  # Re-raise the exception to not interfere with system signals
             self.ready = False
 
+    @classmethod
+    def _shared_provider(cls) -> TracerProvider:
+        """Returns the tracer provider shared by every Telemetry instance in the process.
+
+        The provider and its exporter are only created once, so crews and tool usages
+        don't pay for a new exporter thread each time they are instantiated.
+        """
+        with cls._provider_lock:
+            if cls._provider is None:
+                telemetry_endpoint = "https://telemetry.crewai.com:4319"
+                provider = TracerProvider(
+                    resource=Resource(
+                        attributes={SERVICE_NAME: "crewAI-telemetry"},
+                    )
+                )
+
+                processor = BatchSpanProcessor(
+                    OTLPSpanExporter(
+                        endpoint=f"{telemetry_endpoint}/v1/traces",
+                        timeout=30,
+                    )
+                )
+
+                provider.add_span_processor(processor)
+                cls._provider = provider
+            return cls._provider
+
     def set_tracer(self):
         if self.ready and not self.trace_set:
             try:
-                trace.set_tracer_provider(self.provider)
+                if trace.get_tracer_provider() is not self.provider:
+                    trace.set_tracer_provider(self.provider)
                 self.trace_set = True
             except Exception:
                 self.ready = False
@@ -1,4 +1,5 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from langchain.tools import StructuredTool
 from pydantic import BaseModel, Field
@@ -13,6 +14,14 @@ class AgentTools(BaseModel):
 
     agents: List[Agent] = Field(description="List of agents in this crew.")
     i18n: I18N = Field(default=I18N(), description="Internationalization settings.")
+    concurrent_delegation: bool = Field(
+        default=False,
+        description="Whether to add a tool to delegate work to several co-workers at the same time.",
+    )
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        description="Maximum number of co-workers working at the same time.",
+    )
 
     def tools(self):
         tools = [
@@ -31,6 +40,16 @@ class AgentTools(BaseModel):
                 ),
             ),
         ]
+        if self.concurrent_delegation:
+            tools.append(
+                StructuredTool.from_function(
+                    func=self.delegate_work_to_coworkers,
+                    name="Delegate work to multiple co-workers",
+                    description=self.i18n.tools("delegate_work_to_coworkers").format(
+                        coworkers=f"[{', '.join([f'{agent.role}' for agent in self.agents])}]"
+                    ),
+                )
+            )
         return tools
 
     def delegate_work(self, coworker: str, task: str, context: str):
@@ -41,6 +60,41 @@ class AgentTools(BaseModel):
         """Useful to ask a question, opinion or take from a co-worker passing all necessary context and names."""
         return self._execute(coworker, question, context)
 
+    def delegate_work_to_coworkers(self, delegations: List[Dict[str, str]]):
+        """Useful to delegate several tasks at once, each delegation being a dictionary with the coworker, task and context keys."""
+        delegations_by_coworker: Dict[str, List[int]] = {}
+        for index, delegation in enumerate(delegations):
+            coworker = str(delegation.get("coworker", "")).casefold().strip()
+            delegations_by_coworker.setdefault(coworker, []).append(index)
+
+        answers: List[str] = [""] * len(delegations)
+
+        def execute_coworker_delegations(indexes: List[int]) -> None:
+            # Delegations to the same co-worker run one after another, as each agent
+            # can only work on one task at a time.
+            for index in indexes:
+                delegation = delegations[index]
+                answers[index] = self._execute(
+                    delegation.get("coworker", ""),
+                    delegation.get("task", ""),
+                    delegation.get("context", ""),
+                )
+
+        max_workers = self.max_concurrency or len(delegations_by_coworker) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            list(
+                pool.map(execute_coworker_delegations, delegations_by_coworker.values())
+            )
+
+        return "\n\n".join(
+            self.i18n.slice("coworker_answer").format(
+                coworker=delegation.get("coworker", ""),
+                task=delegation.get("task", ""),
+                answer=answer,
+            )
+            for delegation, answer in zip(delegations, answers)
+        )
+
     def _execute(self, agent, task, context):
         """Execute the command."""
         try:
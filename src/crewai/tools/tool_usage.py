@@ -1,9 +1,13 @@
 import ast
+import asyncio
+import contextvars
+import threading
+from concurrent.futures import Future, wait
 from difflib import SequenceMatcher
 from textwrap import dedent
-from typing import Any, List, Union
+from typing import Any, Dict, List, Optional, Union
 
-from langchain_core.tools import BaseTool
+from langchain_core.tools import BaseTool, StructuredTool, Tool
 from langchain_openai import ChatOpenAI
 
 from crewai.agents.tools_handler import ToolsHandler
@@ -22,6 +26,15 @@ class ToolUsageErrorException(Exception):
         super().__init__(self.message)
 
 
+class ToolTimeoutError(TimeoutError):
+    """Exception raised when a tool doesn't finish before its timeout."""
+
+    def __init__(self, tool: str, timeout: float) -> None:
+        self.tool = tool
+        self.timeout = timeout
+        super().__init__(f"Tool {tool} timed out after {timeout}s.")
+
+
 class ToolUsage:
     """
     Class that represents the usage of a tool by an agent.
@@ -34,6 +47,9 @@ class ToolUsage:
       tools_description: Description of the tools available for the agent.
       tools_names: Names of the tools available for the agent.
       function_calling_llm: Language model to be used for the tool usage.
+      llm_call_policy: Deadline, retries and hedging for the calls to the function calling LLM.
+      tool_timeout: Seconds a tool can run before it is stopped.
+      tool_timeouts: Seconds each tool can run before it is stopped, by tool name, overriding tool_timeout.
     """
 
     def __init__(
@@ -46,6 +62,9 @@ class ToolUsage:
         task: Any,
         function_calling_llm: Any,
         action: Any,
+        llm_call_policy: Any = None,
+        tool_timeout: Optional[float] = None,
+        tool_timeouts: Optional[Dict[str, float]] = None,
     ) -> None:
         self._i18n: I18N = I18N()
         self._printer: Printer = Printer()
@@ -61,6 +80,9 @@ class ToolUsage:
         self.task = task
         self.action = action
         self.function_calling_llm = function_calling_llm
+        self.llm_call_policy = llm_call_policy
+        self.tool_timeout = tool_timeout
+        self.tool_timeouts = tool_timeouts or {}
 
         # Set the maximum parsing attempts for bigger models
         if (isinstance(self.function_calling_llm, ChatOpenAI)) and (
@@ -77,19 +99,37 @@ class ToolUsage:
     def use(
         self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
     ) -> str:
+        tool = self._selected_tool(calling)
+        if isinstance(tool, str):
+            return tool
+        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
+
+    async def ause(
+        self, calling: Union[ToolCalling, InstructorToolCalling], tool_string: str
+    ) -> str:
+        """Async version of `use`, awaiting the tool when it is async."""
+        tool = self._selected_tool(calling)
+        if isinstance(tool, str):
+            return tool
+        result = await self._ause(tool_string=tool_string, tool=tool, calling=calling)
+        return f"{result}"
+
+    def _selected_tool(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Union[BaseTool, str]:
+        """Returns the tool of the calling, or the error to give back to the agent."""
         if isinstance(calling, ToolUsageErrorException):
             error = calling.message
             self._printer.print(content=f"\n\n{error}\n", color="red")
             self.task.increment_tools_errors()
             return error
         try:
-            tool = self._select_tool(calling.tool_name)
+            return self._select_tool(calling.tool_name)
         except Exception as e:
             error = getattr(e, "message", str(e))
             self.task.increment_tools_errors()
             self._printer.print(content=f"\n\n{error}\n", color="red")
             return error
-        return f"{self._use(tool_string=tool_string, tool=tool, calling=calling)}"
 
     def _use(
         self,
@@ -98,87 +138,261 @@ class ToolUsage:
         calling: Union[ToolCalling, InstructorToolCalling],
     ) -> None:
         if self._check_tool_repeated_usage(calling=calling):
+            result = self._repeated_usage(tool)
+            if result is not None:
+                return result
+
+        result = self._read_cache(calling)
+
+        if result is None:
             try:
-                result = self._i18n.errors("task_repeated_usage").format(
-                    tool_names=self.tools_names
-                )
-                self._printer.print(content=f"\n\n{result}\n", color="purple")
-                self._telemetry.tool_repeated_usage(
-                    llm=self.function_calling_llm,
-                    tool_name=tool.name,
-                    attempts=self._run_attempts,
-                )
-                result = self._format_result(result=result)
+                self._count_delegation(calling)
+                result = self._run_tool_in_time(tool, calling)
+            except ToolTimeoutError as e:
+                return self._timed_out(e)
+            except Exception as e:
+                error = self._tool_error(tool, calling, e)
+                if error is not None:
+                    return error
+                return self.use(calling=calling, tool_string=tool_string)
+
+            self._cache_result(tool, calling, result)
+
+        return self._tool_output(tool, result)
+
+    async def _ause(
+        self,
+        tool_string: str,
+        tool: BaseTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+    ) -> None:
+        if self._check_tool_repeated_usage(calling=calling):
+            result = self._repeated_usage(tool)
+            if result is not None:
                 return result
-            except Exception:
-                self.task.increment_tools_errors()
 
-        result = None
+        result = self._read_cache(calling)
 
+        if result is None:
+            try:
+                self._count_delegation(calling)
+                result = await self._arun_tool_in_time(tool, calling)
+            except ToolTimeoutError as e:
+                return self._timed_out(e)
+            except Exception as e:
+                error = self._tool_error(tool, calling, e)
+                if error is not None:
+                    return error
+                return await self.ause(calling=calling, tool_string=tool_string)
+
+            self._cache_result(tool, calling, result)
+
+        return self._tool_output(tool, result)
+
+    def _repeated_usage(self, tool: BaseTool) -> Any:
+        """Returns the observation telling the agent it repeated its last usage."""
+        try:
+            result = self._i18n.errors("task_repeated_usage").format(
+                tool_names=self.tools_names
+            )
+            self._printer.print(content=f"\n\n{result}\n", color="purple")
+            self._telemetry.tool_repeated_usage(
+                llm=self.function_calling_llm,
+                tool_name=tool.name,
+                attempts=self._run_attempts,
+            )
+            result = self._format_result(result=result)
+            return result
+        except Exception:
+            self.task.increment_tools_errors()
+
+    def _read_cache(self, calling: Union[ToolCalling, InstructorToolCalling]) -> Any:
         if self.tools_handler.cache:
-            result = self.tools_handler.cache.read(
+            return self.tools_handler.cache.read(
                 tool=calling.tool_name, input=calling.arguments
             )
+        return None
 
-        if not result:
+    def _count_delegation(
+        self, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> None:
+        if calling.tool_name in [
+            "Delegate work to co-worker",
+            "Ask question to co-worker",
+            "Delegate work to multiple co-workers",
+        ]:
+            self.task.increment_delegations()
+
+    def _run_tool_in_time(
+        self, tool: BaseTool, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Any:
+        """Runs the tool, raising ToolTimeoutError if it doesn't finish in time."""
+        timeout = self._timeout(tool)
+        if not timeout:
+            return self._run_tool(tool, calling)
+
+        future = self._run_on_thread(tool, calling)
+        done, _ = wait([future], timeout=timeout)
+        if not done:
+            raise ToolTimeoutError(tool.name, timeout)
+        return future.result()
+
+    async def _arun_tool_in_time(
+        self, tool: BaseTool, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Any:
+        """Async version of `_run_tool_in_time`, cancelling async tools on timeout."""
+        timeout = self._timeout(tool)
+        if not timeout:
+            return await self._arun_tool(tool, calling)
+
+        if self._is_async(tool):
+            run = asyncio.ensure_future(self._arun_tool(tool, calling))
+        else:
+            # Not on the executor of the event loop, which waits for its threads
+            # when it's closed.
+            run = asyncio.wrap_future(self._run_on_thread(tool, calling))
+        done, _ = await asyncio.wait({run}, timeout=timeout)
+        if not done:
+            run.cancel()
+            raise ToolTimeoutError(tool.name, timeout)
+        return run.result()
+
+    def _run_on_thread(
+        self, tool: BaseTool, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Future:
+        """Runs the tool on a daemon thread.
+
+        A running thread can't be stopped, so a hung tool is abandoned on its thread,
+        which doesn't hold the agent nor the exit of the process.
+        """
+        future: Future = Future()
+        context = contextvars.copy_context()
+
+        def run() -> None:
+            future.set_running_or_notify_cancel()
             try:
-                if calling.tool_name in [
-                    "Delegate work to co-worker",
-                    "Ask question to co-worker",
-                ]:
-                    self.task.increment_delegations()
-
-                if calling.arguments:
-                    try:
-                        acceptable_args = tool.args_schema.schema()["properties"].keys()
-                        arguments = {
-                            k: v
-                            for k, v in calling.arguments.items()
-                            if k in acceptable_args
-                        }
-                        result = tool._run(**arguments)
-                    except Exception:
-                        if tool.args_schema:
-                            arguments = calling.arguments
-                            result = tool._run(**arguments)
-                        else:
-                            arguments = calling.arguments.values()
-                            result = tool._run(*arguments)
-                else:
-                    result = tool._run()
+                result = context.run(self._run_tool, tool, calling)
             except Exception as e:
-                self._run_attempts += 1
-                if self._run_attempts > self._max_parsing_attempts:
-                    self._telemetry.tool_usage_error(llm=self.function_calling_llm)
-                    error_message = self._i18n.errors("tool_usage_exception").format(
-                        error=e, tool=tool.name, tool_inputs=tool.description
-                    )
-                    error = ToolUsageErrorException(
-                        f'\n{error_message}.\nMoving on then. {self._i18n.slice("format").format(tool_names=self.tools_names)}'
-                    ).message
-                    self.task.increment_tools_errors()
-                    self._printer.print(content=f"\n\n{error_message}\n", color="red")
-                    return error
-                self.task.increment_tools_errors()
-                return self.use(calling=calling, tool_string=tool_string)
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, name="crewai-tool", daemon=True).start()
+        return future
+
+    @staticmethod
+    def _is_async(tool: BaseTool) -> bool:
+        """Whether the tool has a coroutine, rather than running `_run` on a thread."""
+        if getattr(tool, "coroutine", None) is not None:
+            return True
+        default_aruns = (BaseTool._arun, StructuredTool._arun, Tool._arun)
+        return type(tool)._arun not in default_aruns
+
+    def _timeout(self, tool: BaseTool) -> Optional[float]:
+        return self.tool_timeouts.get(tool.name, self.tool_timeout)
+
+    def _timed_out(self, e: ToolTimeoutError) -> str:
+        """Counts the timeout and returns the observation telling the agent about it.
+
+        The call isn't retried nor cached, it would most likely time out again.
+        """
+        self._telemetry.tool_usage_error(llm=self.function_calling_llm)
+        self.task.increment_tools_timeouts()
+        error = self._i18n.errors("tool_timeout").format(tool=e.tool, timeout=e.timeout)
+        self._printer.print(content=f"\n\n{error}\n", color="red")
+        return error
+
+    def _run_tool(
+        self, tool: BaseTool, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Any:
+        if calling.arguments:
+            try:
+                acceptable_args = tool.args_schema.schema()["properties"].keys()
+                arguments = {
+                    k: v for k, v in calling.arguments.items() if k in acceptable_args
+                }
+                return tool._run(**arguments)
+            except Exception:
+                if tool.args_schema:
+                    return tool._run(**calling.arguments)
+                return tool._run(*calling.arguments.values())
+        return tool._run()
+
+    async def _arun_tool(
+        self, tool: BaseTool, calling: Union[ToolCalling, InstructorToolCalling]
+    ) -> Any:
+        """Async version of `_run_tool`, awaiting the coroutine of async tools.
+
+        Sync tools run on the default thread pool of the event loop.
+        """
+        if calling.arguments:
+            try:
+                acceptable_args = tool.args_schema.schema()["properties"].keys()
+                arguments = {
+                    k: v for k, v in calling.arguments.items() if k in acceptable_args
+                }
+                return await self._await_tool(tool, **arguments)
+            except Exception:
+                if tool.args_schema:
+                    return await self._await_tool(tool, **calling.arguments)
+                return await self._await_tool(tool, *calling.arguments.values())
+        return await self._await_tool(tool)
+
+    @staticmethod
+    async def _await_tool(tool: BaseTool, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await tool._arun(*args, **kwargs)
+        except NotImplementedError:
+            # Tools that only run synchronously.
+            return await asyncio.to_thread(tool._run, *args, **kwargs)
 
+    def _tool_error(
+        self,
+        tool: BaseTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        e: Exception,
+    ) -> Optional[str]:
+        """Counts the failed run of the tool and returns the error to give back to
+        the agent, or None when the tool should be used again."""
+        self._run_attempts += 1
+        if self._run_attempts > self._max_parsing_attempts:
+            self._telemetry.tool_usage_error(llm=self.function_calling_llm)
+            error_message = self._i18n.errors("tool_usage_exception").format(
+                error=e, tool=tool.name, tool_inputs=tool.description
+            )
+            error = ToolUsageErrorException(
+                f'\n{error_message}.\nMoving on then. {self._i18n.slice("format").format(tool_names=self.tools_names)}'
+            ).message
+            self.task.increment_tools_errors()
+            self._printer.print(content=f"\n\n{error_message}\n", color="red")
             if self.tools_handler:
-                should_cache = True
-                original_tool = next(
-                    (ot for ot in self.original_tools if ot.name == tool.name), None
-                )
-                if (
-                    hasattr(original_tool, "cache_function")
-                    and original_tool.cache_function
-                ):
-                    should_cache = original_tool.cache_function(
-                        calling.arguments, result
-                    )
+                self.tools_handler.on_tool_error(calling=calling, error=error)
+            return error
+        self.task.increment_tools_errors()
+        return None
 
-                self.tools_handler.on_tool_use(
-                    calling=calling, output=result, should_cache=should_cache
-                )
+    def _cache_result(
+        self,
+        tool: BaseTool,
+        calling: Union[ToolCalling, InstructorToolCalling],
+        result: Any,
+    ) -> None:
+        if self.tools_handler:
+            should_cache = True
+            original_tool = next(
+                (ot for ot in self.original_tools if ot.name == tool.name), None
+            )
+            if (
+                hasattr(original_tool, "cache_function")
+                and original_tool.cache_function
+            ):
+                should_cache = original_tool.cache_function(calling.arguments, result)
+
+            self.tools_handler.on_tool_use(
+                calling=calling, output=result, should_cache=should_cache
+            )
 
+    def _tool_output(self, tool: BaseTool, result: Any) -> Any:
         self._printer.print(content=f"\n\n{result}\n", color="purple")
         self._telemetry.tool_usage(
             llm=self.function_calling_llm,
@@ -189,13 +403,13 @@ class ToolUsage:
         return result
 
     def _format_result(self, result: Any) -> None:
-        self.task.used_tools += 1
-        if self._should_remember_format():
+        used_tools = self.task.increment_used_tools()
+        if self._should_remember_format(used_tools):
             result = self._remember_format(result=result)
         return result
 
-    def _should_remember_format(self) -> None:
-        return self.task.used_tools % self._remember_format_after_usages == 0
+    def _should_remember_format(self, used_tools: int) -> None:
+        return used_tools % self._remember_format_after_usages == 0
 
     def _remember_format(self, result: str) -> None:
         result = str(result)
@@ -260,6 +474,12 @@ class ToolUsage:
         self, tool_string: str
     ) -> Union[ToolCalling, InstructorToolCalling]:
         try:
+            if isinstance(self.action.tool_input, dict):
+                # Native tool calls come with their arguments already parsed.
+                tool = self._select_tool(self.action.tool)
+                return ToolCalling(
+                    tool_name=tool.name, arguments=self.action.tool_input
+                )
             if self.function_calling_llm:
                 model = (
                     InstructorToolCalling
@@ -280,6 +500,7 @@ class ToolUsage:
               {"tool_name": "tool name", "arguments": {"arg_name1": "value", "arg_name2": 2}}""",
                     ),
                     max_attemps=1,
+                    llm_call_policy=self.llm_call_policy,
                 )
                 calling = converter.to_pydantic()
 
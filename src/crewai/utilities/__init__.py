@@ -1,8 +1,10 @@
 from .converter import Converter, ConverterError
+from .crew_events import CrewEvent, CrewEventHandler, CrewEventType
+from .fileHandler import FileHandler
 from .i18n import I18N
 from .instructor import Instructor
+from .llm_call_policy import LLMCallPolicy
 from .logger import Logger
 from .printer import Printer
 from .prompts import Prompts
 from .rpm_controller import RPMController
-from .fileHandler import FileHandler
@@ -0,0 +1,110 @@
+import json
+import sqlite3
+from datetime import datetime
+from typing import Any, Dict
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.printer import Printer
+
+
+class CheckpointSQLiteStorage:
+    """
+    SQLite storage for the outputs of the tasks completed during a crew execution.
+    """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or f"{db_storage_path()}/crew_checkpoints.db"
+        self._printer: Printer = Printer()
+        self._initialize_db()
+
+    def _initialize_db(self):
+        """
+        Initializes the SQLite database and creates the checkpoints table
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS task_checkpoints (
+                        crew_key TEXT,
+                        inputs_hash TEXT,
+                        task_index INTEGER,
+                        data TEXT,
+                        datetime TEXT,
+                        PRIMARY KEY (crew_key, inputs_hash, task_index)
+                    )
+                """
+                )
+
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"CHECKPOINT ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+
+    def save(
+        self, crew_key: str, inputs_hash: str, task_index: int, data: Dict[str, Any]
+    ) -> None:
+        """Saves the output of a completed task, replacing any previous one."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                INSERT OR REPLACE INTO task_checkpoints (crew_key, inputs_hash, task_index, data, datetime)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                    (
+                        crew_key,
+                        inputs_hash,
+                        task_index,
+                        json.dumps(data),
+                        datetime.now().isoformat(),
+                    ),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"CHECKPOINT ERROR: An error occurred while saving a checkpoint: {e}",
+                color="red",
+            )
+
+    def load(self, crew_key: str, inputs_hash: str) -> Dict[int, Dict[str, Any]]:
+        """Returns the saved task outputs of an execution, by task index."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT task_index, data
+                    FROM task_checkpoints
+                    WHERE crew_key = ? AND inputs_hash = ?
+                """,
+                    (crew_key, inputs_hash),
+                )
+                return {row[0]: json.loads(row[1]) for row in cursor.fetchall()}
+
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"CHECKPOINT ERROR: An error occurred while loading checkpoints: {e}",
+                color="red",
+            )
+        return {}
+
+    def reset(self, crew_key: str, inputs_hash: str) -> None:
+        """Deletes the saved task outputs of an execution."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "DELETE FROM task_checkpoints WHERE crew_key = ? AND inputs_hash = ?",
+                    (crew_key, inputs_hash),
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"CHECKPOINT ERROR: An error occurred while deleting checkpoints: {e}",
+                color="red",
+            )
@@ -26,6 +26,10 @@ class Converter(BaseModel):
         description="Max number of attemps to try to get the output formated.",
         default=3,
     )
+    llm_call_policy: Optional[Any] = Field(
+        description="Deadline, retries and hedging for the calls to the LLM.",
+        default=None,
+    )
 
     @model_validator(mode="after")
     def check_llm_provider(self):
@@ -38,7 +42,7 @@ class Converter(BaseModel):
             if self._is_gpt:
                 return self._create_instructor().to_pydantic()
             else:
-                return self._create_chain().invoke({})
+                return self._invoke(self._create_chain(), {})
         except Exception as e:
             if current_attempt < self.max_attemps:
                 return self.to_pydantic(current_attempt + 1)
@@ -52,7 +56,7 @@ class Converter(BaseModel):
             if self._is_gpt:
                 return self._create_instructor().to_json()
             else:
-                return json.dumps(self._create_chain().invoke({}).model_dump())
+                return json.dumps(self._invoke(self._create_chain(), {}).model_dump())
         except Exception:
             if current_attempt < self.max_attemps:
                 return self.to_json(current_attempt + 1)
@@ -68,9 +72,16 @@ class Converter(BaseModel):
             model=self.model,
             content=self.text,
             instructions=self.instructions,
+            llm_call_policy=self.llm_call_policy,
         )
         return inst
 
+    def _invoke(self, chain, input):
+        """Invoke the chain, with the LLM call policy if any."""
+        if self.llm_call_policy:
+            return self.llm_call_policy.call(chain.invoke, input)
+        return chain.invoke(input)
+
     def _create_chain(self):
         """Create a chain."""
         from crewai.utilities.crew_pydantic_output_parser import (
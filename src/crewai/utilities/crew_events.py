@@ -0,0 +1,48 @@
+from enum import Enum
+from typing import Any, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+from pydantic import BaseModel, Field
+
+
+class CrewEventType(str, Enum):
+    """
+    Enum that represents the events emitted while a crew is working.
+    """
+
+    task_started = "task_started"
+    agent_action = "agent_action"
+    tool_observation = "tool_observation"
+    token = "token"
+    task_finished = "task_finished"
+    crew_finished = "crew_finished"
+
+
+class CrewEvent(BaseModel):
+    """Event emitted while a crew is working, streamed by `Crew.kickoff_stream`."""
+
+    type: CrewEventType = Field(description="Type of the event")
+    agent: Optional[str] = Field(
+        description="Role of the agent the event comes from", default=None
+    )
+    task: Optional[str] = Field(
+        description="Description of the task the event comes from", default=None
+    )
+    data: Any = Field(
+        description="The agent action, the tool observation, the token, the task output or the crew output",
+        default=None,
+    )
+
+
+class CrewEventHandler(BaseCallbackHandler):
+    """Callback handler that emits the tokens streamed by the LLM as crew events."""
+
+    def __init__(self, crew: Any, agent: Any, task: Any) -> None:
+        self.crew = crew
+        self.agent = agent
+        self.task = task
+
+    def on_llm_new_token(self, token: str, **kwargs: Any) -> None:
+        self.crew._emit_event(
+            CrewEventType.token, agent=self.agent, task=self.task, data=token
+        )
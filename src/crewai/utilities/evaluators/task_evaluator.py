@@ -29,6 +29,7 @@ class TaskEvaluation(BaseModel):
 class TaskEvaluator:
     def __init__(self, original_agent):
         self.llm = original_agent.llm
+        self.llm_call_policy = original_agent.llm_call_policy
 
     def evaluate(self, task, ouput) -> TaskEvaluation:
         evaluation_query = (
@@ -53,6 +54,7 @@ class TaskEvaluator:
             text=evaluation_query,
             model=TaskEvaluation,
             instructions=instructions,
+            llm_call_policy=self.llm_call_policy,
         )
 
         return converter.to_pydantic()
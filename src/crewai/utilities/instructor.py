@@ -22,6 +22,10 @@ class Instructor(BaseModel):
     model: Type[BaseModel] = Field(
         description="Pydantic model to be used to create an output."
     )
+    llm_call_policy: Optional[Any] = Field(
+        description="Deadline, retries and hedging for the calls to the LLM.",
+        default=None,
+    )
 
     @model_validator(mode="after")
     def set_instructor(self):
@@ -44,7 +48,14 @@ class Instructor(BaseModel):
         if self.instructions:
             messages.append({"role": "system", "content": self.instructions})
 
-        model = self._client.chat.completions.create(
+        create = self._client.chat.completions.create
+        if self.llm_call_policy:
+            return self.llm_call_policy.call(
+                create,
+                model=self.llm.model_name,
+                response_model=self.model,
+                messages=messages,
+            )
+        return create(
             model=self.llm.model_name, response_model=self.model, messages=messages
         )
-        return model
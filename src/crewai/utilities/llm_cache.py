@@ -0,0 +1,198 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.printer import Printer
+
+
+class LLMSQLiteCache(BaseCache):
+    """
+    SQLite cache for the responses of the LLMs, keyed by a hash of the model, its
+    parameters, the stop words and the rendered prompt.
+
+    Entries older than `ttl` seconds are ignored, and once there are more than
+    `max_entries` of them the least recently used ones are evicted.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        max_entries: Optional[int] = 10000,
+    ):
+        self.db_path = db_path or f"{db_storage_path()}/llm_cache.db"
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._printer: Printer = Printer()
+        self._initialize_db()
+
+    def _initialize_db(self):
+        """
+        Initializes the SQLite database and creates the llm_responses table, indexed
+        by the timestamps the expired and least recently used entries are found by.
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS llm_responses (
+                        key TEXT PRIMARY KEY,
+                        data TEXT,
+                        created_at REAL,
+                        accessed_at REAL
+                    )
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS llm_responses_created_at
+                    ON llm_responses (created_at)
+                """
+                )
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS llm_responses_accessed_at
+                    ON llm_responses (accessed_at)
+                """
+                )
+
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM CACHE ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Returns the cached generations of the prompt, if any."""
+        key = self._key(prompt, llm_string)
+        generations = None
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    "SELECT data, created_at FROM llm_responses WHERE key = ?",
+                    (key,),
+                )
+                row = cursor.fetchone()
+                if row and not self._expired(row[1]):
+                    generations = [
+                        self._load_generation(generation)
+                        for generation in json.loads(row[0])
+                    ]
+                    cursor.execute(
+                        "UPDATE llm_responses SET accessed_at = ? WHERE key = ?",
+                        (time.time(), key),
+                    )
+                    conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM CACHE ERROR: An error occurred while looking up a response: {e}",
+                color="red",
+            )
+
+        with self._lock:
+            if generations is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Caches the generations of the prompt, evicting the least recently used ones."""
+        now = time.time()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                INSERT OR REPLACE INTO llm_responses (key, data, created_at, accessed_at)
+                VALUES (?, ?, ?, ?)
+            """,
+                    (
+                        self._key(prompt, llm_string),
+                        json.dumps(
+                            [self._dump_generation(gen) for gen in return_val],
+                            default=str,
+                        ),
+                        now,
+                        now,
+                    ),
+                )
+                if self.ttl is not None:
+                    cursor.execute(
+                        "DELETE FROM llm_responses WHERE created_at < ?",
+                        (now - self.ttl,),
+                    )
+                if self.max_entries is not None:
+                    self._evict(cursor)
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM CACHE ERROR: An error occurred while caching a response: {e}",
+                color="red",
+            )
+
+    def _evict(self, cursor: sqlite3.Cursor) -> None:
+        """Deletes the least recently used entries over `max_entries`, if any."""
+        cursor.execute("SELECT COUNT(*) FROM llm_responses")
+        excess = cursor.fetchone()[0] - self.max_entries
+        if excess > 0:
+            cursor.execute(
+                """
+                DELETE FROM llm_responses WHERE key IN (
+                    SELECT key FROM llm_responses
+                    ORDER BY accessed_at
+                    LIMIT ?
+                )
+            """,
+                (excess,),
+            )
+
+    def clear(self, **kwargs: Any) -> None:
+        """Deletes every cached response."""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute("DELETE FROM llm_responses")
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"LLM CACHE ERROR: An error occurred while clearing the cache: {e}",
+                color="red",
+            )
+
+    def _expired(self, created_at: float) -> bool:
+        return self.ttl is not None and time.time() - created_at > self.ttl
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\n{prompt}".encode()).hexdigest()
+
+    @staticmethod
+    def _dump_generation(generation: Generation) -> Dict[str, Any]:
+        data = {"text": generation.text, "generation_info": generation.generation_info}
+        if isinstance(generation, ChatGeneration):
+            data["message"] = message_to_dict(generation.message)
+        return data
+
+    @staticmethod
+    def _load_generation(data: Dict[str, Any]) -> Generation:
+        if "message" in data:
+            return ChatGeneration(
+                message=messages_from_dict([data["message"]])[0],
+                generation_info=data["generation_info"],
+            )
+        return Generation(text=data["text"], generation_info=data["generation_info"])
@@ -0,0 +1,277 @@
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Any, Awaitable, Callable, Deque, Optional, Set
+
+import openai
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+
+class LLMCallTimeoutError(TimeoutError):
+    """Error raised when a call to the LLM doesn't finish before its deadline."""
+
+
+class LLMCallPolicy(BaseModel):
+    """Deadline, retries and hedging for the calls to the LLMs.
+
+    Calls that hit a rate limit, a server error or their deadline are retried with
+    a jittered exponential backoff. When hedging, a duplicate of a call is made once
+    it takes longer than `hedge_after` seconds, or than the 95th percentile of the
+    latencies seen so far, and the first answer wins. Retries and duplicates go
+    through the `acquire` callable given with the call, so they are within the
+    rate limits too.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+    timeout: Optional[float] = Field(
+        default=None,
+        description="Seconds to wait for each call before giving up on it.",
+    )
+    max_retries: int = Field(
+        default=2,
+        description="Number of times a call is retried after a rate limit, a server error or a timeout.",
+    )
+    backoff_base: float = Field(
+        default=1.0, description="Seconds to wait before the first retry."
+    )
+    backoff_max: float = Field(
+        default=30.0, description="Maximum number of seconds to wait between retries."
+    )
+    hedge: bool = Field(
+        default=False,
+        description="Whether a duplicate of slow calls is made, using the first answer.",
+    )
+    hedge_after: Optional[float] = Field(
+        default=None,
+        description="Seconds after which a call is duplicated, defaults to the 95th percentile of the latencies.",
+    )
+    min_latency_samples: int = Field(
+        default=20,
+        description="Number of latencies to see before hedging on their 95th percentile.",
+    )
+    _latencies: Deque[float] = PrivateAttr(default_factory=lambda: deque(maxlen=200))
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
+    def call(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        acquire: Optional[Callable[[], Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Call fn with the deadline, retries and hedging of the policy.
+
+        acquire is called before every retry and duplicate of the call, the first
+        attempt is expected to be within the rate limits already.
+        """
+        for attempt in range(self.max_retries + 1):
+            try:
+                return self._call_once(fn, *args, acquire=acquire, **kwargs)
+            except Exception as e:
+                if attempt == self.max_retries or not self._retryable(e):
+                    raise
+                self._wait(self._backoff(attempt))
+                if acquire:
+                    acquire()
+
+    async def acall(
+        self,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        acquire: Optional[Callable[[], Awaitable[Any]]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Async version of `call`, fn and acquire return awaitables."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return await self._acall_once(fn, *args, acquire=acquire, **kwargs)
+            except Exception as e:
+                if attempt == self.max_retries or not self._retryable(e):
+                    raise
+                await asyncio.sleep(self._backoff(attempt))
+                if acquire:
+                    await acquire()
+
+    def _call_once(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        acquire: Optional[Callable[[], Any]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        start = time.monotonic()
+        hedge_after = self._hedge_after()
+        if not self.timeout and hedge_after is None:
+            return self._timed(fn, *args, **kwargs)
+
+        # Calls run in a thread so they can be given up on, a hung call can't
+        # be interrupted but it no longer holds the agent.
+        deadline = start + self.timeout if self.timeout else None
+        hedge_at = start + hedge_after if hedge_after is not None else None
+        pending: Set[Future] = {self._submit(fn, *args, **kwargs)}
+        error: Optional[BaseException] = None
+        while pending:
+            wakeups = [at for at in (deadline, hedge_at) if at is not None]
+            done, pending = wait(
+                pending,
+                timeout=max(0.0, min(wakeups) - time.monotonic()) if wakeups else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                if future.exception() is None:
+                    for other in pending:
+                        other.cancel()
+                    return future.result()
+                error = future.exception()
+
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                for future in pending:
+                    future.cancel()
+                break
+            if pending and hedge_at is not None and now >= hedge_at:
+                pending.add(self._submit(fn, *args, acquire=acquire, **kwargs))
+                hedge_at = None
+
+        if pending or error is None:
+            raise LLMCallTimeoutError(f"LLM call timed out after {self.timeout}s.")
+        raise error
+
+    async def _acall_once(
+        self,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        acquire: Optional[Callable[[], Awaitable[Any]]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        start = time.monotonic()
+        hedge_after = self._hedge_after()
+        deadline = start + self.timeout if self.timeout else None
+        hedge_at = start + hedge_after if hedge_after is not None else None
+        pending: Set[asyncio.Future] = {
+            asyncio.ensure_future(self._atimed(fn, *args, **kwargs))
+        }
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                wakeups = [at for at in (deadline, hedge_at) if at is not None]
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=(
+                        max(0.0, min(wakeups) - time.monotonic()) if wakeups else None
+                    ),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for future in done:
+                    if future.exception() is None:
+                        return future.result()
+                    error = future.exception()
+
+                now = time.monotonic()
+                if deadline is not None and now >= deadline:
+                    break
+                if pending and hedge_at is not None and now >= hedge_at:
+                    pending.add(
+                        asyncio.ensure_future(
+                            self._atimed(fn, *args, acquire=acquire, **kwargs)
+                        )
+                    )
+                    hedge_at = None
+        finally:
+            for future in pending:
+                future.cancel()
+
+        if pending or error is None:
+            raise LLMCallTimeoutError(f"LLM call timed out after {self.timeout}s.")
+        raise error
+
+    def _submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        acquire: Optional[Callable[[], Any]] = None,
+        **kwargs: Any,
+    ) -> Future:
+        """Makes the call on a daemon thread.
+
+        A running thread can't be stopped, so a hung call is abandoned on its thread,
+        which doesn't hold later calls nor the exit of the process.
+        """
+        future: Future = Future()
+        # Each call gets a copy of the context, so callbacks relying on it still work.
+        context = contextvars.copy_context()
+
+        def run() -> None:
+            try:
+                if acquire:
+                    context.run(acquire)
+                if not future.set_running_or_notify_cancel():
+                    return
+                result = context.run(self._timed, fn, *args, **kwargs)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, name="crewai-llm-call", daemon=True).start()
+        return future
+
+    def _timed(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        start = time.monotonic()
+        result = fn(*args, **kwargs)
+        self._record_latency(time.monotonic() - start)
+        return result
+
+    async def _atimed(
+        self,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        acquire: Optional[Callable[[], Awaitable[Any]]] = None,
+        **kwargs: Any,
+    ) -> Any:
+        if acquire:
+            await acquire()
+        start = time.monotonic()
+        result = await fn(*args, **kwargs)
+        self._record_latency(time.monotonic() - start)
+        return result
+
+    def _record_latency(self, latency: float) -> None:
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _hedge_after(self) -> Optional[float]:
+        """Returns after how many seconds a call is duplicated, if it is."""
+        if not self.hedge:
+            return None
+        if self.hedge_after is not None:
+            return self.hedge_after
+
+        with self._lock:
+            latencies = sorted(self._latencies)
+        if len(latencies) < self.min_latency_samples:
+            return None
+        return latencies[int(0.95 * (len(latencies) - 1))]
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(
+            0, min(self.backoff_max, self.backoff_base * 2**attempt)
+        )
+
+    @staticmethod
+    def _retryable(error: Exception) -> bool:
+        if isinstance(error, (TimeoutError, openai.APIConnectionError)):
+            return True
+        status_code = getattr(error, "status_code", None)
+        if status_code is None:
+            status_code = getattr(getattr(error, "response", None), "status_code", None)
+        return isinstance(status_code, int) and (
+            status_code == 429 or status_code >= 500
+        )
+
+    def _wait(self, seconds: float) -> None:
+        time.sleep(seconds)
@@ -14,13 +14,17 @@ class Prompts(BaseModel):
     system_template: Optional[str] = None
     prompt_template: Optional[str] = None
     response_template: Optional[str] = None
+    native_tools: bool = False
+    parallel_tools: bool = False
     SCRATCHPAD_SLICE: ClassVar[str] = "\n{agent_scratchpad}"
 
     def task_execution(self) -> BasePromptTemplate:
         """Generate a standard prompt for task execution."""
         slices = ["role_playing"]
         if len(self.tools) > 0:
-            slices.append("tools")
+            slices.append("native_tools" if self.native_tools else "tools")
+            if self.parallel_tools and not self.native_tools:
+                slices.append("parallel_tools")
         else:
             slices.append("no_tools")
 
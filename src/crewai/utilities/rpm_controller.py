@@ -1,59 +1,262 @@
+import asyncio
+import sqlite3
 import threading
 import time
-from typing import Union
+import warnings
+from typing import Any, Dict, List, Optional, Set, Union
+from uuid import UUID
 
+import tiktoken
+from langchain.callbacks.base import BaseCallbackHandler
+from langchain.schema import LLMResult
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, model_validator
 
 from crewai.utilities.logger import Logger
+from crewai.utilities.paths import db_storage_path
+from crewai.utilities.printer import Printer
+
+LIMITS = {"requests": "RPM", "tokens": "TPM"}
+
+
+class TokenBucket:
+    """Bucket holding up to a minute worth of budget, refilled continuously.
+
+    The budget can go negative, so requests reserve their share right away and
+    wait for the bucket to refill outside of any lock.
+    """
+
+    def __init__(
+        self,
+        per_minute: int,
+        available: Optional[float] = None,
+        updated_at: Optional[float] = None,
+    ):
+        self.capacity = per_minute
+        self.rate = per_minute / 60
+        self.available = float(per_minute) if available is None else available
+        self.updated_at = time.time() if updated_at is None else updated_at
+
+    def take(self, amount: float) -> float:
+        """Takes the amount from the bucket and returns how long to wait for it."""
+        now = time.time()
+        self.available = min(
+            self.capacity, self.available + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+        self.available -= amount
+        return max(0.0, -self.available / self.rate)
 
 
 class RPMController(BaseModel):
+    """Rate limiter with a requests per minute and a tokens per minute budget.
+
+    Each model gets its own budgets. Requests wait until both budgets of their
+    model have room, and the tokens they use are charged once they are done.
+    """
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
     max_rpm: Union[int, None] = Field(default=None)
+    max_tpm: Union[int, None] = Field(default=None)
     logger: Logger = Field(default=None)
-    _current_rpm: int = PrivateAttr(default=0)
-    _timer: threading.Timer | None = PrivateAttr(default=None)
-    _lock: threading.Lock = PrivateAttr(default=None)
-    _shutdown_flag = False
+    _lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+    _buckets: Dict[Optional[str], Dict[str, TokenBucket]] = PrivateAttr(
+        default_factory=dict
+    )
 
-    @model_validator(mode="after")
-    def reset_counter(self):
+    def acquire(self, model: Optional[str] = None) -> bool:
+        """Wait until a request to the model is within the budgets."""
+        wait = self._reserve(model)
+        if wait:
+            self._wait(wait)
+        return True
+
+    async def aacquire(self, model: Optional[str] = None) -> bool:
+        """Asynchronously wait until a request to the model is within the budgets."""
+        wait = self._reserve(model)
+        if wait:
+            await asyncio.sleep(wait)
+        return True
+
+    def check_or_wait(self) -> bool:
+        """Deprecated alias of acquire."""
+        warnings.warn(
+            "RPMController.check_or_wait is deprecated, use acquire instead.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.acquire()
+
+    def stop_rpm_counter(self) -> None:
+        """Deprecated, the budgets refill without a timer so there is nothing to stop."""
+        warnings.warn(
+            "RPMController.stop_rpm_counter is deprecated and does nothing.",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+    def record_tokens(self, tokens: int, model: Optional[str] = None) -> None:
+        """Charge the tokens used by a request to the model."""
+        if self.max_tpm:
+            self._take(model, {"tokens": tokens})
+
+    def _reserve(self, model: Optional[str]) -> float:
+        """Reserve a request to the model and returns how long to wait for it."""
+        amounts: Dict[str, float] = {}
         if self.max_rpm:
-            if not self._shutdown_flag:
-                self._lock = threading.Lock()
-                self._reset_request_count()
-        return self
+            amounts["requests"] = 1
+        if self.max_tpm:
+            amounts["tokens"] = 0
+        if not amounts:
+            return 0.0
 
-    def check_or_wait(self):
-        if not self.max_rpm:
-            return True
+        wait, kind = max(
+            (wait, kind) for kind, wait in self._take(model, amounts).items()
+        )
+        if wait and self.logger:
+            self.logger.log(
+                "info",
+                f"Max {LIMITS[kind]} reached, waiting {wait:.1f}s for the next request.",
+            )
+        return wait
 
+    def _take(
+        self, model: Optional[str], amounts: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Takes the amounts from the model's buckets and returns the waits for each."""
         with self._lock:
-            if self._current_rpm < self.max_rpm:
-                self._current_rpm += 1
-                return True
-            else:
-                self.logger.log(
-                    "info", "Max RPM reached, waiting for next minute to start."
+            buckets = self._buckets.setdefault(model, {})
+            for kind in amounts:
+                if kind not in buckets:
+                    buckets[kind] = TokenBucket(self._per_minute(kind))
+            return {
+                kind: buckets[kind].take(amount) for kind, amount in amounts.items()
+            }
+
+    def _per_minute(self, kind: str) -> int:
+        return self.max_rpm if kind == "requests" else self.max_tpm
+
+    def _wait(self, seconds: float) -> None:
+        time.sleep(seconds)
+
+
+class SQLiteRPMController(RPMController):
+    """RPMController storing its budgets in a SQLite database, so every process
+    using the same database shares them.
+    """
+
+    db_path: Optional[str] = Field(default=None)
+    _printer: Printer = PrivateAttr(default_factory=Printer)
+
+    @model_validator(mode="after")
+    def _initialize_db(self) -> "SQLiteRPMController":
+        """
+        Initializes the SQLite database and creates the rate_limit_buckets table
+        """
+        self.db_path = self.db_path or f"{db_storage_path()}/rate_limits.db"
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS rate_limit_buckets (
+                        model TEXT,
+                        kind TEXT,
+                        available REAL,
+                        updated_at REAL,
+                        PRIMARY KEY (model, kind)
+                    )
+                """
                 )
-                self._wait_for_next_minute()
-                self._current_rpm = 1
-                return True
 
-    def stop_rpm_counter(self):
-        if self._timer:
-            self._timer.cancel()
-            self._timer = None
+                conn.commit()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"RATE LIMIT ERROR: An error occurred during database initialization: {e}",
+                color="red",
+            )
+        return self
 
-    def _wait_for_next_minute(self):
-        time.sleep(60)
-        self._current_rpm = 0
+    def _take(
+        self, model: Optional[str], amounts: Dict[str, float]
+    ) -> Dict[str, float]:
+        """Takes the amounts from the model's buckets in a single transaction, so
+        concurrent processes don't overdraw them. Falls back to the buckets of
+        this process if the database can't be used."""
+        waits = {}
+        try:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                for kind, amount in amounts.items():
+                    row = conn.execute(
+                        "SELECT available, updated_at FROM rate_limit_buckets WHERE model = ? AND kind = ?",
+                        (model or "", kind),
+                    ).fetchone()
+                    bucket = TokenBucket(self._per_minute(kind), *(row or ()))
+                    waits[kind] = bucket.take(amount)
+                    conn.execute(
+                        """
+                    INSERT OR REPLACE INTO rate_limit_buckets (model, kind, available, updated_at)
+                    VALUES (?, ?, ?, ?)
+                """,
+                        (model or "", kind, bucket.available, bucket.updated_at),
+                    )
+                conn.execute("COMMIT")
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self._printer.print(
+                content=f"RATE LIMIT ERROR: An error occurred while updating the rate limits, using the limits of this process instead: {e}",
+                color="red",
+            )
+            return super()._take(model, amounts)
+        return waits
 
-    def _reset_request_count(self):
-        with self._lock:
-            self._current_rpm = 0
-        if self._timer:
-            self._shutdown_flag = True
-            self._timer.cancel()
-        self._timer = threading.Timer(60.0, self._reset_request_count)
-        self._timer.start()
+
+class RPMControllerHandler(BaseCallbackHandler):
+    """Callback handler that charges the tokens of every request to the controller."""
+
+    def __init__(self, rpm_controller: RPMController, model: Optional[str] = None):
+        self.rpm_controller = rpm_controller
+        self.model = model
+        # Runs whose tokens are charged as they are streamed, streams closed
+        # early don't end.
+        self._streamed_runs: Set[UUID] = set()
+        if model and "gpt" in model:
+            try:
+                self.encoding = tiktoken.encoding_for_model(model)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+        else:
+            self.encoding = tiktoken.get_encoding("cl100k_base")
+
+    def on_llm_start(
+        self, serialized: Dict[str, Any], prompts: List[str], **kwargs: Any
+    ) -> None:
+        self._record(prompts)
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        self._streamed_runs.add(run_id)
+        self._record([token])
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        if run_id in self._streamed_runs:
+            self._streamed_runs.discard(run_id)
+            return
+        self._record(
+            [
+                generation.text
+                for generations in response.generations
+                for generation in generations
+            ]
+        )
+
+    def on_llm_error(
+        self, error: BaseException, *, run_id: UUID, **kwargs: Any
+    ) -> None:
+        self._streamed_runs.discard(run_id)
+
+    def _record(self, texts: List[str]) -> None:
+        self.rpm_controller.record_tokens(
+            sum(len(self.encoding.encode(text)) for text in texts), self.model
+        )
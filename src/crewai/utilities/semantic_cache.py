@@ -0,0 +1,58 @@
+import hashlib
+import threading
+from typing import Optional
+
+from crewai.memory.storage.rag_storage import RAGStorage
+
+
+class SemanticCache:
+    """
+    Cache for the results of the tasks, looked up by the similarity of their
+    prompts so prompts that only differ slightly share the same result.
+    Entries are scoped per agent role and model.
+    """
+
+    def __init__(self, embedder_config=None, threshold: float = 0.95):
+        self.storage = RAGStorage(
+            type="semantic_cache", allow_reset=False, embedder_config=embedder_config
+        )
+        self.threshold = threshold
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def lookup(self, prompt: str, role: str, model: str) -> Optional[str]:
+        """Returns the result of the most similar prompt, if it's similar enough."""
+        results = self.storage.search(
+            query=prompt,
+            limit=1,
+            filter={"role": role, "model": model},
+            score_threshold=0,
+        )
+        result = None
+        if results and self._similarity(results[0]["metadata"]["score"]) >= (
+            self.threshold
+        ):
+            result = results[0]["metadata"]["result"]
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return result
+
+    def save(self, prompt: str, role: str, model: str, result: str) -> None:
+        """Caches the result of the prompt."""
+        key = hashlib.sha256(f"{role}\n{model}\n{prompt}".encode()).hexdigest()
+        # The prompt is saved as a single document, chunks of it would match
+        # prompts that only share part of their content.
+        self.storage.save(
+            prompt, {"role": role, "model": model, "result": result}, key=key
+        )
+
+    @staticmethod
+    def _similarity(distance: float) -> float:
+        # Chroma returns the squared L2 distance of the embeddings, which for
+        # normalized embeddings is 2 - 2 * their cosine similarity.
+        return 1 - distance / 2
@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+import tiktoken
+
+
+@lru_cache(maxsize=None)
+def _encoding() -> tiktoken.Encoding:
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens(text: str) -> int:
+    """Returns the number of tokens of the text."""
+    return len(_encoding().encode(text, disallowed_special=()))
+
+
+def keep_first_tokens(text: str, max_tokens: int) -> str:
+    """Returns the start of the text, up to max_tokens tokens."""
+    tokens = _encoding().encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return _encoding().decode(tokens[: max(0, max_tokens)])
+
+
+def keep_last_tokens(text: str, max_tokens: int) -> str:
+    """Returns the end of the text, up to max_tokens tokens."""
+    tokens = _encoding().encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return _encoding().decode(tokens[len(tokens) - max(0, max_tokens) :])
@@ -1,3 +1,4 @@
+import threading
 from typing import Any, Dict, List
 
 import tiktoken
@@ -11,16 +12,35 @@ class TokenProcess:
     completion_tokens: int = 0
     successful_requests: int = 0
 
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    def __copy__(self) -> "TokenProcess":
+        """Copies the counters, the copy gets a lock of its own."""
+        copied = TokenProcess()
+        with self._lock:
+            copied.total_tokens = self.total_tokens
+            copied.prompt_tokens = self.prompt_tokens
+            copied.completion_tokens = self.completion_tokens
+            copied.successful_requests = self.successful_requests
+        return copied
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "TokenProcess":
+        return self.__copy__()
+
     def sum_prompt_tokens(self, tokens: int):
-        self.prompt_tokens = self.prompt_tokens + tokens
-        self.total_tokens = self.total_tokens + tokens
+        with self._lock:
+            self.prompt_tokens = self.prompt_tokens + tokens
+            self.total_tokens = self.total_tokens + tokens
 
     def sum_completion_tokens(self, tokens: int):
-        self.completion_tokens = self.completion_tokens + tokens
-        self.total_tokens = self.total_tokens + tokens
+        with self._lock:
+            self.completion_tokens = self.completion_tokens + tokens
+            self.total_tokens = self.total_tokens + tokens
 
     def sum_successful_requests(self, requests: int):
-        self.successful_requests = self.successful_requests + requests
+        with self._lock:
+            self.successful_requests = self.successful_requests + requests
 
     def get_summary(self) -> str:
         return {
@@ -58,3 +78,9 @@ class TokenCalcHandler(BaseCallbackHandler):
 
     def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
         self.token_cost_process.sum_successful_requests(1)
+
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        # Agents streaming their steps close the stream once it holds a
+        # complete action, its tokens were already counted as they came.
+        if isinstance(error, GeneratorExit):
+            self.token_cost_process.sum_successful_requests(1)
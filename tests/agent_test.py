@@ -1,5 +1,7 @@
 """Test Agent creation and execution basic functionality."""
 
+import threading
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import pytest
@@ -16,6 +18,20 @@ from crewai.tools.tool_usage import ToolUsage
 from crewai.utilities import RPMController
 
 
+@contextmanager
+def prepared_agent_executors():
+    """Collects the agent executors prepared for each execution."""
+    agent_executors = []
+    prepare_agent_executor = Agent._prepare_agent_executor
+
+    def prepare(self, task, tools=None):
+        agent_executors.append(prepare_agent_executor(self, task, tools))
+        return agent_executors[-1]
+
+    with patch.object(Agent, "_prepare_agent_executor", prepare):
+        yield agent_executors
+
+
 def test_agent_creation():
     agent = Agent(role="test role", goal="test goal", backstory="test backstory")
 
@@ -157,8 +173,8 @@ def test_cache_hitting():
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
     assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
+        'multiplier-{"first_number":2,"second_number":6}': 12,
+        'multiplier-{"first_number":3,"second_number":3}': 9,
     }
 
     task = Task(
@@ -170,9 +186,9 @@ def test_cache_hitting():
     assert output == "36"
 
     assert cache_handler._cache == {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
+        'multiplier-{"first_number":2,"second_number":6}': 12,
+        'multiplier-{"first_number":3,"second_number":3}': 9,
+        'multiplier-{"first_number":12,"second_number":3}': 36,
     }
 
     with patch.object(CacheHandler, "read") as read:
@@ -223,8 +239,8 @@ def test_disabling_cache_for_agent():
     output = agent.execute_task(task1)
     output = agent.execute_task(task2)
     assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
+        'multiplier-{"first_number":2,"second_number":6}': 12,
+        'multiplier-{"first_number":3,"second_number":3}': 9,
     }
 
     task = Task(
@@ -236,9 +252,9 @@ def test_disabling_cache_for_agent():
     assert output == "36"
 
     assert cache_handler._cache != {
-        "multiplier-{'first_number': 2, 'second_number': 6}": 12,
-        "multiplier-{'first_number': 3, 'second_number': 3}": 9,
-        "multiplier-{'first_number': 12, 'second_number': 3}": 36,
+        'multiplier-{"first_number":2,"second_number":6}': 12,
+        'multiplier-{"first_number":3,"second_number":3}': 9,
+        'multiplier-{"first_number":12,"second_number":3}': 36,
     }
 
     with patch.object(CacheHandler, "read") as read:
@@ -424,7 +440,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         allow_delegation=False,
     )
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         task = Task(
             description="Use tool logic for `get_final_answer` but fon't give you final answer yet, instead keep using it unless you're told to give your final answer",
@@ -436,7 +452,7 @@ def test_agent_respect_the_max_rpm_set(capsys):
         )
         assert output == "42"
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached" in captured.out
         moveon.assert_called()
 
 
@@ -470,11 +486,11 @@ def test_agent_respect_the_max_rpm_set_over_crew_rpm(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=1, verbose=2)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." not in captured.out
+        assert "Max RPM reached" not in captured.out
         moveon.assert_not_called()
 
 
@@ -522,12 +538,12 @@ def test_agent_without_max_rpm_respet_crew_rpm(capsys):
 
     crew = Crew(agents=[agent1, agent2], tasks=tasks, max_rpm=1, verbose=2)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
         assert "get_final_answer" in captured.out
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached" in captured.out
         moveon.assert_called_once()
 
 
@@ -842,3 +858,693 @@ Thought:
 
 """
     )
+
+
+def test_agent_execute_task_async():
+    import asyncio
+
+    from langchain_core.language_models.fake import FakeListLLM
+
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        llm=FakeListLLM(
+            responses=[
+                'Thought: I need to multiply\nAction: multiplier\nAction Input: {"first_number": 3, "second_number": 4}',
+                "Thought: I now know the final answer\nFinal Answer: 12",
+            ]
+        ),
+    )
+
+    task = Task(
+        description="What is 3 times 4?",
+        agent=agent,
+        expected_output="The result of the multiplication.",
+    )
+
+    output = asyncio.run(agent.execute_task_async(task, tools=[multiplier]))
+
+    assert output == "12"
+    assert agent.tools_handler.last_used_tool.arguments == {
+        "first_number": 3,
+        "second_number": 4,
+    }
+
+
+def test_agent_reuses_executor_across_tasks_and_kickoffs():
+    from langchain_core.language_models.fake import FakeListLLM
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        llm=FakeListLLM(
+            responses=["Thought: I now know the final answer\nFinal Answer: ok"]
+        ),
+    )
+    tasks = [
+        Task(
+            description=f"Say ok for the {number} time.",
+            expected_output="ok",
+            agent=agent,
+        )
+        for number in ["first", "second"]
+    ]
+    crew = Crew(agents=[agent], tasks=tasks)
+
+    with patch.object(
+        Agent, "_build_agent_executor", wraps=agent._build_agent_executor
+    ) as build_agent_executor:
+        assert crew.kickoff() == "ok"
+        assert crew.kickoff() == "ok"
+
+    build_agent_executor.assert_called_once()
+    # Executions work on copies, the agent's executor isn't tied to any of them.
+    assert agent.agent_executor.task is None
+
+    agent.goal = "new test goal"
+    agent.create_agent_executor()
+    assert "new test goal" in str(agent.agent_executor.agent.runnable)
+
+
+def test_agent_executes_several_tasks_concurrently():
+    from concurrent.futures import ThreadPoolExecutor
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+    )
+    tasks = [
+        Task(description=f"Say {answer}.", expected_output=answer, agent=agent)
+        for answer in ["first", "second"]
+    ]
+    barrier = threading.Barrier(len(tasks), timeout=10)
+
+    def invoke(self, inputs, config=None):
+        # Both executions are in flight before either of them answers.
+        barrier.wait()
+        return {"output": self.task.expected_output}
+
+    with patch.object(CrewAgentExecutor, "invoke", autospec=True, side_effect=invoke):
+        with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+            results = list(pool.map(agent.execute_task, tasks))
+
+    assert results == ["first", "second"]
+
+
+def test_agents_count_tokens_with_locks_of_their_own():
+    import copy
+
+    agents = [
+        Agent(role="test role", goal="test goal", backstory="test backstory")
+        for _ in range(2)
+    ]
+    agents[0]._token_process.sum_prompt_tokens(3)
+    copied_token_process = copy.deepcopy(agents[0]._token_process)
+
+    assert agents[0]._token_process is not agents[1]._token_process
+    assert agents[0]._token_process._lock is not agents[1]._token_process._lock
+    assert copied_token_process._lock is not agents[0]._token_process._lock
+    assert copied_token_process.get_summary() == agents[0]._token_process.get_summary()
+
+
+def test_agent_caches_llm_responses(tmp_path):
+    from langchain_core.language_models.fake import FakeListLLM
+
+    from crewai.utilities.llm_cache import LLMSQLiteCache
+
+    llm_cache = LLMSQLiteCache(db_path=str(tmp_path / "llm_cache.db"))
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        llm=FakeListLLM(
+            responses=[
+                "Thought: I now know the final answer\nFinal Answer: first",
+                "Thought: I now know the final answer\nFinal Answer: second",
+            ]
+        ),
+        llm_cache=llm_cache,
+    )
+    task = Task(description="Say something.", expected_output="something", agent=agent)
+
+    assert agent.llm.cache is llm_cache
+    assert agent.execute_task(task) == "first"
+    assert agent.execute_task(task) == "first"
+    assert (llm_cache.hits, llm_cache.misses) == (1, 1)
+
+    llm_cache.ttl = 0
+    assert agent.execute_task(task) == "second"
+
+
+def test_agent_caches_the_responses_of_streaming_chat_models(tmp_path):
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from crewai.utilities.llm_cache import LLMSQLiteCache
+
+    llm_cache = LLMSQLiteCache(db_path=str(tmp_path / "llm_cache.db"))
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        llm=FakeListChatModel(
+            responses=[
+                "Thought: I now know the final answer\nFinal Answer: first",
+                "Thought: I now know the final answer\nFinal Answer: second",
+            ]
+        ),
+        llm_cache=llm_cache,
+        stream_steps=True,
+    )
+    task = Task(description="Say something.", expected_output="something", agent=agent)
+
+    assert agent.execute_task(task) == "first"
+    assert agent.execute_task(task) == "first"
+    assert (llm_cache.hits, llm_cache.misses) == (1, 1)
+
+
+def test_llm_cache_evicts_least_recently_used_responses(tmp_path):
+    from langchain_core.outputs import Generation
+
+    from crewai.utilities.llm_cache import LLMSQLiteCache
+
+    llm_cache = LLMSQLiteCache(db_path=str(tmp_path / "llm_cache.db"), max_entries=2)
+    llm_cache.update("first", "llm", [Generation(text="1")])
+    llm_cache.update("second", "llm", [Generation(text="2")])
+    assert llm_cache.lookup("first", "llm") == [Generation(text="1")]
+
+    llm_cache.update("third", "llm", [Generation(text="3")])
+
+    assert llm_cache.lookup("second", "llm") is None
+    assert llm_cache.lookup("first", "llm") == [Generation(text="1")]
+    assert llm_cache.lookup("third", "llm") == [Generation(text="3")]
+
+
+def test_agent_respect_the_max_tpm_set(capsys):
+    from langchain_core.language_models.fake import FakeListLLM
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        max_tpm=10,
+        verbose=True,
+        allow_delegation=False,
+        llm=FakeListLLM(
+            responses=["Thought: I now know the final answer\nFinal Answer: ok"]
+        ),
+    )
+    task = Task(description="Say ok.", expected_output="ok", agent=agent)
+
+    with patch.object(RPMController, "_wait") as wait:
+        assert agent.execute_task(task) == "ok"
+        wait.assert_not_called()
+        assert agent.execute_task(task) == "ok"
+        wait.assert_called_once()
+    assert "Max TPM reached" in capsys.readouterr().out
+
+
+def test_rpm_controller_waits_without_holding_its_lock():
+    import asyncio
+
+    controller = RPMController(max_rpm=60)
+
+    def wait(seconds):
+        assert not controller._lock.locked()
+        assert seconds == pytest.approx(1, abs=0.1)
+
+    with patch.object(RPMController, "_wait", side_effect=wait) as moveon:
+        for _ in range(61):
+            controller.acquire("gpt-4")
+        controller.acquire("gpt-3.5-turbo")
+    moveon.assert_called_once()
+
+    with patch("asyncio.sleep") as sleep:
+        asyncio.run(controller.aacquire("gpt-4"))
+    assert sleep.call_args.args[0] == pytest.approx(2, abs=0.1)
+
+
+def test_rpm_controller_keeps_its_deprecated_methods():
+    controller = RPMController(max_rpm=1)
+
+    with patch.object(RPMController, "_wait") as moveon:
+        with pytest.deprecated_call():
+            assert controller.check_or_wait() is True
+        with pytest.deprecated_call():
+            assert controller.check_or_wait() is True
+    moveon.assert_called_once()
+
+    with pytest.deprecated_call():
+        controller.stop_rpm_counter()
+
+
+def test_agent_stream_steps_stops_the_llm_once_the_action_is_complete():
+    import asyncio
+
+    from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+    from langchain_core.messages import AIMessage
+
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    # The model doesn't stop at the observation, and makes one up.
+    responses = [
+        'Thought: I need to multiply\nAction: multiplier\nAction Input: {"first_number": 3, "second_number": 4}\nObservation: 13\nThought: I now know the final answer\nFinal Answer: 13',
+        "Thought: I now know the final answer\nFinal Answer: 12",
+    ]
+
+    def stream_agent():
+        return Agent(
+            role="test role",
+            goal="test goal",
+            backstory="test backstory",
+            allow_delegation=False,
+            stream_steps=True,
+            llm=GenericFakeChatModel(
+                messages=iter([AIMessage(content=response) for response in responses])
+            ),
+        )
+
+    task = Task(
+        description="What is 3 times 4?",
+        expected_output="The result of the multiplication.",
+        tools=[multiplier],
+    )
+
+    agent = stream_agent()
+    with patch.object(ToolUsage, "use", wraps=ToolUsage.use, autospec=True) as use:
+        assert agent.execute_task(task, tools=[multiplier]) == "12"
+    assert use.call_args.args[2].endswith('"second_number": 4}')
+
+    agent = stream_agent()
+    assert asyncio.run(agent.execute_task_async(task, tools=[multiplier])) == "12"
+
+
+def test_stream_parser_skips_braces_in_quoted_strings():
+    from crewai.agents.parser import CrewAgentStreamParser
+
+    for action_input in ["{'q': '}'}", '{"q": "it\'s }"}', "{'q': 'a \\' }'}"]:
+        parser = CrewAgentStreamParser()
+        tokens = ["Action: search\nAction Input: ", *action_input, "\nmore"]
+        assert any(parser.feed(token) for token in tokens)
+        assert parser.text.endswith(action_input)
+
+
+def test_tokens_of_streams_closed_early_are_counted():
+    from contextlib import closing
+
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    from crewai.utilities.rpm_controller import RPMControllerHandler
+    from crewai.utilities.token_counter_callback import TokenCalcHandler, TokenProcess
+
+    controller = RPMController(max_tpm=1000)
+    token_process = TokenProcess()
+    callbacks = [
+        RPMControllerHandler(controller, model="gpt-4"),
+        TokenCalcHandler("gpt-4", token_process),
+    ]
+    llm = FakeListChatModel(responses=["abcdefgh"])
+
+    with patch.object(RPMController, "record_tokens") as record_tokens:
+        with closing(llm.stream("hi", config={"callbacks": callbacks})) as chunks:
+            for chunk in chunks:
+                if chunk.content == "c":
+                    break
+
+    assert token_process.successful_requests == 1
+    assert token_process.completion_tokens == 3
+    # The prompt, then each of the chunks consumed.
+    assert [call.args[0] for call in record_tokens.call_args_list][1:] == [1, 1, 1]
+
+
+def test_scratchpad_only_formats_new_steps():
+    from langchain_core.agents import AgentAction
+
+    from crewai.agents import Scratchpad
+
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    steps = [
+        (AgentAction("multiplier", str(i), f"Thought: step {i}"), f"{i * 2}")
+        for i in range(3)
+    ]
+    scratchpad = Scratchpad()
+
+    scratchpad.update(steps[:2])
+    expected = agent.format_log_to_str(steps)
+    with patch.object(Scratchpad, "_reset") as reset:
+        assert scratchpad.update(steps) == expected
+    reset.assert_not_called()
+    assert scratchpad.delta == "Thought: step 2\nObservation: 4\n"
+    assert len(scratchpad.step_tokens()) == 3
+
+    assert scratchpad.update(steps[1:]) == agent.format_log_to_str(steps[1:])
+
+
+def test_agent_compacts_prompts_to_max_prompt_tokens():
+    from langchain_core.language_models.fake import FakeListLLM
+
+    from crewai.utilities.token_budget import count_tokens
+
+    @tool
+    def search(query: str) -> str:
+        """Search the web for the query."""
+        return f"{query} " * 300
+
+    actions = [
+        f'Thought: I should search\nAction: search\nAction Input: {{"query": "q{i}"}}'
+        for i in range(4)
+    ]
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        max_prompt_tokens=1200,
+        llm=FakeListLLM(
+            responses=actions
+            + ["Thought: I now know the final answer\nFinal Answer: done"]
+        ),
+    )
+    task = Task(description="Search four times.", expected_output="done")
+
+    with patch.object(
+        FakeListLLM, "_call", autospec=True, side_effect=FakeListLLM._call
+    ) as call:
+        assert (
+            agent.execute_task(task, context="lorem " * 2000, tools=[search]) == "done"
+        )
+
+    prompts = [call_args.args[1] for call_args in call.call_args_list]
+    assert len(prompts) == 5
+    # Token counts are estimates, they can be off by a token where texts are joined.
+    assert all(count_tokens(prompt) <= 1200 + 5 for prompt in prompts)
+    assert agent.i18n.slice("trimmed_context") in prompts[0]
+    assert prompts[-1].count(agent.i18n.slice("compacted_observation")) >= 2
+    assert "q3 q3" in prompts[-1]
+
+
+def test_agent_retries_llm_calls_with_its_call_policy():
+    from langchain_core.language_models.fake import FakeListLLM
+
+    from crewai.utilities import LLMCallPolicy
+
+    class RateLimitError(Exception):
+        status_code = 429
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        llm=FakeListLLM(responses=[]),
+        llm_call_policy=LLMCallPolicy(timeout=5, max_retries=1),
+    )
+    task = Task(description="Say ok.", expected_output="ok", agent=agent)
+
+    with patch.object(
+        FakeListLLM,
+        "_call",
+        autospec=True,
+        side_effect=[
+            RateLimitError(),
+            "Thought: I now know the final answer\nFinal Answer: ok",
+        ],
+    ) as call, patch.object(LLMCallPolicy, "_wait") as wait:
+        assert agent.execute_task(task) == "ok"
+    assert call.call_count == 2
+    wait.assert_called_once()
+
+
+def test_agent_uses_native_tool_calls():
+    from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+    from langchain_core.messages import AIMessage
+
+    from crewai.utilities import Converter
+
+    class ToolCallingFakeChatModel(GenericFakeChatModel):
+        def bind_tools(self, tools, **kwargs):
+            return self
+
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        native_tool_calling=True,
+        function_calling_llm=ChatOpenAI(model="gpt-4"),
+        llm=ToolCallingFakeChatModel(
+            messages=iter(
+                [
+                    AIMessage(
+                        content="",
+                        tool_calls=[
+                            {
+                                "name": "multiplier",
+                                "args": {"first_number": 3, "second_number": 4},
+                                "id": "call_1",
+                            },
+                            {
+                                "name": "multiplier",
+                                "args": {"first_number": 5, "second_number": 6},
+                                "id": "call_2",
+                            },
+                        ],
+                    ),
+                    AIMessage(content="12 and 30"),
+                ]
+            )
+        ),
+    )
+    task = Task(
+        description="What are 3 times 4 and 5 times 6?",
+        expected_output="The results of the multiplications.",
+    )
+
+    with patch.object(
+        ToolUsage, "use", wraps=ToolUsage.use, autospec=True
+    ) as use, patch.object(Converter, "to_pydantic") as to_pydantic, patch.object(
+        ToolUsage, "_validate_tool_input"
+    ) as validate_tool_input, prepared_agent_executors() as agent_executors:
+        assert agent.execute_task(task, tools=[multiplier]) == "12 and 30"
+
+    # Both calls run concurrently, in any order.
+    arguments = [call.args[1].arguments for call in use.call_args_list]
+    assert sorted(arguments, key=lambda arguments: arguments["first_number"]) == [
+        {"first_number": 3, "second_number": 4},
+        {"first_number": 5, "second_number": 6},
+    ]
+    to_pydantic.assert_not_called()
+    validate_tool_input.assert_not_called()
+    assert "Invoking: `multiplier`" in agent_executors[0].scratchpad.text
+
+
+def test_parser_only_splits_numbered_actions_of_parallel_tool_calls():
+    text = (
+        'Thought: x\nAction: search\nAction Input: {"query": "SF"}\n'
+        "Observation: result\nThought: y\n"
+        'Action: search\nAction Input: {"query": "NYC"}'
+    )
+    for parser in [CrewAgentParser(), CrewAgentParser(parallel_tool_calls=True)]:
+        action = parser.parse(text)
+        assert action.tool == "search"
+        assert action.tool_input.startswith('{"query": "SF"}')
+
+    numbered = (
+        "Thought: x\n"
+        'Action 1: search\nAction Input 1: {"query": "SF"}\n'
+        'Action 2: search\nAction Input 2: {"query": "NYC"}'
+    )
+    assert not isinstance(CrewAgentParser().parse(numbered), list)
+    actions = CrewAgentParser(parallel_tool_calls=True).parse(numbered)
+    assert [action.tool_input for action in actions] == [
+        '{"query": "SF"}',
+        '{"query": "NYC"}',
+    ]
+
+
+def test_agent_runs_parallel_tool_calls_concurrently():
+    import time
+
+    from langchain_core.language_models.fake import FakeListLLM
+
+    # Each tool waits for the other, so they only finish when run concurrently.
+    barrier = threading.Barrier(2, timeout=5)
+
+    @tool
+    def search(query: str) -> str:
+        """Search the web for the query."""
+        barrier.wait()
+        if query == "SF":
+            # The first action finishes last.
+            time.sleep(0.05)
+        return f"results for {query}"
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        parallel_tool_calls=True,
+        llm=FakeListLLM(
+            responses=[
+                "Thought: I should search both\n"
+                'Action 1: search\nAction Input 1: {"query": "SF"}\n'
+                'Action 2: search\nAction Input 2: {"query": "NYC"}',
+                "Thought: I now know the final answer\nFinal Answer: done",
+            ]
+        ),
+    )
+    task = Task(description="Search SF and NYC.", expected_output="done")
+
+    with prepared_agent_executors() as agent_executors:
+        assert agent.execute_task(task, tools=[search]) == "done"
+    scratchpad = agent_executors[0].scratchpad.text
+    assert "Action 1: search" in scratchpad
+    assert scratchpad.index("results for SF") < scratchpad.index("results for NYC")
+    assert agent.i18n.slice("parallel_tools") in agent_executors[0].prompt.template
+    assert task.used_tools == 2
+    assert agent.tools_handler.last_used_tool.arguments == {"query": "NYC"}
+
+
+def test_agent_awaits_async_tools():
+    import asyncio
+
+    from langchain_core.language_models.fake import FakeListLLM
+    from langchain_core.tools import StructuredTool
+
+    threads = []
+
+    def search(query: str) -> str:
+        """Search the web for the query."""
+        raise AssertionError("The async tool must be awaited.")
+
+    async def asearch(query: str) -> str:
+        threads.append(threading.get_ident())
+        await asyncio.sleep(0)
+        return f"results for {query}"
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        llm=FakeListLLM(
+            responses=[
+                'Thought: I should search\nAction: search\nAction Input: {"query": "SF"}',
+                "Thought: I now know the final answer\nFinal Answer: done",
+            ]
+        ),
+    )
+    task = Task(description="Search SF.", expected_output="done")
+    search_tool = StructuredTool.from_function(func=search, coroutine=asearch)
+
+    async def execute() -> str:
+        threads.append(threading.get_ident())
+        return await agent.execute_task_async(task, tools=[search_tool])
+
+    with prepared_agent_executors() as agent_executors:
+        assert asyncio.run(execute()) == "done"
+    # The coroutine ran on the event loop, not on a thread of its own.
+    assert len(threads) == 2 and threads[0] == threads[1]
+    assert "results for SF" in agent_executors[0].scratchpad.text
+
+
+def test_agent_stops_tools_that_time_out():
+    import asyncio
+
+    from langchain_core.language_models.fake import FakeListLLM
+
+    release = threading.Event()
+
+    @tool
+    def scrape(url: str) -> str:
+        """Scrape the content of the url."""
+        release.wait()
+        return "content"
+
+    def timeout_agent():
+        return Agent(
+            role="test role",
+            goal="test goal",
+            backstory="test backstory",
+            allow_delegation=False,
+            tool_timeout=60,
+            tool_timeouts={"scrape": 0.1},
+            llm=FakeListLLM(
+                responses=[
+                    'Thought: I should scrape\nAction: scrape\nAction Input: {"url": "a"}',
+                    "Thought: I now know the final answer\nFinal Answer: done",
+                ]
+            ),
+        )
+
+    task = Task(description="Scrape a.", expected_output="done")
+    timeout = (
+        timeout_agent().i18n.errors("tool_timeout").format(tool="scrape", timeout=0.1)
+    )
+    try:
+        with prepared_agent_executors() as agent_executors:
+            agent = timeout_agent()
+            assert agent.execute_task(task, tools=[scrape]) == "done"
+
+            agent = timeout_agent()
+            assert asyncio.run(agent.execute_task_async(task, tools=[scrape])) == "done"
+        assert all(
+            timeout in agent_executor.scratchpad.text
+            for agent_executor in agent_executors
+        )
+        assert len(agent_executors) == 2
+    finally:
+        release.set()
+    assert task.tools_timeouts == 2
+
+
+
+def test_cache_handler_is_unbounded_by_default():
+    cache_handler = CacheHandler()
+    for i in range(2000):
+        cache_handler.add(tool="multiplier", input={"a": i}, output=i)
+
+    assert cache_handler.read(tool="multiplier", input={"a": 0}) == 0
+    assert cache_handler.evictions == 0
+
+def test_cache_handler_uses_canonical_keys_and_evicts_entries():
+    cache_handler = CacheHandler(max_entries=2, tool_ttls={"clock": 0}, error_ttl=60)
+
+    cache_handler.add(tool="multiplier", input={"a": 1, "b": 2}, output=0)
+    assert cache_handler.read(tool="multiplier", input="{'b': 2, 'a': 1}") == 0
+    assert cache_handler.read(tool="multiplier", input='{"a": 1,  "b": 2}') == 0
+
+    cache_handler.add(tool="clock", input={}, output="12:00")
+    assert cache_handler.read(tool="clock", input={}) is None
+
+    cache_handler.add_error(tool="divider", input={"a": 1, "b": 0}, error="Error")
+    cache_handler.add(tool="adder", input={"a": 1, "b": 2}, output=3)
+    assert cache_handler.read(tool="multiplier", input={"a": 1, "b": 2}) is None
+    assert cache_handler.read(tool="divider", input={"a": 1, "b": 0}) == "Error"
+
+    assert cache_handler.get_summary() == {
+        "cache_hits": 3,
+        "cache_misses": 2,
+        "cache_evictions": 1,
+    }
@@ -66,3 +66,50 @@ def test_ask_question_to_wrong_agent():
         result
         == "\nError executing tool. Co-worker mentioned not found, it must to be one of the following options:\n- researcher\n"
     )
+
+
+def test_delegate_work_to_coworkers_concurrently():
+    import threading
+    from unittest.mock import patch
+
+    writer = Agent(
+        role="writer",
+        goal="write the best articles about AI and AI agents",
+        backstory="You're a senior writer, specialized in technology",
+        allow_delegation=False,
+    )
+    concurrent_tools = AgentTools(
+        agents=[researcher, writer], concurrent_delegation=True
+    )
+    barrier = threading.Barrier(2, timeout=5)
+
+    def execute_task(task, context=None, tools=None):
+        barrier.wait()
+        return f"Done: {task.description}"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        result = concurrent_tools.delegate_work_to_coworkers(
+            delegations=[
+                {
+                    "coworker": "researcher",
+                    "task": "research AI Agents",
+                    "context": "for an article",
+                },
+                {
+                    "coworker": "writer",
+                    "task": "write an intro about AI Agents",
+                    "context": "for an article",
+                },
+            ]
+        )
+
+    assert result == (
+        'researcher answer to "research AI Agents":\nDone: research AI Agents'
+        "\n\n"
+        'writer answer to "write an intro about AI Agents":\nDone: write an intro about AI Agents'
+    )
+    assert [tool.name for tool in concurrent_tools.tools()] == [
+        "Delegate work to co-worker",
+        "Ask question to co-worker",
+        "Delegate work to multiple co-workers",
+    ]
@@ -349,11 +349,11 @@ def test_api_calls_throttling(capsys):
 
     crew = Crew(agents=[agent], tasks=[task], max_rpm=2, verbose=2)
 
-    with patch.object(RPMController, "_wait_for_next_minute") as moveon:
+    with patch.object(RPMController, "_wait") as moveon:
         moveon.return_value = True
         crew.kickoff()
         captured = capsys.readouterr()
-        assert "Max RPM reached, waiting for next minute to start." in captured.out
+        assert "Max RPM reached" in captured.out
         moveon.assert_called()
 
 
@@ -409,10 +409,9 @@ def test_agents_rpm_is_never_set_if_crew_max_RPM_is_not_set():
 
 def test_async_task_execution():
     import threading
+    from concurrent.futures import ThreadPoolExecutor
     from unittest.mock import patch
 
-    from crewai.tasks.task_output import TaskOutput
-
     list_ideas = Task(
         description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
         expected_output="Bullet point list of 5 important events.",
@@ -438,21 +437,85 @@ def test_async_task_execution():
         tasks=[list_ideas, list_important_history, write_article],
     )
 
-    with patch.object(Agent, "execute_task") as execute:
-        execute.return_value = "ok"
-        with patch.object(threading.Thread, "start") as start:
-            thread = threading.Thread(target=lambda: None, args=()).start()
-            start.return_value = thread
-            with patch.object(threading.Thread, "join", wraps=thread.join()) as join:
-                list_ideas.output = TaskOutput(
-                    description="A 4 paragraph article about AI.", raw_output="ok"
-                )
-                list_important_history.output = TaskOutput(
-                    description="A 4 paragraph article about AI.", raw_output="ok"
-                )
-                crew.kickoff()
-                start.assert_called()
-                join.assert_called()
+    with patch.object(Agent, "execute_task", return_value="ok") as execute:
+        with patch.object(
+            ThreadPoolExecutor,
+            "submit",
+            autospec=True,
+            side_effect=ThreadPoolExecutor.submit,
+        ) as submit:
+            crew.kickoff()
+            assert submit.call_count == 2
+
+    assert list_ideas.future.done()
+    assert list_important_history.future.done()
+    assert not any(
+        thread.name.startswith("crewai-task") for thread in threading.enumerate()
+    )
+    execute.assert_called_with(task=write_article, context="ok\nok", tools=[])
+
+
+def test_async_task_errors_are_raised_by_kickoff():
+    from unittest.mock import patch
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+        async_execution=True,
+    )
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+    )
+    crew = Crew(agents=[researcher, writer], tasks=[list_ideas, write_article])
+
+    def execute_task(task, context=None, tools=None):
+        if task == list_ideas:
+            raise Exception("Connection error")
+        return "ok"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        with pytest.raises(Exception, match="Connection error"):
+            crew.kickoff()
+
+
+def test_async_tasks_respect_max_concurrency():
+    import threading
+    import time
+    from unittest.mock import patch
+
+    tasks = [
+        Task(
+            description=f"Give me a list of {number} interesting ideas to explore for na article.",
+            expected_output="Bullet point list of ideas.",
+            agent=researcher,
+            async_execution=True,
+        )
+        for number in range(4)
+    ]
+    crew = Crew(agents=[researcher], tasks=tasks, max_concurrency=2)
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def execute_task(task, context=None, tools=None):
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return "ok"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        crew.kickoff()
+
+    assert max_running == 2
+    assert all(task.output.raw_output == "ok" for task in tasks)
 
 
 def test_set_agents_step_callback():
@@ -652,6 +715,10 @@ def test_agent_usage_metrics_are_captured_for_sequential_process():
         "prompt_tokens": 160,
         "successful_requests": 1,
         "total_tokens": 177,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "cache_evictions": 0,
+        "tool_timeouts": 0,
     }
 
 
@@ -682,6 +749,10 @@ def test_agent_usage_metrics_are_captured_for_hierarchical_process():
         "prompt_tokens": 1367,
         "completion_tokens": 283,
         "successful_requests": 3,
+        "cache_hits": 0,
+        "cache_misses": 0,
+        "cache_evictions": 0,
+        "tool_timeouts": 0,
     }
 
 
@@ -757,7 +828,7 @@ def test_task_callback_on_crew():
         agents=[researcher_agent],
         process=Process.sequential,
         tasks=[list_ideas],
-        task_callback=lambda: None,
+        task_callback=lambda output: None,
     )
 
     with patch.object(Agent, "execute_task") as execute:
@@ -991,3 +1062,761 @@ def test_manager_agent_with_tools_raises_exception():
 
     with pytest.raises(Exception):
         crew.kickoff()
+
+
+@pytest.mark.parametrize("concurrent_delegation", [False, True])
+def test_manager_delegates_to_several_coworkers_only_when_enabled(
+    concurrent_delegation,
+):
+    crew = Crew(
+        agents=[researcher, writer],
+        process=Process.hierarchical,
+        manager_llm=researcher.llm,
+        tasks=[Task(description="Say hi", expected_output="Hi")],
+        concurrent_delegation=concurrent_delegation,
+    )
+
+    tool_names = [tool.name for tool in crew._manager_tools()]
+    assert (
+        "Delegate work to multiple co-workers" in tool_names
+    ) == concurrent_delegation
+
+
+def test_graph_process_runs_independent_tasks_concurrently():
+    import threading
+    from unittest.mock import patch
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    list_important_history = Task(
+        description="Research the history of AI and give me the 5 most important events that shaped the technology.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+        context=[list_ideas, list_important_history],
+    )
+
+    crew = Crew(
+        agents=[researcher, writer],
+        process=Process.graph,
+        tasks=[list_ideas, list_important_history, write_article],
+    )
+
+    barrier = threading.Barrier(2, timeout=5)
+    contexts = {}
+
+    def execute_task(task, context=None, tools=None):
+        if task is not write_article:
+            barrier.wait()
+        contexts[task.description] = context
+        return f"output of {task.description}"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        result = crew.kickoff()
+
+    assert result == f"output of {write_article.description}"
+    assert contexts[list_ideas.description] is None
+    assert contexts[write_article.description] == "\n".join(
+        [
+            f"output of {list_ideas.description}",
+            f"output of {list_important_history.description}",
+        ]
+    )
+
+
+def test_graph_process_returns_the_output_of_the_tasks_nothing_depends_on():
+    from unittest.mock import patch
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+        context=[list_ideas],
+    )
+    list_important_history = Task(
+        description="Research the history of AI and give me the 5 most important events that shaped the technology.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+
+    def execute_task(task, context=None, tools=None):
+        return f"output of {task.description}"
+
+    crew = Crew(
+        agents=[researcher, writer],
+        process=Process.graph,
+        tasks=[list_ideas, write_article, list_important_history],
+    )
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        assert crew.kickoff() == "\n".join(
+            [
+                f"output of {write_article.description}",
+                f"output of {list_important_history.description}",
+            ]
+        )
+
+    write_article.context = [list_ideas, list_important_history]
+    crew = Crew(
+        agents=[researcher, writer],
+        process=Process.graph,
+        tasks=[list_ideas, write_article, list_important_history],
+    )
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        assert crew.kickoff() == f"output of {write_article.description}"
+
+
+def test_graph_process_respects_max_concurrency():
+    import threading
+    import time
+    from unittest.mock import patch
+
+    tasks = [
+        Task(
+            description=f"Research topic number {i}.",
+            expected_output="Bullet point list of 5 important events.",
+            agent=researcher,
+        )
+        for i in range(4)
+    ]
+
+    crew = Crew(
+        agents=[researcher],
+        process=Process.graph,
+        tasks=tasks,
+        max_concurrency=2,
+    )
+
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def execute_task(task, context=None, tools=None):
+        with lock:
+            running.append(task)
+            peak.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.remove(task)
+        return "ok"
+
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        crew.kickoff()
+
+    assert max(peak) == 2
+
+
+def test_graph_process_with_cyclic_context_raises_exception():
+    task1 = Task(
+        description="Research the history of AI.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    task2 = Task(
+        description="Write an article about the history of AI.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+        context=[task1],
+    )
+    task1.context = [task2]
+
+    with pytest.raises(pydantic_core._pydantic_core.ValidationError):
+        Crew(agents=[researcher, writer], process=Process.graph, tasks=[task1, task2])
+
+
+def test_kickoff_async_runs_tasks_sequentially():
+    import asyncio
+    from unittest.mock import AsyncMock, patch
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+    )
+
+    crew = Crew(
+        agents=[researcher, writer],
+        process=Process.sequential,
+        tasks=[list_ideas, write_article],
+    )
+
+    with patch.object(
+        Agent, "execute_task_async", new_callable=AsyncMock
+    ) as execute_async:
+        execute_async.side_effect = ["ideas", "article"]
+        with patch.object(Agent, "execute_task") as execute:
+            result = asyncio.run(crew.kickoff_async())
+            execute.assert_not_called()
+
+    assert result == "article"
+    assert execute_async.call_args_list[1].kwargs["context"] == "ideas"
+    assert crew.usage_metrics is not None
+
+
+def test_kickoff_async_waits_for_async_tasks_in_context():
+    import asyncio
+    from unittest.mock import patch
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+        async_execution=True,
+    )
+    list_important_history = Task(
+        description="Research the history of AI and give me the 5 most important events that shaped the technology.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+        async_execution=True,
+    )
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+        context=[list_ideas, list_important_history],
+    )
+
+    crew = Crew(
+        agents=[researcher, writer],
+        process=Process.sequential,
+        tasks=[list_ideas, list_important_history, write_article],
+    )
+
+    async def execute_task_async(task, context=None, tools=None):
+        await asyncio.sleep(0.01)
+        return context or "research"
+
+    with patch.object(Agent, "execute_task_async", side_effect=execute_task_async):
+        result = asyncio.run(crew.kickoff_async())
+
+    assert result == "research\nresearch"
+
+
+def test_async_task_errors_are_raised_by_kickoff_async():
+    import asyncio
+    from unittest.mock import patch
+
+    list_ideas = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article, what makes them unique and interesting.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    write_article = Task(
+        description="Write an article about the history of AI and its most important events.",
+        expected_output="A 4 paragraph article about AI.",
+        agent=writer,
+        async_execution=True,
+    )
+    crew = Crew(agents=[researcher, writer], tasks=[list_ideas, write_article])
+
+    async def execute_task_async(task, context=None, tools=None):
+        if task == write_article:
+            raise RuntimeError("Connection error")
+        return "ideas"
+
+    with patch.object(Agent, "execute_task_async", side_effect=execute_task_async):
+        with pytest.raises(RuntimeError, match="Connection error"):
+            asyncio.run(crew.kickoff_async())
+
+    assert list_ideas.output.raw_output == "ideas"
+    assert write_article.output is None
+
+
+def test_crew_copy_shares_resources_but_not_execution_state():
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+        allow_delegation=False,
+    )
+    research = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="{points} bullet points about {topic}.",
+        agent=agent,
+    )
+    summary = Task(
+        description="Summarize the analysis around {topic}.",
+        expected_output="A paragraph about {topic}.",
+        agent=agent,
+        context=[research],
+    )
+
+    crew = Crew(agents=[agent], tasks=[research, summary], max_rpm=10)
+    copied_crew = crew.copy()
+
+    assert copied_crew.id != crew.id
+    assert copied_crew.agents[0] is not agent
+    assert copied_crew.agents[0].llm.client is agent.llm.client
+    assert copied_crew.agents[0]._token_process is not agent._token_process
+    assert (
+        copied_crew.agents[0].llm.callbacks[0].token_cost_process
+        is copied_crew.agents[0]._token_process
+    )
+    assert copied_crew.tasks[0].agent is copied_crew.agents[0]
+    assert copied_crew.tasks[1].context == [copied_crew.tasks[0]]
+    assert copied_crew.tasks[1].context[0] is copied_crew.tasks[0]
+    assert copied_crew._cache_handler is crew._cache_handler
+    assert copied_crew.agents[0].cache_handler is crew._cache_handler
+    assert copied_crew._rpm_controller is crew._rpm_controller
+    assert copied_crew.agents[0]._rpm_controller is crew._rpm_controller
+
+
+def test_crew_copy_skips_validation():
+    from unittest.mock import patch
+
+    from crewai.telemetry import Telemetry
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    crew = Crew(agents=[researcher, writer], tasks=[task])
+
+    with patch.object(
+        Agent, "create_agent_executor"
+    ) as create_agent_executor, patch.object(
+        Telemetry, "crew_creation"
+    ) as crew_creation:
+        copied_crew = crew.copy()
+
+    create_agent_executor.assert_not_called()
+    crew_creation.assert_not_called()
+    assert copied_crew._telemetry is crew._telemetry
+    assert copied_crew.tasks[0].agent is copied_crew.agents[0]
+    assert copied_crew.agents[0].agent_executor is None
+    assert copied_crew.agents[0].tools_handler is not researcher.tools_handler
+    assert copied_crew.agents[0].tools_handler.cache is crew._cache_handler
+
+
+def test_kickoff_for_each():
+    import threading
+    from unittest.mock import patch
+
+    agent = Agent(
+        role="{topic} Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+        allow_delegation=False,
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="{points} bullet points about {topic}.",
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+
+    barrier = threading.Barrier(2, timeout=5)
+    copied_crews = []
+
+    def execute_task(task, context=None, tools=None):
+        barrier.wait()
+        copied_crews.append(task.agent.crew)
+        task.agent.llm.callbacks[0].on_llm_end(None)
+        return task.description
+
+    inputs = [{"topic": topic, "points": 3} for topic in ["AI", "Crypto"]]
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        results = list(crew.kickoff_for_each(inputs=inputs, max_concurrency=2))
+
+    assert results == [
+        "Give me an analysis around AI.",
+        "Give me an analysis around Crypto.",
+    ]
+    assert task.description == "Give me an analysis around {topic}."
+    assert task.output is None
+    assert [
+        copied_crew.usage_metrics["successful_requests"] for copied_crew in copied_crews
+    ] == [1, 1]
+    assert agent._token_process.successful_requests == 0
+    assert crew.usage_metrics["successful_requests"] == 2
+
+
+def test_kickoff_for_each_yields_results_as_they_complete():
+    import time
+    from unittest.mock import patch
+
+    agent = Agent(
+        role="Researcher",
+        goal="Express hot takes on {topic}.",
+        backstory="You have a lot of experience with {topic}.",
+        allow_delegation=False,
+    )
+    task = Task(
+        description="Give me an analysis around {topic}.",
+        expected_output="Bullet points about {topic}.",
+        agent=agent,
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+
+    def execute_task(task, context=None, tools=None):
+        if "slow" in task.description:
+            time.sleep(0.2)
+        return task.description
+
+    inputs = [{"topic": "slow"}, {"topic": "fast"}]
+    with patch.object(Agent, "execute_task", side_effect=execute_task):
+        results = list(
+            crew.kickoff_for_each(inputs=inputs, max_concurrency=2, ordered=False)
+        )
+
+    assert results == [
+        (1, "Give me an analysis around fast."),
+        (0, "Give me an analysis around slow."),
+    ]
+
+
+def test_kickoff_resumes_from_checkpoint(tmp_path):
+    from unittest.mock import patch
+
+    from crewai.utilities.checkpoint_storage import CheckpointSQLiteStorage
+
+    def build_crew():
+        agent = Agent(
+            role="{topic} Researcher",
+            goal="Express hot takes on {topic}.",
+            backstory="You have a lot of experience with {topic}.",
+            allow_delegation=False,
+        )
+        research = Task(
+            description="Give me an analysis around {topic}.",
+            expected_output="Bullet points about {topic}.",
+            agent=agent,
+        )
+        summary = Task(
+            description="Summarize the analysis around {topic}.",
+            expected_output="A paragraph about {topic}.",
+            agent=agent,
+        )
+        crew = Crew(agents=[agent], tasks=[research, summary], checkpoint=True)
+        crew._checkpoint_storage = CheckpointSQLiteStorage(
+            db_path=str(tmp_path / "checkpoints.db")
+        )
+        return crew
+
+    def failing_execute_task(task, context=None, tools=None):
+        if task.description.startswith("Summarize"):
+            raise Exception("Connection error")
+        return "AI is overrated."
+
+    crew = build_crew()
+    with patch.object(Agent, "execute_task", side_effect=failing_execute_task):
+        with pytest.raises(Exception, match="Connection error"):
+            crew.kickoff(inputs={"topic": "AI"})
+
+    crew = build_crew()
+    with patch.object(
+        Agent, "execute_task", return_value="AI is overrated, in short."
+    ) as execute_task:
+        result = crew.kickoff(inputs={"topic": "AI"}, resume=True)
+
+    assert result == "AI is overrated, in short."
+    execute_task.assert_called_once_with(
+        task=crew.tasks[1], context="AI is overrated.", tools=[]
+    )
+    assert crew.tasks[0].output.raw_output == "AI is overrated."
+    assert crew._checkpoint_storage.load(*crew._checkpoint_key) == {}
+
+
+@pytest.mark.parametrize("process", [Process.sequential, Process.hierarchical])
+def test_kickoff_resume_skips_the_output_of_async_tasks(tmp_path, process):
+    from unittest.mock import patch
+
+    from langchain_openai import ChatOpenAI
+
+    from crewai.utilities.checkpoint_storage import CheckpointSQLiteStorage
+
+    def build_crew():
+        research = Task(
+            description="Give me an analysis around AI.",
+            expected_output="Bullet points about AI.",
+            agent=researcher,
+        )
+        notes = Task(
+            description="Take notes about AI.",
+            expected_output="Notes about AI.",
+            agent=researcher,
+            async_execution=True,
+        )
+        summary = Task(
+            description="Summarize the analysis around AI.",
+            expected_output="A paragraph about AI.",
+            agent=writer,
+        )
+        crew = Crew(
+            agents=[researcher, writer],
+            tasks=[research, notes, summary],
+            process=process,
+            manager_llm=ChatOpenAI(model="gpt-4"),
+            checkpoint=True,
+        )
+        crew._checkpoint_storage = CheckpointSQLiteStorage(
+            db_path=str(tmp_path / "checkpoints.db")
+        )
+        return crew
+
+    def failing_execute_task(task, context=None, tools=None):
+        if task.description.startswith("Summarize"):
+            crew.tasks[1].future.result()
+            raise Exception("Connection error")
+        return f"output of {task.description}"
+
+    crew = build_crew()
+    with patch.object(Agent, "execute_task", side_effect=failing_execute_task):
+        with pytest.raises(Exception, match="Connection error"):
+            crew.kickoff()
+
+    crew = build_crew()
+    with patch.object(Agent, "execute_task", return_value="summary") as execute_task:
+        assert crew.kickoff(resume=True) == "summary"
+
+    assert execute_task.call_args.kwargs["context"] == (
+        "output of Give me an analysis around AI."
+    )
+    assert crew.tasks[1].output.raw_output == "output of Take notes about AI."
+
+
+def test_kickoff_stream_yields_execution_events():
+    from langchain.tools import tool
+    from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+    from langchain_core.messages import AIMessage
+
+    from crewai.utilities import CrewEventType
+
+    @tool
+    def multiplier(first_number: int, second_number: int) -> float:
+        """Useful for when you need to multiply two numbers together."""
+        return first_number * second_number
+
+    responses = [
+        'Thought: I need to multiply\nAction: multiplier\nAction Input: {"first_number": 3, "second_number": 4}',
+        "Thought: I now know the final answer\nFinal Answer: 12",
+    ]
+    agent = Agent(
+        role="Math Professor",
+        goal="Solve math problems.",
+        backstory="You love numbers.",
+        allow_delegation=False,
+        llm=GenericFakeChatModel(
+            messages=iter([AIMessage(content=response) for response in responses])
+        ),
+    )
+    task = Task(
+        description="What is 3 times 4?",
+        expected_output="The result of the multiplication.",
+        agent=agent,
+        tools=[multiplier],
+    )
+    crew = Crew(agents=[agent], tasks=[task])
+
+    events = list(crew.kickoff_stream())
+
+    event_types = [
+        event.type
+        for index, event in enumerate(events)
+        if index == 0 or event.type != events[index - 1].type
+    ]
+    assert event_types == [
+        CrewEventType.task_started,
+        CrewEventType.token,
+        CrewEventType.agent_action,
+        CrewEventType.tool_observation,
+        CrewEventType.token,
+        CrewEventType.task_finished,
+        CrewEventType.crew_finished,
+    ]
+    tokens = [event.data for event in events if event.type == CrewEventType.token]
+    assert "".join(tokens) == "".join(responses)
+    assert events[-2].data.raw_output == "12"
+    assert events[-1].data == "12"
+    assert all(event.agent == "Math Professor" for event in events[:-1])
+    assert crew._event_sink is None
+
+
+def test_kickoff_stream_async_yields_task_events():
+    import asyncio
+    from unittest.mock import patch
+
+    from crewai.utilities import CrewEventType
+
+    task = Task(
+        description="Give me a list of 5 interesting ideas to explore for na article.",
+        expected_output="Bullet point list of 5 important events.",
+        agent=researcher,
+    )
+    crew = Crew(agents=[researcher], tasks=[task])
+
+    async def collect_events():
+        return [event async for event in crew.kickoff_stream_async()]
+
+    with patch.object(Agent, "execute_task_async", return_value="Ideas"):
+        events = asyncio.run(collect_events())
+
+    assert [event.type for event in events] == [
+        CrewEventType.task_started,
+        CrewEventType.task_finished,
+        CrewEventType.crew_finished,
+    ]
+    assert events[-1].data == "Ideas"
+
+
+def test_semantic_cache_reuses_results_of_similar_tasks():
+    from unittest.mock import patch
+
+    from langchain_core.language_models.fake import FakeListLLM
+
+    from crewai.memory.storage.rag_storage import RAGStorage
+    from crewai.utilities.semantic_cache import SemanticCache
+
+    agent = Agent(
+        role="test role",
+        goal="test goal",
+        backstory="test backstory",
+        allow_delegation=False,
+        llm=FakeListLLM(
+            responses=["Thought: I now know the final answer\nFinal Answer: fresh"]
+        ),
+    )
+    task = Task(description="Say hi.", expected_output="hi", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], semantic_cache=True)
+
+    def cached(score):
+        return [
+            {"context": "Say hello.", "metadata": {"score": score, "result": "cached"}}
+        ]
+
+    with patch.object(RAGStorage, "search", return_value=cached(0.5)), patch.object(
+        SemanticCache, "save"
+    ) as save:
+        assert crew.kickoff() == "fresh"
+    save.assert_called_once_with(task.prompt(), "test role", "FakeListLLM", "fresh")
+
+    with patch.object(RAGStorage, "search", return_value=cached(0.02)):
+        assert crew.kickoff() == "cached"
+    assert (crew._semantic_cache.hits, crew._semantic_cache.misses) == (1, 1)
+
+
+def test_semantic_cache_replaces_the_result_of_the_same_prompt():
+    from unittest.mock import patch
+
+    from crewai.memory.storage.rag_storage import RAGStorage
+    from crewai.utilities.semantic_cache import SemanticCache
+
+    cache = SemanticCache()
+    with patch.object(RAGStorage, "_upsert") as upsert:
+        cache.save("Say hi.", "test role", "gpt-4", "hi")
+        cache.save("Say hi.", "test role", "gpt-4", "hello")
+        cache.save("Say hi.", "other role", "gpt-4", "hi")
+
+    keys = [call.args[0] for call in upsert.call_args_list]
+    assert keys[0] == keys[1] != keys[2]
+    assert upsert.call_args_list[1].args[1:] == (
+        "Say hi.",
+        {"role": "test role", "model": "gpt-4", "result": "hello"},
+    )
+
+
+def _acquire_rate_limit(db_path, model):
+    from crewai.utilities.rpm_controller import SQLiteRPMController
+
+    SQLiteRPMController(max_rpm=2, db_path=db_path).acquire(model)
+
+
+def _use_tool_cache(db_path, results):
+    from crewai.agents.cache import SQLiteCacheHandler
+
+    handler = SQLiteCacheHandler(db_path=db_path, max_entries=2)
+    multiplier = handler.read(tool="multiplier", input="{'b': 0, 'a': 2}")
+    handler.add(tool="adder", input={"a": 2, "b": 0}, output=2)
+    handler.add(tool="subtractor", input={"a": 2, "b": 0}, output=2)
+    results.put((multiplier, handler.get_summary()))
+
+
+def _run_in_process(target, *args):
+    import multiprocessing
+
+    process = multiprocessing.get_context("spawn").Process(target=target, args=args)
+    process.start()
+    process.join(timeout=60)
+    assert process.exitcode == 0
+
+
+def test_shared_rate_limits_are_shared_between_processes(tmp_path, monkeypatch):
+    from unittest.mock import patch
+
+    from crewai.utilities import rpm_controller
+    from crewai.utilities.rpm_controller import SQLiteRPMController
+
+    monkeypatch.setattr(rpm_controller, "db_storage_path", lambda: tmp_path)
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(description="Say hi.", expected_output="hi", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], max_rpm=2, share_rate_limits=True)
+    assert isinstance(crew._rpm_controller, SQLiteRPMController)
+    assert agent._rpm_controller is crew._rpm_controller
+    assert crew._rpm_controller.db_path == f"{tmp_path}/rate_limits.db"
+
+    with patch.object(SQLiteRPMController, "_wait") as wait:
+        crew._rpm_controller.acquire("gpt-4")
+        _run_in_process(_acquire_rate_limit, crew._rpm_controller.db_path, "gpt-4")
+        wait.assert_not_called()
+        crew._rpm_controller.acquire("gpt-4")
+        wait.assert_called_once()
+        # The window started with the first request, before the other process started.
+        assert 0 < wait.call_args.args[0] <= 30
+
+
+def test_shared_rate_limits_fall_back_to_the_process_limits(tmp_path):
+    import sqlite3
+    from unittest.mock import patch
+
+    from crewai.utilities.rpm_controller import SQLiteRPMController
+
+    controller = SQLiteRPMController(max_rpm=1, db_path=str(tmp_path / "rate.db"))
+    with patch("sqlite3.connect", side_effect=sqlite3.OperationalError("locked")):
+        with patch.object(SQLiteRPMController, "_wait") as wait:
+            controller.acquire("gpt-4")
+            wait.assert_not_called()
+            controller.acquire("gpt-4")
+            wait.assert_called_once()
+
+
+def test_persistent_cache_is_shared_between_processes(tmp_path, monkeypatch):
+    import multiprocessing
+
+    from crewai.agents.cache import SQLiteCacheHandler, sqlite_cache_handler
+
+    monkeypatch.setattr(sqlite_cache_handler, "db_storage_path", lambda: tmp_path)
+    agent = Agent(role="test role", goal="test goal", backstory="test backstory")
+    task = Task(description="Say hi.", expected_output="hi", agent=agent)
+    crew = Crew(agents=[agent], tasks=[task], persistent_cache=True)
+    handler = crew._cache_handler
+    assert isinstance(handler, SQLiteCacheHandler)
+    assert agent.cache_handler is handler
+    assert handler.db_path == f"{tmp_path}/tool_cache.db"
+
+    handler.add(tool="multiplier", input={"a": 2, "b": 0}, output=0)
+    results = multiprocessing.get_context("spawn").Queue()
+    _run_in_process(_use_tool_cache, handler.db_path, results)
+
+    assert results.get(timeout=5) == (
+        0,
+        {"cache_hits": 1, "cache_misses": 0, "cache_evictions": 1},
+    )
+    assert handler.read(tool="adder", input={"b": 0, "a": 2}) == 2
+    assert handler.read(tool="multiplier", input={"a": 2, "b": 0}) is None
@@ -7,6 +7,17 @@ from pydantic import BaseModel
 from pydantic_core import ValidationError
 
 from crewai import Agent, Crew, Process, Task
+from crewai.agents.executor import CrewAgentExecutor
+
+
+@pytest.fixture
+def unvalidated_final_answers():
+    """Skip the validation of final answers by the agent, the cassettes of the
+    structured output tests hold prose answers converted by the Converter."""
+    with patch.object(
+        CrewAgentExecutor, "_invalid_output_observation", return_value=None
+    ):
+        yield
 
 
 def test_task_tool_reflect_agent_tools():
@@ -139,7 +150,7 @@ def test_async_execution():
     )
 
     with patch.object(Agent, "execute_task", return_value="ok") as execute:
-        task.execute(agent=researcher)
+        assert task.execute(agent=researcher).result() == "ok"
         execute.assert_called_once_with(task=task, context=None, tools=[])
 
 
@@ -157,6 +168,7 @@ def test_multiple_output_type_error():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
+@pytest.mark.usefixtures("unvalidated_final_answers")
 def test_output_pydantic():
     class ScoreOutput(BaseModel):
         score: int
@@ -181,6 +193,7 @@ def test_output_pydantic():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
+@pytest.mark.usefixtures("unvalidated_final_answers")
 def test_output_json():
     class ScoreOutput(BaseModel):
         score: int
@@ -205,6 +218,7 @@ def test_output_json():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
+@pytest.mark.usefixtures("unvalidated_final_answers")
 def test_output_pydantic_to_another_task():
     from langchain_openai import ChatOpenAI
 
@@ -241,6 +255,7 @@ def test_output_pydantic_to_another_task():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
+@pytest.mark.usefixtures("unvalidated_final_answers")
 def test_output_json_to_another_task():
     class ScoreOutput(BaseModel):
         score: int
@@ -296,6 +311,7 @@ def test_save_task_output():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
+@pytest.mark.usefixtures("unvalidated_final_answers")
 def test_save_task_json_output():
     class ScoreOutput(BaseModel):
         score: int
@@ -324,6 +340,7 @@ def test_save_task_json_output():
 
 
 @pytest.mark.vcr(filter_headers=["authorization"])
+@pytest.mark.usefixtures("unvalidated_final_answers")
 def test_save_task_pydantic_output():
     class ScoreOutput(BaseModel):
         score: int
@@ -483,3 +500,68 @@ def test_interpolate_inputs():
         == "Give me a list of 5 interesting ideas about ML to explore for an article, what makes them unique and interesting."
     )
     assert task.expected_output == "Bullet point list of 5 interesting ideas about ML."
+
+
+def test_structured_output_is_validated_by_the_agent():
+    from langchain_core.language_models.fake import FakeListLLM
+
+    from crewai.utilities import Converter
+
+    class ScoreOutput(BaseModel):
+        score: int
+
+    scorer = Agent(
+        role="Scorer",
+        goal="Score the title",
+        backstory="You're an expert scorer, specialized in scoring titles.",
+        allow_delegation=False,
+        llm=FakeListLLM(
+            responses=[
+                "Thought: I now know the final answer\nFinal Answer: The score is 4.",
+                'Thought: I now know the final answer\nFinal Answer: {"score": 4}',
+            ]
+        ),
+    )
+    task = Task(
+        description="Give me an integer score between 1-5 for the following title: 'The impact of AI in the future of work'",
+        expected_output="The score of the title.",
+        output_pydantic=ScoreOutput,
+        agent=scorer,
+    )
+    assert "- score: int" in task.prompt()
+
+    with patch.object(Converter, "to_pydantic") as to_pydantic:
+        result = task.execute()
+
+    assert result == ScoreOutput(score=4)
+    to_pydantic.assert_not_called()
+
+
+def test_structured_output_validated_by_the_agent_is_saved():
+    from langchain_core.language_models.fake import FakeListLLM
+
+    class ScoreOutput(BaseModel):
+        score: int
+
+    scorer = Agent(
+        role="Scorer",
+        goal="Score the title",
+        backstory="You're an expert scorer, specialized in scoring titles.",
+        allow_delegation=False,
+        llm=FakeListLLM(
+            responses=[
+                'Thought: I now know the final answer\nFinal Answer: {"score": 4}'
+            ]
+        ),
+    )
+    task = Task(
+        description="Give me an integer score between 1-5 for the following title: 'The impact of AI in the future of work'",
+        expected_output="The score of the title.",
+        output_file="score.json",
+        output_json=ScoreOutput,
+        agent=scorer,
+    )
+
+    with patch.object(Task, "_save_file") as save_file:
+        assert task.execute() == {"score": 4}
+    save_file.assert_called_once_with('{\n  "score": 4\n}')
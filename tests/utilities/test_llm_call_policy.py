@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from crewai.utilities.llm_call_policy import LLMCallPolicy, LLMCallTimeoutError
+
+
+class RateLimitError(Exception):
+    status_code = 429
+
+
+def test_retries_rate_limits_with_backoff():
+    policy = LLMCallPolicy(max_retries=2)
+    calls = []
+
+    def call():
+        calls.append(1)
+        if len(calls) < 3:
+            raise RateLimitError()
+        return "ok"
+
+    with patch.object(LLMCallPolicy, "_wait") as wait:
+        assert policy.call(call) == "ok"
+    assert len(calls) == 3
+    assert wait.call_count == 2
+    assert all(0 <= seconds <= 2 for (seconds,), _ in wait.call_args_list)
+
+
+def test_does_not_retry_other_errors():
+    policy = LLMCallPolicy(max_retries=2)
+    calls = []
+
+    def call():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        policy.call(call)
+    assert len(calls) == 1
+
+
+def test_gives_up_on_calls_past_their_deadline():
+    policy = LLMCallPolicy(timeout=0.05, max_retries=0)
+    release = threading.Event()
+
+    start = time.monotonic()
+    with pytest.raises(LLMCallTimeoutError):
+        policy.call(release.wait, 5)
+    assert time.monotonic() - start < 1
+    release.set()
+
+
+def test_hedges_slow_calls():
+    policy = LLMCallPolicy(hedge=True, hedge_after=0.05)
+    release = threading.Event()
+    calls = []
+
+    def call():
+        calls.append(1)
+        if len(calls) == 1:
+            release.wait(5)
+            return "slow"
+        return "fast"
+
+    assert policy.call(call) == "fast"
+    assert len(calls) == 2
+    release.set()
+
+
+def test_hedges_after_the_95th_percentile_latency():
+    policy = LLMCallPolicy(hedge=True, min_latency_samples=3)
+    assert policy._hedge_after() is None
+
+    for latency in [0.1, 0.2, 0.3]:
+        policy._record_latency(latency)
+    assert policy._hedge_after() == 0.2
+
+
+def test_hedges_slow_async_calls():
+    policy = LLMCallPolicy(hedge=True, hedge_after=0.05, timeout=1)
+    calls = []
+
+    async def call():
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(5)
+            return "slow"
+        return "fast"
+
+    assert asyncio.run(policy.acall(call)) == "fast"
+    assert len(calls) == 2
+
+
+def test_retries_and_duplicates_acquire_the_rate_limits():
+    policy = LLMCallPolicy(max_retries=1, hedge=True, hedge_after=0.05)
+    release = threading.Event()
+    calls = []
+    acquired = []
+
+    def call():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RateLimitError()
+        if len(calls) == 2:
+            release.wait(5)
+            return "slow"
+        return "fast"
+
+    with patch.object(LLMCallPolicy, "_wait"):
+        assert policy.call(call, acquire=lambda: acquired.append(1)) == "fast"
+    assert len(calls) == 3
+    # Once for the retry, once for its duplicate.
+    assert len(acquired) == 2
+    release.set()
+
+    async def acall():
+        calls.append(1)
+        if len(calls) == 4:
+            raise RateLimitError()
+        return "ok"
+
+    async def aacquire():
+        acquired.append(1)
+
+    with patch("asyncio.sleep"):
+        assert asyncio.run(policy.acall(acall, acquire=aacquire)) == "ok"
+    assert len(acquired) == 3
+
+
+def test_abandoned_calls_do_not_hold_the_process():
+    policy = LLMCallPolicy(timeout=0.05, max_retries=0)
+    release = threading.Event()
+
+    with pytest.raises(LLMCallTimeoutError):
+        policy.call(release.wait, 5)
+    threads = [t for t in threading.enumerate() if t.name == "crewai-llm-call"]
+    assert threads and all(thread.daemon for thread in threads)
+    release.set()